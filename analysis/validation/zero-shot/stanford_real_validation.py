@@ -12,7 +12,13 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy import stats
 from scipy.optimize import minimize
+import sys
 import warnings
+
+# Add repository root to path to import infodynamics
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from infodynamics.utils.profiling import enable_from_env, stage
 warnings.filterwarnings('ignore')
 
 class StanfordInfoDynamicsValidator:
@@ -32,8 +38,10 @@ class StanfordInfoDynamicsValidator:
     def load_participants(self):
         """Load participant demographics"""
         participants_file = self.data_path / "participants.tsv"
-        self.participants_df = pd.read_csv(participants_file, sep='\t')
-        self.participants = self.participants_df['participant_id'].tolist()
+        with stage('load_participants') as s:
+            self.participants_df = pd.read_csv(participants_file, sep='\t')
+            self.participants = self.participants_df['participant_id'].tolist()
+            s.items = len(self.participants)
         
         print(f"👥 Loaded {len(self.participants)} participants")
         print(f"📊 Age range: {self.participants_df['Age'].min():.0f}-{self.participants_df['Age'].max():.0f} years")
@@ -80,8 +88,10 @@ class StanfordInfoDynamicsValidator:
                                  f"{participant_id}_{session}_task-{task_name}_run-1_events.tsv")
                     
                     if events_file.exists():
-                        events_data = pd.read_csv(events_file, sep='\t')
-                        metrics = self._compute_task_metrics(events_data, task_name)
+                        with stage(f'task.{task_name}') as s:
+                            events_data = pd.read_csv(events_file, sep='\t')
+                            metrics = self._compute_task_metrics(events_data, task_name)
+                            s.items = len(events_data)
                         participant_data[task_name] = {
                             'component': task_info['component'],
                             'metrics': metrics,
@@ -253,19 +263,21 @@ class StanfordInfoDynamicsValidator:
         
         print(f"\n📊 Processing behavioral data...")
         
-        for i, participant_id in enumerate(self.participants):
-            print(f"  {i+1:3d}/{n_participants} - {participant_id}")
-            
-            # Extract behavioral metrics
-            participant_data = self.extract_behavioral_metrics(participant_id)
-            all_behavioral_data[participant_id] = participant_data
-            
-            # Compute Information Dynamics parameters
-            info_params = self.compute_information_dynamics(participant_data)
-            all_info_params[participant_id] = info_params
-            
-            if i % 20 == 19:  # Progress update every 20 participants
-                print(f"    ... processed {i+1} participants")
+        with stage('process_participants', items=n_participants):
+            for i, participant_id in enumerate(self.participants):
+                print(f"  {i+1:3d}/{n_participants} - {participant_id}")
+                
+                # Extract behavioral metrics
+                participant_data = self.extract_behavioral_metrics(participant_id)
+                all_behavioral_data[participant_id] = participant_data
+                
+                # Compute Information Dynamics parameters
+                with stage('compute_information_dynamics'):
+                    info_params = self.compute_information_dynamics(participant_data)
+                all_info_params[participant_id] = info_params
+                
+                if i % 20 == 19:  # Progress update every 20 participants
+                    print(f"    ... processed {i+1} participants")
         
         # Store results
         self.behavioral_data = all_behavioral_data
@@ -295,7 +307,8 @@ class StanfordInfoDynamicsValidator:
         
         # Test theoretical predictions
         print(f"\n🧪 Testing Theoretical Predictions:")
-        self._test_theoretical_predictions(results_df)
+        with stage('test_predictions'):
+            self._test_theoretical_predictions(results_df)
         
         # Save results
         results_df.to_csv('validation/stanford_validation_results.csv', index=False)
@@ -329,6 +342,9 @@ class StanfordInfoDynamicsValidator:
 def main():
     """Run Stanford validation"""
     
+    # INFODYNAMICS_TRACE=<file> writes per-stage timings at exit
+    enable_from_env()
+    
     # Initialize validator
     validator = StanfordInfoDynamicsValidator()
     
@@ -4,11 +4,19 @@ Simplified Stanford Information Dynamics Validation (no plotting dependencies)
 Tests our theory on real cognitive data from 103 participants
 """
 
+import os
+import sys
+
 import pandas as pd
 import numpy as np
 from pathlib import Path
 from scipy import stats
 
+# Add repository root to path to import infodynamics
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
+
+from infodynamics.utils.profiling import enable_from_env, stage
+
 class SimpleStanfordValidator:
     
     def __init__(self, data_path="data/ds004636-main"):
@@ -205,8 +213,10 @@ class SimpleStanfordValidator:
         
         # Load participants
         participants_file = self.data_path / "participants.tsv"
-        participants_df = pd.read_csv(participants_file, sep='\t')
-        participants = participants_df['participant_id'].tolist()
+        with stage('load_participants') as s:
+            participants_df = pd.read_csv(participants_file, sep='\t')
+            participants = participants_df['participant_id'].tolist()
+            s.items = len(participants)
         
         print(f"👥 Processing {len(participants)} participants...")
         
@@ -218,9 +228,12 @@ class SimpleStanfordValidator:
                 print(f"  Processing {i+1}/{len(participants)}: {participant_id}")
             
             # Extract metrics from each task
-            stroop_metrics = self.extract_stroop_metrics(participant_id)
-            stop_metrics = self.extract_stop_signal_metrics(participant_id)
-            dpx_metrics = self.extract_dpx_metrics(participant_id)
+            with stage('task.stroop'):
+                stroop_metrics = self.extract_stroop_metrics(participant_id)
+            with stage('task.stopSignal'):
+                stop_metrics = self.extract_stop_signal_metrics(participant_id)
+            with stage('task.DPX'):
+                dpx_metrics = self.extract_dpx_metrics(participant_id)
             
             # Compute Information Dynamics parameters
             info_params = self.compute_information_dynamics(stroop_metrics, stop_metrics, dpx_metrics)
@@ -296,6 +309,8 @@ class SimpleStanfordValidator:
         return results_df
 
 def main():
+    # INFODYNAMICS_TRACE=<file> writes per-stage timings at exit
+    enable_from_env()
     validator = SimpleStanfordValidator()
     results = validator.validate_on_stanford_data()
     return results
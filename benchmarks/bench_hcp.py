@@ -0,0 +1,54 @@
+"""
+HCP v2 analysis benchmarks: preprocessing, correlation diagnostics and the
+G_info formula search (five candidate formulas, two of them optimized),
+on seeded synthetic HCP cohorts of n subjects.
+"""
+
+import contextlib
+import importlib.util
+import io
+import os
+
+import matplotlib
+matplotlib.use('Agg')
+
+from infodynamics.simulation import generate_cohort
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+SCRIPT = os.path.join(REPO_ROOT, 'simulation', 'analysis', 'hcp_conductivity_analysis_v2_simulated.py')
+
+
+def _load_analyzer_class():
+    spec = importlib.util.spec_from_file_location('hcp_conductivity_analysis_v2_simulated', SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.HCPConductivityAnalyzerV2
+
+
+class HCPAnalysis:
+    params = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+    max_size = 1_000_000
+
+    def setup(self, n):
+        self.analyzer_class = _load_analyzer_class()
+        self.cohort = generate_cohort('hcp', n_subjects=n, seed=42)
+        self.analyzer = self._analyzer(preprocessed=True)
+
+    def _analyzer(self, preprocessed):
+        analyzer = self.analyzer_class()
+        analyzer.data = self.cohort.copy()
+        if preprocessed:
+            with contextlib.redirect_stdout(io.StringIO()):
+                analyzer.preprocess_data()
+        return analyzer
+
+    def time_preprocess(self, n):
+        self._analyzer(preprocessed=True)
+
+    def time_correlation_diagnostics(self, n):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.analyzer.analyze_correlation_matrix()
+
+    def time_formula_search(self, n):
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.analyzer.test_alternative_formulas()
@@ -0,0 +1,316 @@
+"""
+Model function benchmarks.
+
+Scalar functions are timed over a population of n profiles (one call per
+profile, as the validators and the CLI use them); batch functions over the
+same population as arrays.
+"""
+
+import numpy as np
+import pandas as pd
+
+import infodynamics as id
+from infodynamics.analysis import ConservationAccumulator, timbre_features
+from infodynamics.models.conductivity import calculate_g_info_social
+from infodynamics.models.ohms_law import analyze_information_circuit
+from infodynamics.models.energy import forecast_shift_energy, manage_cognitive_workload_batch
+from infodynamics.models.cascade import simulate_cascades
+from infodynamics.models.content import featurize_content
+from infodynamics.models.influence import select_seeds
+from infodynamics.models.retention import iter_retention
+from infodynamics.utils.graph import CSRGraph
+from infodynamics.models.transformers import rank_pipelines
+from infodynamics.models.voltage import compile_voltage_weights
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+
+
+def make_population(n, seed=0):
+    """Random agent profiles, contexts and content profiles as a DataFrame."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'working_memory': rng.normal(7.0, 1.5, n).clip(0, 10),
+        'attention_selectivity': rng.uniform(0, 1, n),
+        'motivation': rng.uniform(0, 1, n),
+        'expertise': rng.uniform(0, 1, n),
+        'processing_speed': rng.uniform(0, 1, n),
+        'distraction_level': rng.uniform(0, 1, n),
+        'time_pressure': rng.uniform(0, 1, n),
+        'fatigue': rng.uniform(0, 1, n),
+        'factual_density': rng.uniform(0, 1, n),
+        'credibility': rng.uniform(0, 1, n),
+        'echo_chamber_strength': rng.uniform(0, 1, n),
+        'social_proof': rng.uniform(0, 1, n),
+        'network_diversity': rng.uniform(0, 1, n),
+    })
+
+
+class ScalarModels:
+    """One scalar call per profile; pure-Python loops, so capped at 1e5 by default."""
+    params = SIZES
+    max_size = 100_000
+
+    def setup(self, n):
+        population = make_population(n)
+        self.profiles = population.to_dict('records')
+        self.contexts = population[['distraction_level', 'time_pressure', 'fatigue']].to_dict('records')
+        self.social = population[['echo_chamber_strength', 'social_proof', 'network_diversity']].to_dict('records')
+        self.u = (population['factual_density'] + population['credibility']).to_numpy() * 5.0
+        self.g = np.full(n, 6.0)
+        self.r = 1.0 / self.g
+        self.l = population['processing_speed'].to_numpy() * 2.0
+        self.c = population['working_memory'].to_numpy() / 2.0
+
+    def time_calculate_g_info(self, n):
+        for profile, context in zip(self.profiles, self.contexts):
+            id.calculate_g_info(profile, context)
+
+    def time_calculate_g_info_social(self, n):
+        for profile, social in zip(self.profiles, self.social):
+            calculate_g_info_social(profile, social)
+
+    def time_calculate_r_info(self, n):
+        for profile, context in zip(self.profiles, self.contexts):
+            id.calculate_r_info(profile, context)
+
+    def time_calculate_l_info(self, n):
+        for profile in self.profiles:
+            id.calculate_l_info(profile)
+
+    def time_calculate_c_info(self, n):
+        for profile in self.profiles:
+            id.calculate_c_info(profile)
+
+    def time_calculate_u_info(self, n):
+        for profile in self.profiles:
+            id.calculate_u_info(profile)
+
+    def time_calculate_flow_rate(self, n):
+        for u, g in zip(self.u.tolist(), self.g.tolist()):
+            id.calculate_flow_rate(u, g)
+
+    def time_calculate_impedance(self, n):
+        for r, l, c in zip(self.r.tolist(), self.l.tolist(), self.c.tolist()):
+            id.calculate_impedance(r, l, c)
+
+
+class CircuitAnalysis:
+    """analyze_information_circuit sweeps 20 frequencies per circuit."""
+    params = SIZES
+    max_size = 10_000
+
+    def setup(self, n):
+        rng = np.random.default_rng(1)
+        self.circuits = list(zip(
+            rng.uniform(0, 10, n).tolist(),
+            rng.uniform(0.1, 5, n).tolist(),
+            rng.uniform(0.1, 3, n).tolist(),
+            rng.uniform(0.1, 3, n).tolist(),
+        ))
+
+    def time_analyze_information_circuit(self, n):
+        for u, r, l, c in self.circuits:
+            analyze_information_circuit(u, r, l, c)
+
+
+class BatchModels:
+    """Vectorized versions over the whole population."""
+    params = SIZES
+
+    def setup(self, n):
+        population = make_population(n)
+        self.columns = {col: population[col].to_numpy() for col in population.columns}
+        self.u = id.calculate_u_info_batch(self.columns)
+        self.g = id.calculate_g_info_batch(self.columns)
+        # Four audience segments, each with its own emotion and novelty weights
+        self.segment_weights = compile_voltage_weights([
+            None, {'arousal_level': 0.5}, {'novelty': 0.8, 'originality': 0.4}, {'urgency': 0.3, 'timeliness': 0.3},
+        ])
+        self.segments = np.random.default_rng(1).integers(0, 4, n)
+
+    def time_calculate_g_info_batch(self, n):
+        id.calculate_g_info_batch(self.columns)
+
+    def time_calculate_r_info_batch(self, n):
+        id.calculate_r_info_batch(self.columns)
+
+    def time_calculate_l_info_batch(self, n):
+        id.calculate_l_info_batch(self.columns)
+
+    def time_calculate_c_info_batch(self, n):
+        id.calculate_c_info_batch(self.columns)
+
+    def time_calculate_u_info_batch(self, n):
+        id.calculate_u_info_batch(self.columns)
+
+    def time_calculate_u_info_batch_segments(self, n):
+        id.calculate_u_info_batch(self.columns, self.segment_weights, segment_index=self.segments)
+
+    def time_calculate_flow_rate_batch(self, n):
+        id.calculate_flow_rate_batch(self.u, self.g)
+
+    def time_score_batch(self, n):
+        id.score_batch(self.columns)
+
+
+def make_formats(n, seed=0):
+    """Random content formats (numeric and categorical) as a DataFrame."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'complexity': rng.uniform(0.05, 1, n),
+        'information_density': rng.uniform(0.05, 1, n),
+        'abstraction_level': rng.uniform(0.05, 1, n),
+        'accessibility': rng.uniform(0.1, 1, n),
+        'modality': rng.choice(['text', 'visual', 'audio'], n),
+        'domain': rng.choice(['general', 'physics', 'mathematics', 'biology', 'medicine'], n),
+        'conceptual_framework': rng.choice(['empirical', 'theoretical', 'practical'], n),
+    })
+
+
+class TransformerModels:
+    """T_info over n triples; n candidate 4-stage pipelines through a 64-format catalog."""
+    params = SIZES
+    max_size = 1_000_000
+
+    def setup(self, n):
+        self.source = make_formats(n, seed=0)
+        self.target = make_formats(n, seed=1)
+        self.agents = {'translation_skill': np.random.default_rng(2).uniform(0, 1, n)}
+        self.catalog = make_formats(64, seed=3)
+        self.pipelines = np.random.default_rng(4).integers(0, 64, (n, 5))
+        self.pipelines[:, 0] = 0
+
+    def time_calculate_t_info_batch(self, n):
+        id.calculate_t_info_batch(self.source, self.target, self.agents)
+
+    def time_rank_pipelines(self, n):
+        rank_pipelines(self.catalog, self.pipelines, {'translation_skill': 0.8}, top_k=10)
+
+
+class EnergyModels:
+    """n workers over an 8-hour shift: 480 one-minute steps, or 32 tasks with breaks."""
+    params = SIZES
+    max_size = 100_000
+
+    def setup(self, n):
+        rng = np.random.default_rng(5)
+        self.workers = {
+            'processing_efficiency': rng.uniform(0, 1, n),
+            'age': rng.uniform(20, 65, n),
+            'daily_energy_budget': rng.uniform(500, 1500, n),
+        }
+        self.catalog = {
+            'computational_complexity': np.array([0.2, 0.5, 0.9]),
+            'cognitive_load': np.array([0.3, 0.6, 0.9]),
+        }
+        self.schedule = rng.integers(-1, 3, (n, 480))
+        self.tasks = {
+            'computational_complexity': rng.uniform(0, 1, 32),
+            'duration': rng.uniform(5, 30, 32),
+        }
+
+    def time_forecast_shift_energy(self, n):
+        forecast_shift_energy(self.catalog, self.schedule, self.workers)
+
+    def time_manage_cognitive_workload_batch(self, n):
+        manage_cognitive_workload_batch(self.tasks, self.workers, 480)
+
+
+class ContentFeaturization:
+    """n documents of 200 words (about 1 in 50 words a keyword)."""
+    params = SIZES
+    max_size = 100_000
+
+    def setup(self, n):
+        rng = np.random.default_rng(11)
+        vocab = np.array([f'w{i}' for i in range(500)] + ['research', 'study', 'breaking', 'news'] * 3)
+        words = vocab[rng.integers(0, len(vocab), (n, 200))]
+        self.texts = [' '.join(row) for row in words]
+
+    def time_featurize_content(self, n):
+        featurize_content(self.texts)
+
+
+class RetentionSimulation:
+    """n exposure events over n // 25 users, streamed in 1M-event chunks."""
+    params = SIZES
+    max_size = 10_000_000
+
+    def setup(self, n):
+        rng = np.random.default_rng(7)
+        users = np.sort(rng.integers(0, max(1, n // 25), n))
+        times = rng.uniform(0, 365, n)
+        order = np.lexsort((times, users))
+        self.events = pd.DataFrame({'user_id': users[order], 'time': times[order]})
+        self.chunks = [self.events.iloc[start:start + 1_000_000] for start in range(0, n, 1_000_000)]
+
+    def time_iter_retention(self, n):
+        for _ in iter_retention(self.chunks, capacity=10.0, horizon=400.0):
+            pass
+
+    def time_iter_retention_power(self, n):
+        for _ in iter_retention(self.chunks, decay='power', capacity=10.0, horizon=400.0):
+            pass
+
+
+class CascadeSimulation:
+    """100 cascades from 10 sources on an n-node random graph with 5n edges."""
+    params = SIZES
+    max_size = 1_000_000
+
+    def setup(self, n):
+        rng = np.random.default_rng(9)
+        self.graph = CSRGraph.from_edges(rng.integers(0, n, 5 * n), rng.integers(0, n, 5 * n), n_nodes=n)
+        self.activation = rng.uniform(0.05, 0.25, n)
+        self.sources = rng.integers(0, n, 10)
+
+    def time_simulate_cascades(self, n):
+        simulate_cascades(self.graph, self.activation, self.sources, n_runs=100)
+
+
+class InfluenceMaximization:
+    """100 seeds on an n-node random graph (5n edges) from 100k RR sets."""
+    params = SIZES
+    max_size = 1_000_000
+
+    def setup(self, n):
+        rng = np.random.default_rng(10)
+        self.graph = CSRGraph.from_edges(rng.integers(0, n, 5 * n), rng.integers(0, n, 5 * n), n_nodes=n)
+        self.reverse = self.graph.reverse()
+        self.activation = rng.uniform(0.05, 0.25, n)
+
+    def time_select_seeds(self, n):
+        select_seeds(self.graph, self.activation, k=100, n_samples=100_000, reverse=self.reverse)
+
+
+class ConservationAudit:
+    """n logged flow edges between n // 5 nodes, folded in 1M-edge chunks."""
+    params = SIZES
+    max_size = 10_000_000
+
+    def setup(self, n):
+        rng = np.random.default_rng(8)
+        n_nodes = max(1, n // 5)
+        self.source = rng.integers(0, n_nodes, n)
+        self.target = rng.integers(0, n_nodes, n)
+        self.flow = rng.exponential(1.0, n)
+
+    def time_conservation_report(self, n):
+        acc = ConservationAccumulator()
+        for start in range(0, len(self.flow), 1_000_000):
+            rows = slice(start, start + 1_000_000)
+            acc.update(self.source[rows], self.target[rows], self.flow[rows])
+        acc.report()
+
+
+class TimbreAnalysis:
+    """STFT timbre features of n engagement series, 512 samples each (64-sample frames, hop 32)."""
+    params = SIZES
+    max_size = 100_000
+
+    def setup(self, n):
+        rng = np.random.default_rng(6)
+        self.signals = rng.standard_normal((n, 512)).astype(np.float32)
+
+    def time_timbre_features(self, n):
+        timbre_features(self.signals, window_size=64, hop=32)
@@ -0,0 +1,62 @@
+"""
+Real-data validator benchmarks on a synthetic BIDS tree.
+
+Times per-participant events.tsv ingestion and metric extraction of
+StanfordInfoDynamicsValidator and SimpleStanfordValidator against a
+ds004636-style layout written by infodynamics.simulation.write_bids_dataset
+(participants.tsv + sub-*/ses-*/func/, per-task ds004636 trial counts).
+"""
+
+import contextlib
+import importlib.util
+import io
+import os
+import shutil
+import tempfile
+
+from infodynamics.simulation import write_bids_dataset
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+VALIDATION_DIR = os.path.join(REPO_ROOT, 'analysis', 'validation', 'zero-shot')
+
+
+def _load_module(filename):
+    """Import a validation script by path (its directory name is not a package)."""
+    name = os.path.splitext(filename)[0]
+    spec = importlib.util.spec_from_file_location(name, os.path.join(VALIDATION_DIR, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class ValidatorIngestion:
+    """Read events.tsv files and compute per-participant metrics."""
+    params = [100, 1_000, 10_000]
+    max_size = 1_000
+
+    def setup(self, n):
+        self.root = tempfile.mkdtemp(prefix='bids_bench_')
+        self.participants = write_bids_dataset(self.root, n, seed=0)['participant_id'].tolist()
+        with contextlib.redirect_stdout(io.StringIO()):
+            full = _load_module('stanford_real_validation.py')
+            simple = _load_module('stanford_simple_validation_real.py')
+            self.validator = full.StanfordInfoDynamicsValidator(self.root)
+            self.simple = simple.SimpleStanfordValidator(self.root)
+
+    def teardown(self, n):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def time_stanford_validator_metrics(self, n):
+        with contextlib.redirect_stdout(io.StringIO()):
+            for pid in self.participants:
+                data = self.validator.extract_behavioral_metrics(pid)
+                self.validator.compute_information_dynamics(data)
+
+    def time_simple_validator_metrics(self, n):
+        with contextlib.redirect_stdout(io.StringIO()):
+            for pid in self.participants:
+                self.simple.compute_information_dynamics(
+                    self.simple.extract_stroop_metrics(pid),
+                    self.simple.extract_stop_signal_metrics(pid),
+                    self.simple.extract_dpx_metrics(pid),
+                )
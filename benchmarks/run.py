@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Benchmark Runner
+
+Discovers benchmark suites in benchmarks/bench_*.py and times them at
+several population sizes. Suites follow the asv conventions:
+
+    class ModelFunctions:
+        params = [1_000, 10_000]     # population sizes
+        max_size = 100_000           # optional: skip larger sizes unless --full
+        def setup(self, n): ...      # not timed
+        def time_something(self, n): ...
+
+Each benchmark is repeated until it has run for --min-time seconds (at least
+--min-repeat and at most --max-repeat times); min and median are recorded.
+Results are written as JSON so runs from different commits can be compared.
+
+Usage:
+    python benchmarks/run.py                                  # default sizes
+    python benchmarks/run.py --sizes 1e3,1e5,1e7 --filter batch
+    python benchmarks/run.py --full --output results/full.json
+    python benchmarks/run.py compare results/old.json results/new.json
+"""
+
+import argparse
+import importlib.util
+import inspect
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCH_DIR)
+RESULTS_DIR = os.path.join(BENCH_DIR, 'results')
+
+sys.path.insert(0, REPO_ROOT)
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def discover_suites():
+    """Yield (module_name, suite_class) for every suite in bench_*.py."""
+    for filename in sorted(os.listdir(BENCH_DIR)):
+        if not (filename.startswith('bench_') and filename.endswith('.py')):
+            continue
+        name = filename[:-3]
+        spec = importlib.util.spec_from_file_location(name, os.path.join(BENCH_DIR, filename))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ == name and any(m.startswith('time_') for m in dir(cls)):
+                yield name, cls
+
+
+def time_benchmark(func, n, min_time, min_repeat, max_repeat):
+    """Repeat func(n) until min_time has elapsed; returns per-run seconds."""
+    samples = []
+    started = time.perf_counter()
+    while len(samples) < max_repeat:
+        t0 = time.perf_counter()
+        func(n)
+        samples.append(time.perf_counter() - t0)
+        if len(samples) >= min_repeat and time.perf_counter() - started >= min_time:
+            break
+    return samples
+
+
+def run(args):
+    sizes = [int(float(s)) for s in args.sizes.split(',')] if args.sizes else None
+    results = {}
+
+    for module_name, cls in discover_suites():
+        suite_sizes = sizes or list(getattr(cls, 'params', [None]))
+        max_size = getattr(cls, 'max_size', None)
+        methods = [m for m in sorted(dir(cls)) if m.startswith('time_')]
+
+        for n in suite_sizes:
+            selected = [m for m in methods
+                        if not args.filter or args.filter in f"{module_name}.{cls.__name__}.{m}"]
+            if not selected:
+                continue
+            if max_size is not None and n is not None and n > max_size and not args.full:
+                for method in selected:
+                    key = f"{module_name}.{cls.__name__}.{method}"
+                    results.setdefault(key, {})[str(n)] = {'skipped': f'n > max_size ({max_size}); use --full'}
+                continue
+
+            suite = cls()
+            if hasattr(suite, 'setup'):
+                suite.setup(n)
+            try:
+                for method in selected:
+                    key = f"{module_name}.{cls.__name__}.{method}"
+                    samples = time_benchmark(getattr(suite, method), n, args.min_time,
+                                             args.min_repeat, args.max_repeat)
+                    entry = {
+                        'min': min(samples),
+                        'median': statistics.median(samples),
+                        'repeat': len(samples),
+                    }
+                    if n:
+                        entry['per_item'] = entry['min'] / n
+                    results.setdefault(key, {})[str(n)] = entry
+                    print(f"{key:<70} n={n!s:>10}  min {entry['min'] * 1e3:10.3f} ms  "
+                          f"median {entry['median'] * 1e3:10.3f} ms  (x{len(samples)})")
+            finally:
+                if hasattr(suite, 'teardown'):
+                    suite.teardown(n)
+
+    output = {
+        'commit': _git_commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'machine': {
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'cpu_count': os.cpu_count(),
+            'python': platform.python_version(),
+        },
+        'results': results,
+    }
+
+    path = args.output or os.path.join(RESULTS_DIR, f"{output['commit']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(output, f, indent=2)
+    print(f"\nResults saved to {path}")
+    return output
+
+
+def compare(args):
+    """Print per-benchmark ratios new/old (min time); flag regressions."""
+    with open(args.old) as f:
+        old = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+
+    print(f"{'benchmark':<70} {'n':>10} {'old [ms]':>11} {'new [ms]':>11} {'ratio':>7}")
+    regressions = 0
+    for key in sorted(set(old['results']) & set(new['results'])):
+        for n in sorted(set(old['results'][key]) & set(new['results'][key]), key=lambda s: float(s) if s != 'None' else 0):
+            a, b = old['results'][key][n], new['results'][key][n]
+            if 'min' not in a or 'min' not in b:
+                continue
+            ratio = b['min'] / a['min']
+            flag = ''
+            if ratio > args.threshold:
+                flag, regressions = '  ⚠️ slower', regressions + 1
+            elif ratio < 1 / args.threshold:
+                flag = '  faster'
+            print(f"{key:<70} {n:>10} {a['min'] * 1e3:11.3f} {b['min'] * 1e3:11.3f} {ratio:7.2f}{flag}")
+
+    print(f"\n{old['commit']} → {new['commit']}: {regressions} regression(s) above {args.threshold:.2f}x")
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Information Dynamics benchmark suite')
+    subparsers = parser.add_subparsers(dest='command')
+
+    parser.add_argument('--sizes', help='Comma-separated population sizes, e.g. 1e3,1e5,1e7 '
+                                        '(default: each suite\'s params)')
+    parser.add_argument('--filter', help='Only run benchmarks whose name contains this string')
+    parser.add_argument('--full', action='store_true', help='Ignore per-suite max_size limits')
+    parser.add_argument('--min-time', type=float, default=0.2, help='Minimum seconds per benchmark')
+    parser.add_argument('--min-repeat', type=int, default=3)
+    parser.add_argument('--max-repeat', type=int, default=20)
+    parser.add_argument('--output', help='Results JSON (default: benchmarks/results/<commit>.json)')
+
+    parser_c = subparsers.add_parser('compare', help='Compare two results files')
+    parser_c.add_argument('old')
+    parser_c.add_argument('new')
+    parser_c.add_argument('--threshold', type=float, default=1.10, help='Ratio flagged as a regression')
+    parser_c.add_argument('--fail-on-regression', action='store_true', help='Exit 1 if any regression')
+
+    args = parser.parse_args()
+    if args.command == 'compare':
+        return compare(args)
+    run(args)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+CLI and Package Startup Benchmark
+
+Runs common tools/cli.py commands (and a bare `import infodynamics`) in fresh
+interpreters under `python -X importtime` and reports, per command:
+- wall time of the whole process (median over repeats)
+- cumulative import time of everything imported after interpreter startup
+- the slowest top-level imports, and whether NumPy / pandas were loaded
+
+Usage:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --repeat 20 --output startup.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+CLI = os.path.join(REPO_ROOT, 'tools', 'cli.py')
+
+COMMANDS = {
+    'import': ['-c', 'import infodynamics'],
+    'flow_rate': [CLI, 'flow_rate', '--voltage', '8.5', '--conductivity', '6.2'],
+    'conductivity': [CLI, 'conductivity', '--working_memory', '7.5', '--attention', '0.8',
+                     '--motivation', '0.9', '--expertise', '0.6'],
+    'analyze_user': [CLI, 'analyze_user', '--profile', 'expert'],
+    'analyze_content': [CLI, 'analyze_content', '--text', 'Breaking news about new research'],
+    'score_help': [CLI, 'score', '--help'],
+}
+
+# Modules imported by the interpreter itself (site, encodings, ...) are
+# excluded; everything imported after `-X importtime` starts is counted.
+_BASELINE = ['-c', 'pass']
+
+
+def parse_importtime(stderr):
+    """Parse `-X importtime` output into [(module, self_us, cumulative_us, depth)]."""
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        head, cumulative_us, name = line.split('|', 2)
+        self_us = int(head.split(':')[1])
+        # One separator space, then two spaces per nesting level (0 = top level)
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        records.append((name.strip(), self_us, int(cumulative_us), depth))
+    return records
+
+
+def run_once(args):
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE='1')
+    started = time.perf_counter()
+    proc = subprocess.run([sys.executable, '-X', 'importtime', *args], cwd=REPO_ROOT, env=env,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    wall = time.perf_counter() - started
+    return wall, parse_importtime(proc.stderr), proc.returncode
+
+
+def benchmark_command(args, baseline_modules, repeat, top):
+    walls = []
+    import_totals = []
+    records = []
+    for _ in range(repeat):
+        wall, records, returncode = run_once(args)
+        if returncode != 0:
+            raise RuntimeError(f"Command failed ({returncode}): {' '.join(args)}")
+        walls.append(wall)
+        import_totals.append(sum(
+            cumulative for name, _, cumulative, depth in records
+            if depth == 0 and name not in baseline_modules
+        ))
+
+    modules = {name for name, *_ in records}
+    top_level = sorted(
+        ((name, cumulative) for name, _, cumulative, depth in records
+         if depth == 0 and name not in baseline_modules),
+        key=lambda item: item[1], reverse=True
+    )[:top]
+
+    return {
+        'argv': args,
+        'wall_seconds_median': statistics.median(walls),
+        'wall_seconds_min': min(walls),
+        'import_seconds_median': statistics.median(import_totals) / 1e6,
+        'modules_imported': len(modules - baseline_modules),
+        'imports_numpy': 'numpy' in modules,
+        'imports_pandas': 'pandas' in modules,
+        'slowest_imports': [{'module': name, 'seconds': us / 1e6} for name, us in top_level],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark CLI and package startup time')
+    parser.add_argument('--repeat', type=int, default=10, help='Fresh interpreters per command')
+    parser.add_argument('--top', type=int, default=5, help='Slowest top-level imports to report')
+    parser.add_argument('--commands', default=','.join(COMMANDS),
+                        help=f"Comma-separated subset of: {','.join(COMMANDS)}")
+    parser.add_argument('--output', help='Write results as JSON to this file')
+    args = parser.parse_args()
+
+    _, baseline_records, _ = run_once(_BASELINE)
+    baseline_modules = {name for name, *_ in baseline_records}
+
+    results = {
+        'python': sys.version.split()[0],
+        'repeat': args.repeat,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commands': {},
+    }
+
+    print(f"{'command':<16} {'wall [ms]':>10} {'imports [ms]':>13} {'modules':>8}  numpy  pandas")
+    for name in args.commands.split(','):
+        result = benchmark_command(COMMANDS[name], baseline_modules, args.repeat, args.top)
+        results['commands'][name] = result
+        print(f"{name:<16} {result['wall_seconds_median'] * 1e3:>10.1f} "
+              f"{result['import_seconds_median'] * 1e3:>13.1f} {result['modules_imported']:>8}  "
+              f"{'yes' if result['imports_numpy'] else 'no':>5}  {'yes' if result['imports_pandas'] else 'no':>6}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to {args.output}")
+
+    return results
+
+
+if __name__ == '__main__':
+    main()
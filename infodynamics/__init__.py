@@ -18,17 +18,55 @@ __version__ = "1.0.0-alpha"
 __author__ = "Information Dynamics Research Team"
 __license__ = "MIT"
 
-# Import main models
-from .models.conductivity import calculate_g_info
-from .models.resistance import calculate_r_info  
-from .models.inductance import calculate_l_info
-from .models.capacity import calculate_c_info
-from .models.voltage import calculate_u_info
-from .models.ohms_law import calculate_flow_rate, calculate_impedance
-
-# Import utilities
-from .utils.validators import validate_input_ranges
-from .utils.converters import normalize_scores, denormalize_scores
+import importlib
+
+# Public names are resolved on first access (PEP 562), so `import infodynamics`
+# stays cheap and e.g. calculate_flow_rate never pulls in NumPy.
+_LAZY_ATTRIBUTES = {
+    # Main models
+    'calculate_g_info': '.models.conductivity',
+    'calculate_r_info': '.models.resistance',
+    'calculate_l_info': '.models.inductance',
+    'calculate_c_info': '.models.capacity',
+    'calculate_u_info': '.models.voltage',
+    'calculate_flow_rate': '.models.ohms_law',
+    'calculate_impedance': '.models.ohms_law',
+    'calculate_t_info': '.models.transformers',
+    'calculate_e_info': '.models.energy',
+    
+    # Batch (array) versions
+    'calculate_g_info_batch': '.models.conductivity',
+    'calculate_r_info_batch': '.models.resistance',
+    'calculate_l_info_batch': '.models.inductance',
+    'calculate_c_info_batch': '.models.capacity',
+    'calculate_u_info_batch': '.models.voltage',
+    'calculate_flow_rate_batch': '.models.ohms_law',
+    'calculate_t_info_batch': '.models.transformers',
+    'calculate_e_info_batch': '.models.energy',
+    'score_batch': '.models.scoring',
+    
+    # Utilities
+    'validate_input_ranges': '.utils.validators',
+    'normalize_scores': '.utils.converters',
+    'denormalize_scores': '.utils.converters',
+}
+
+_SUBPACKAGES = ('analysis', 'models', 'serve', 'simulation', 'utils')
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value  # later lookups skip __getattr__
+        return value
+    if name in _SUBPACKAGES:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_SUBPACKAGES))
+
 
 __all__ = [
     # Core models
@@ -42,6 +80,21 @@ __all__ = [
     'calculate_flow_rate',
     'calculate_impedance',
     
+    # Transformers and energy
+    'calculate_t_info',
+    'calculate_e_info',
+    
+    # Batch scoring
+    'calculate_g_info_batch',
+    'calculate_r_info_batch',
+    'calculate_l_info_batch',
+    'calculate_c_info_batch',
+    'calculate_u_info_batch',
+    'calculate_flow_rate_batch',
+    'calculate_t_info_batch',
+    'calculate_e_info_batch',
+    'score_batch',
+    
     # Utilities
     'validate_input_ranges',
     'normalize_scores',
@@ -0,0 +1,58 @@
+"""
+Information Dynamics Analysis
+
+Scalable building blocks for the validation analyses:
+- Correlation: Out-of-core correlation matrices and multicollinearity diagnostics
+- Conservation: Chunked, mergeable Kirchhoff current-law audit of edge flow logs
+- Preprocessing: Vectorized outlier removal and reusable standardization
+- Pipeline: Cached, incremental stage runner with per-stage timings
+- Plotting: Downsampled, rasterized scatter layers for large cohorts
+- Timbre: STFT spectral centroid, rolloff, flux and envelope of long series
+"""
+
+from .conservation import ConservationAccumulator, check_conservation
+from .correlation import (
+    CorrelationAccumulator,
+    chunked_correlation,
+    classify_correlation,
+    collinearity_diagnostics,
+    variance_inflation_factors,
+)
+from .pipeline import Pipeline, content_hash
+from .plotting import downsample_indices, scatter_layer
+from .preprocessing import (
+    Standardizer,
+    outlier_mask,
+    preprocess,
+    remove_outliers,
+)
+from .timbre import (
+    ENVELOPE_SHAPES,
+    harmonic_profile,
+    spectral_features,
+    stft_power,
+    timbre_features,
+)
+
+__all__ = [
+    'CorrelationAccumulator',
+    'chunked_correlation',
+    'classify_correlation',
+    'collinearity_diagnostics',
+    'variance_inflation_factors',
+    'ConservationAccumulator',
+    'check_conservation',
+    'Pipeline',
+    'content_hash',
+    'downsample_indices',
+    'scatter_layer',
+    'Standardizer',
+    'outlier_mask',
+    'preprocess',
+    'remove_outliers',
+    'ENVELOPE_SHAPES',
+    'harmonic_profile',
+    'spectral_features',
+    'stft_power',
+    'timbre_features',
+]
@@ -0,0 +1,268 @@
+"""
+Out-of-Core Correlation Diagnostics
+
+Correlation matrices for feature tables that are too wide or too long to
+load with ``DataFrame.corr()``. Rows are read in blocks and folded into a
+running mean and centered cross-product matrix (pairwise update of Chan et
+al.), so memory is O(k²) in the number of columns regardless of row count.
+Accumulators from different shards can be merged.
+
+Multicollinearity diagnostics (pairwise flags and variance inflation
+factors) are computed from the finished matrix in one vectorized pass:
+VIF_j = [R⁻¹]_jj.
+"""
+
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_BLOCK_ROWS = 65_536
+
+# Thresholds used by the validation scripts for |r| between components
+HIGH_CORRELATION = 0.7
+MODERATE_CORRELATION = 0.4
+HIGH_VIF = 10.0
+
+
+class CorrelationAccumulator:
+    """
+    Streaming accumulator for means, covariances and correlations.
+
+    Rows containing NaN are dropped (listwise deletion) before accumulation.
+
+    Example:
+        >>> acc = CorrelationAccumulator(["a", "b"])
+        >>> for block in blocks:
+        ...     acc.update(block)
+        >>> R = acc.correlation()
+    """
+
+    def __init__(self, columns: Sequence[str]):
+        self.columns = list(columns)
+        k = len(self.columns)
+        self.n = 0
+        self.mean = np.zeros(k)
+        self.cross = np.zeros((k, k))
+
+    def update(self, block: np.ndarray) -> "CorrelationAccumulator":
+        """Fold a (rows × columns) block into the running statistics."""
+        block = np.asarray(block, dtype=np.float64)
+        if block.ndim != 2 or block.shape[1] != len(self.columns):
+            raise ValueError(f"Expected a 2D block with {len(self.columns)} columns, got shape {block.shape}")
+
+        block = block[~np.isnan(block).any(axis=1)]
+        n_b = block.shape[0]
+        if n_b == 0:
+            return self
+
+        mean_b = block.mean(axis=0)
+        centered = block - mean_b
+        cross_b = centered.T @ centered
+        return self._combine(n_b, mean_b, cross_b)
+
+    def merge(self, other: "CorrelationAccumulator") -> "CorrelationAccumulator":
+        """Merge statistics accumulated over another shard of the same columns."""
+        if other.columns != self.columns:
+            raise ValueError("Cannot merge accumulators over different columns")
+        if other.n == 0:
+            return self
+        return self._combine(other.n, other.mean, other.cross)
+
+    def _combine(self, n_b: int, mean_b: np.ndarray, cross_b: np.ndarray) -> "CorrelationAccumulator":
+        n_a = self.n
+        n = n_a + n_b
+        delta = mean_b - self.mean
+
+        self.cross += cross_b + np.outer(delta, delta) * (n_a * n_b / n)
+        self.mean += delta * (n_b / n)
+        self.n = n
+        return self
+
+    def covariance(self, ddof: int = 1) -> pd.DataFrame:
+        """Sample covariance matrix."""
+        if self.n <= ddof:
+            raise ValueError("Not enough complete rows to compute covariance")
+        return pd.DataFrame(self.cross / (self.n - ddof), index=self.columns, columns=self.columns)
+
+    def correlation(self) -> pd.DataFrame:
+        """Pearson correlation matrix."""
+        if self.n < 2:
+            raise ValueError("Not enough complete rows to compute correlation")
+        std = np.sqrt(np.diag(self.cross))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            corr = self.cross / np.outer(std, std)
+        np.fill_diagonal(corr, 1.0)
+        return pd.DataFrame(np.clip(corr, -1.0, 1.0), index=self.columns, columns=self.columns)
+
+
+def iter_blocks(
+    source: Union[pd.DataFrame, np.ndarray, str, Path],
+    columns: Optional[Sequence[str]] = None,
+    block_rows: int = DEFAULT_BLOCK_ROWS
+) -> Iterator[np.ndarray]:
+    """
+    Iterate a table as float64 row blocks.
+
+    Args:
+        source: DataFrame, 2D array or np.memmap, path to a ``.npy`` file
+            (opened memory-mapped) or path to a Parquet file (read by row batch)
+        columns: Columns to read (DataFrame/Parquet) or integer positions
+            (arrays); all numeric columns by default
+        block_rows: Maximum rows per block
+
+    Yields:
+        2D float64 arrays of shape (≤ block_rows, n_columns)
+    """
+    if isinstance(source, (str, Path)):
+        path = Path(source)
+        if path.suffix == ".npy":
+            source = np.load(path, mmap_mode="r")
+        elif path.suffix in (".parquet", ".pq"):
+            yield from _iter_parquet_blocks(path, columns, block_rows)
+            return
+        else:
+            raise ValueError(f"Unsupported file type: {path.suffix} (expected .npy or .parquet)")
+
+    if isinstance(source, pd.DataFrame):
+        frame = source[list(columns)] if columns is not None else source.select_dtypes(include=[np.number])
+        for start in range(0, len(frame), block_rows):
+            yield frame.iloc[start:start + block_rows].to_numpy(dtype=np.float64)
+        return
+
+    array = source
+    if array.ndim != 2:
+        raise ValueError("Array input must be 2D (rows × columns)")
+    for start in range(0, array.shape[0], block_rows):
+        block = array[start:start + block_rows]
+        if columns is not None:
+            block = block[:, list(columns)]
+        yield np.asarray(block, dtype=np.float64)
+
+
+def _iter_parquet_blocks(path: Path, columns: Optional[Sequence[str]], block_rows: int) -> Iterator[np.ndarray]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Reading Parquet input requires pyarrow (pip install pyarrow)") from e
+
+    parquet_file = pq.ParquetFile(path)
+    if columns is None:
+        columns = _parquet_numeric_columns(parquet_file)
+
+    for batch in parquet_file.iter_batches(batch_size=block_rows, columns=list(columns)):
+        yield np.column_stack([
+            batch.column(i).to_numpy(zero_copy_only=False).astype(np.float64)
+            for i in range(batch.num_columns)
+        ])
+
+
+def _parquet_numeric_columns(parquet_file) -> List[str]:
+    """Names of integer and floating-point columns in a Parquet file's schema."""
+    import pyarrow.types as pat
+
+    schema = parquet_file.schema_arrow
+    return [
+        field.name for field in schema
+        if pat.is_integer(field.type) or pat.is_floating(field.type)
+    ]
+
+
+def _default_columns(source, columns):
+    if columns is not None:
+        return list(columns)
+    if isinstance(source, pd.DataFrame):
+        return list(source.select_dtypes(include=[np.number]).columns)
+    if isinstance(source, (str, Path)) and Path(source).suffix in (".parquet", ".pq"):
+        import pyarrow.parquet as pq
+        return _parquet_numeric_columns(pq.ParquetFile(source))
+    if isinstance(source, (str, Path)):
+        source = np.load(source, mmap_mode="r")
+    return [f"x{i}" for i in range(source.shape[1])]
+
+
+def chunked_correlation(
+    source: Union[pd.DataFrame, np.ndarray, str, Path],
+    columns: Optional[Sequence[str]] = None,
+    block_rows: int = DEFAULT_BLOCK_ROWS
+) -> pd.DataFrame:
+    """
+    Compute a Pearson correlation matrix block by block.
+
+    Args:
+        source: See ``iter_blocks``
+        columns: Columns to include (all numeric columns by default)
+        block_rows: Rows read per block
+
+    Returns:
+        Correlation matrix as a DataFrame labelled by column
+    """
+    names = _default_columns(source, columns)
+    accumulator = CorrelationAccumulator(names)
+    for block in iter_blocks(source, columns, block_rows):
+        accumulator.update(block)
+    return accumulator.correlation()
+
+
+def classify_correlation(
+    values: np.ndarray,
+    high: float = HIGH_CORRELATION,
+    moderate: float = MODERATE_CORRELATION,
+    labels: Sequence[str] = ("HIGH", "MODERATE", "LOW")
+) -> np.ndarray:
+    """Label |r| values as HIGH / MODERATE / LOW in one vectorized step."""
+    magnitude = np.abs(values)
+    return np.select([magnitude > high, magnitude > moderate], list(labels[:2]), default=labels[2])
+
+
+def variance_inflation_factors(corr: Union[pd.DataFrame, np.ndarray]) -> pd.Series:
+    """
+    Variance inflation factors from a correlation matrix.
+
+    VIF_j is the j-th diagonal element of R⁻¹. A pseudo-inverse is used so
+    that exactly collinear sets produce very large VIFs instead of failing.
+    """
+    corr_df = corr if isinstance(corr, pd.DataFrame) else pd.DataFrame(corr)
+    inverse = np.linalg.pinv(corr_df.to_numpy())
+    return pd.Series(np.diag(inverse), index=corr_df.columns, name="vif")
+
+
+def collinearity_diagnostics(
+    corr: pd.DataFrame,
+    high: float = HIGH_CORRELATION,
+    moderate: float = MODERATE_CORRELATION,
+    vif_threshold: float = HIGH_VIF
+) -> Dict[str, pd.DataFrame]:
+    """
+    Flag multicollinearity from a correlation matrix.
+
+    Args:
+        corr: Correlation matrix (as returned by ``chunked_correlation``)
+        high: |r| above which a pair is flagged HIGH
+        moderate: |r| above which a pair is flagged MODERATE
+        vif_threshold: VIF above which a variable is flagged
+
+    Returns:
+        Dictionary with:
+            - pairs: Every unordered pair with r, |r| and status, sorted by |r|
+            - vif: Per-variable VIF and a boolean ``flagged`` column
+    """
+    values = corr.to_numpy()
+    names = np.asarray(corr.columns)
+    i, j = np.triu_indices(len(names), k=1)
+    r = values[i, j]
+
+    pairs = pd.DataFrame({
+        "var1": names[i],
+        "var2": names[j],
+        "r": r,
+        "abs_r": np.abs(r),
+        "status": classify_correlation(r, high, moderate),
+    }).sort_values("abs_r", ascending=False, ignore_index=True)
+
+    vif = variance_inflation_factors(corr).to_frame()
+    vif["flagged"] = vif["vif"] > vif_threshold
+
+    return {"pairs": pairs, "vif": vif}
@@ -0,0 +1,256 @@
+"""
+Cached Stage Pipeline
+
+Incremental runner for the validation analyses. An analysis is declared as
+a chain of named stages (load → preprocess → correlations → formulas → ML →
+figures → report); each stage lists the stages whose outputs it consumes.
+
+Stage outputs are persisted under ``cache_dir`` (DataFrames as Parquet,
+arrays as NPY, anything else pickled) and keyed by a hash of:
+- the stage's source code (plus any extra functions it declares),
+- its parameters,
+- the content hashes of its inputs.
+
+On the next run a stage is re-executed only if one of those changed, so
+editing a plotting function does not redo the ML fits. Per-stage timings
+are recorded for every run, and each stage is also recorded as a profiling
+stage (``pipeline.<name>``) when ``infodynamics.utils.profiling`` is enabled.
+"""
+
+import hashlib
+import inspect
+import json
+import pickle
+import shutil
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from ..utils import metrics as _metrics
+from ..utils.profiling import stage as profiling_stage
+
+
+@dataclass
+class Stage:
+    """A pipeline step: ``func(*inputs, **params) -> output``."""
+    name: str
+    func: Callable
+    inputs: List[str] = field(default_factory=list)
+    params: Dict[str, Any] = field(default_factory=dict)
+    code: List[Callable] = field(default_factory=list)
+    cache: bool = True
+
+
+@dataclass
+class StageTiming:
+    """Outcome of one stage in the last run."""
+    name: str
+    status: str       # "ran", "cached" or "uncached"
+    seconds: float
+    key: str
+
+
+def _code_hash(funcs: Sequence[Callable]) -> str:
+    digest = hashlib.sha256()
+    for func in funcs:
+        try:
+            source = inspect.getsource(func)
+        except (OSError, TypeError):
+            code = getattr(func, "__code__", None)
+            source = repr((code.co_code, code.co_consts)) if code is not None else repr(func)
+        digest.update(source.encode())
+    return digest.hexdigest()
+
+
+def content_hash(value: Any) -> str:
+    """Deterministic content hash for frames, arrays and picklable objects."""
+    digest = hashlib.sha256()
+    if isinstance(value, pd.DataFrame):
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+        digest.update(repr((list(value.columns), [str(t) for t in value.dtypes])).encode())
+    elif isinstance(value, np.ndarray) and value.dtype != object:
+        digest.update(np.ascontiguousarray(value).tobytes())
+        digest.update(repr((value.dtype.str, value.shape)).encode())
+    else:
+        digest.update(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+    return digest.hexdigest()
+
+
+def _save_output(value: Any, directory: Path) -> str:
+    if isinstance(value, pd.DataFrame):
+        try:
+            value.to_parquet(directory / "output.parquet")
+            return "parquet"
+        except (ImportError, ValueError, TypeError):
+            pass  # no pyarrow, or columns Parquet cannot represent
+    elif isinstance(value, np.ndarray) and value.dtype != object:
+        np.save(directory / "output.npy", value)
+        return "npy"
+
+    with open(directory / "output.pkl", "wb") as f:
+        pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return "pickle"
+
+
+def _load_output(directory: Path, fmt: str) -> Any:
+    if fmt == "parquet":
+        return pd.read_parquet(directory / "output.parquet")
+    if fmt == "npy":
+        return np.load(directory / "output.npy")
+    with open(directory / "output.pkl", "rb") as f:
+        return pickle.load(f)
+
+
+class Pipeline:
+    """
+    Memoizing stage runner.
+
+    Example:
+        >>> pipeline = Pipeline(".pipeline_cache")
+        >>> pipeline.add_stage("load", load_data, params={"n": 1200})
+        >>> pipeline.add_stage("preprocess", preprocess, inputs=["load"])
+        >>> pipeline.add_stage("figures", plot, inputs=["preprocess"], code=[make_plot])
+        >>> outputs = pipeline.run()
+        >>> print(pipeline.timing_report())
+    """
+
+    def __init__(self, cache_dir: str = ".pipeline_cache"):
+        self.cache_dir = Path(cache_dir)
+        self.stages: Dict[str, Stage] = {}
+        self.timings: List[StageTiming] = []
+
+    def add_stage(
+        self,
+        name: str,
+        func: Callable,
+        inputs: Sequence[str] = (),
+        params: Optional[Dict[str, Any]] = None,
+        code: Sequence[Callable] = (),
+        cache: bool = True
+    ) -> Stage:
+        """
+        Register a stage. Inputs must name stages added earlier.
+
+        Args:
+            name: Unique stage name
+            func: Called as ``func(*input_outputs, **params)``
+            inputs: Upstream stage names, passed positionally in this order
+            params: Keyword parameters (part of the cache key)
+            code: Extra functions whose source is part of the cache key,
+                e.g. the analyzer methods a thin wrapper calls
+            cache: Set False for cheap stages that must always run (reports)
+        """
+        if name in self.stages:
+            raise ValueError(f"Duplicate stage: {name}")
+        for upstream in inputs:
+            if upstream not in self.stages:
+                raise ValueError(f"Stage {name} depends on unknown stage {upstream}")
+
+        stage = Stage(name, func, list(inputs), dict(params or {}), list(code), cache)
+        self.stages[name] = stage
+        return stage
+
+    def _required(self, targets: Optional[Sequence[str]]) -> List[str]:
+        if targets is None:
+            return list(self.stages)
+        needed = set()
+        stack = list(targets)
+        while stack:
+            name = stack.pop()
+            if name not in needed:
+                needed.add(name)
+                stack.extend(self.stages[name].inputs)
+        return [name for name in self.stages if name in needed]
+
+    def _stage_key(self, stage: Stage, input_hashes: List[str]) -> str:
+        payload = json.dumps({
+            "name": stage.name,
+            "code": _code_hash([stage.func] + stage.code),
+            "params": stage.params,
+            "inputs": input_hashes,
+        }, sort_keys=True, default=repr)
+        return hashlib.sha256(payload.encode()).hexdigest()[:24]
+
+    def run(self, targets: Optional[Sequence[str]] = None, force: Sequence[str] = ()) -> Dict[str, Any]:
+        """
+        Run the stages needed for ``targets`` (all stages by default).
+
+        Args:
+            targets: Stages whose outputs are wanted
+            force: Stages to re-execute even if cached
+
+        Returns:
+            Dictionary of stage name → output
+        """
+        self.timings = []
+        outputs: Dict[str, Any] = {}
+        hashes: Dict[str, str] = {}
+        cached_dirs: Dict[str, tuple] = {}
+
+        def get_output(name):
+            if name not in outputs:
+                directory, fmt = cached_dirs[name]
+                outputs[name] = _load_output(directory, fmt)
+            return outputs[name]
+
+        for name in self._required(targets):
+            stage = self.stages[name]
+            key = self._stage_key(stage, [hashes[i] for i in stage.inputs])
+            directory = self.cache_dir / name / key
+            meta_path = directory / "meta.json"
+            started = time.perf_counter()
+
+            with profiling_stage(f"pipeline.{name}") as record:
+                if stage.cache and name not in force and meta_path.exists():
+                    meta = json.loads(meta_path.read_text())
+                    cached_dirs[name] = (directory, meta["format"])
+                    hashes[name] = meta["content_hash"]
+                    record.meta["status"] = "cached"
+                    if _metrics.enabled:
+                        _metrics.inc("infodynamics_pipeline_cache_total", result="hit")
+                    self.timings.append(StageTiming(name, "cached", time.perf_counter() - started, key))
+                    continue
+
+                if stage.cache and _metrics.enabled:
+                    _metrics.inc("infodynamics_pipeline_cache_total", result="miss")
+                result = stage.func(*[get_output(i) for i in stage.inputs], **stage.params)
+                elapsed = time.perf_counter() - started
+                outputs[name] = result
+                hashes[name] = content_hash(result)
+                if hasattr(result, "__len__") and not isinstance(result, (str, bytes, dict)):
+                    record.items = len(result)
+
+                if stage.cache:
+                    if directory.exists():
+                        shutil.rmtree(directory)
+                    directory.mkdir(parents=True)
+                    fmt = _save_output(result, directory)
+                    meta_path.write_text(json.dumps({
+                        "content_hash": hashes[name],
+                        "format": fmt,
+                        "seconds": elapsed,
+                    }))
+
+                status = "ran" if stage.cache else "uncached"
+                record.meta["status"] = status
+                self.timings.append(StageTiming(name, status, elapsed, key))
+
+        wanted = targets if targets is not None else list(self.stages)
+        return {name: get_output(name) for name in wanted}
+
+    def timing_report(self) -> pd.DataFrame:
+        """Per-stage status and wall time of the last run."""
+        return pd.DataFrame(
+            [(t.name, t.status, t.seconds, t.key) for t in self.timings],
+            columns=["stage", "status", "seconds", "key"]
+        )
+
+    def clear_cache(self, stage: Optional[str] = None) -> None:
+        """Remove cached outputs for one stage, or for the whole pipeline."""
+        target = self.cache_dir / stage if stage else self.cache_dir
+        if target.exists():
+            shutil.rmtree(target)
@@ -0,0 +1,72 @@
+"""
+Scatter Layers for Large Cohorts
+
+Per-subject scatter plots get slower to draw (and vector outputs get larger)
+linearly with cohort size. ``scatter_layer`` keeps the cost flat:
+- above ``max_points`` a fixed-seed random subset is drawn, so the same
+  cohort always produces the same figure
+- above ``rasterize_above`` the layer is rasterized, so PDF/SVG outputs
+  embed one bitmap instead of one path per point
+
+Axes, labels and any fitted lines stay vector. Small cohorts are drawn
+unchanged.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+
+DEFAULT_MAX_POINTS = 20_000
+DEFAULT_RASTERIZE_ABOVE = 5_000
+
+
+def downsample_indices(n: int, max_points: int, seed: int = 0) -> np.ndarray:
+    """Sorted indices of a reproducible random subset of at most ``max_points`` rows."""
+    if n <= max_points:
+        return np.arange(n)
+    rng = np.random.default_rng(seed)
+    return np.sort(rng.choice(n, size=max_points, replace=False))
+
+
+def scatter_layer(
+    ax,
+    x,
+    y,
+    max_points: Optional[int] = DEFAULT_MAX_POINTS,
+    rasterize_above: Optional[int] = DEFAULT_RASTERIZE_ABOVE,
+    seed: int = 0,
+    **kwargs
+):
+    """
+    Draw a scatter layer whose rendering cost does not grow with cohort size.
+
+    Args:
+        ax: Matplotlib axes
+        x, y: Point coordinates (array-like of equal length)
+        max_points: Maximum points drawn, or None to draw all
+        rasterize_above: Rasterize the layer when the cohort has more points
+            than this, or None to never rasterize
+        seed: Seed for the subset selection
+        **kwargs: Passed to ``ax.scatter``; per-point ``c`` and ``s`` arrays
+            are subsampled together with the coordinates
+
+    Returns:
+        The PathCollection returned by ``ax.scatter``
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    n = len(x)
+
+    if max_points is not None and n > max_points:
+        idx = downsample_indices(n, max_points, seed)
+        x, y = x[idx], y[idx]
+        for key in ("c", "s"):
+            value = kwargs.get(key)
+            if value is not None and np.ndim(value) > 0 and len(value) == n:
+                kwargs[key] = np.asarray(value)[idx]
+
+    if rasterize_above is not None and n > rasterize_above:
+        kwargs.setdefault("rasterized", True)
+
+    return ax.scatter(x, y, **kwargs)
@@ -0,0 +1,194 @@
+"""
+Outlier Removal and Standardization
+
+Shared preprocessing stage for the validation analyses:
+- Outlier removal: |z| < threshold on every numeric column, computed as one
+  array operation and applied as a single row mask
+- Standardization: z = (x - mean) / scale with parameters that are stored
+  on the Standardizer, so they can be fit on one cohort (or streamed over
+  chunks with ``partial_fit``) and reapplied to new data
+
+Scaling uses the population standard deviation (ddof=0), matching
+``scipy.stats.zscore`` and ``sklearn.preprocessing.StandardScaler``.
+"""
+
+from typing import Dict, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_OUTLIER_THRESHOLD = 3.0
+
+
+def _numeric_columns(data: pd.DataFrame, columns: Optional[Sequence[str]]) -> list:
+    if columns is not None:
+        return list(columns)
+    return list(data.select_dtypes(include=[np.number]).columns)
+
+
+def outlier_mask(
+    data: Union[pd.DataFrame, np.ndarray],
+    columns: Optional[Sequence[str]] = None,
+    threshold: float = DEFAULT_OUTLIER_THRESHOLD
+) -> np.ndarray:
+    """
+    Boolean mask of rows whose |z| is below ``threshold`` in every column.
+
+    Args:
+        data: DataFrame or 2D array
+        columns: Columns to check (all numeric columns by default)
+        threshold: z-score cutoff (3 SD rule by default)
+
+    Returns:
+        Boolean array, True for rows to keep. Rows with NaN are dropped;
+        zero-variance columns never flag a row.
+    """
+    if isinstance(data, pd.DataFrame):
+        values = data[_numeric_columns(data, columns)].to_numpy(dtype=np.float64)
+    else:
+        values = np.asarray(data, dtype=np.float64)
+
+    # NaN-aware, so a NaN drops only its own row, not its whole column
+    mean = np.nanmean(values, axis=0)
+    std = np.nanstd(values, axis=0)
+    std[std == 0] = np.inf  # constant column: z = 0
+
+    z = np.abs((values - mean) / std)
+    return (z < threshold).all(axis=1)
+
+
+def remove_outliers(
+    data: pd.DataFrame,
+    columns: Optional[Sequence[str]] = None,
+    threshold: float = DEFAULT_OUTLIER_THRESHOLD
+) -> pd.DataFrame:
+    """Drop outlier rows (see ``outlier_mask``) and reset the index."""
+    return data[outlier_mask(data, columns, threshold)].reset_index(drop=True)
+
+
+class Standardizer:
+    """
+    Column standardizer with stored, reusable parameters.
+
+    Example:
+        >>> scaler = Standardizer(["k_individual", "attention_focus"])
+        >>> scaler.fit_transform(train)           # adds *_scaled columns
+        >>> scaler.transform(new_cohort)          # same mean/scale
+        >>>
+        >>> streaming = Standardizer(columns)
+        >>> for chunk in chunks:
+        ...     streaming.partial_fit(chunk)
+    """
+
+    def __init__(self, columns: Optional[Sequence[str]] = None, suffix: str = "_scaled"):
+        """
+        Args:
+            columns: Columns to standardize (numeric columns of the first
+                fitted frame by default)
+            suffix: Suffix for output columns; empty string overwrites
+                the input columns
+        """
+        self.columns = list(columns) if columns is not None else None
+        self.suffix = suffix
+        self.n_samples_ = 0
+        self.mean_ = None
+        self._m2 = None
+
+    @property
+    def scale_(self) -> np.ndarray:
+        """Population standard deviation per column (1.0 where constant)."""
+        if self.mean_ is None:
+            raise ValueError("Standardizer is not fitted")
+        scale = np.sqrt(self._m2 / self.n_samples_)
+        scale[scale == 0] = 1.0
+        return scale
+
+    def partial_fit(self, data: pd.DataFrame) -> "Standardizer":
+        """Update the running mean and variance with another chunk of rows."""
+        if self.columns is None:
+            self.columns = _numeric_columns(data, None)
+
+        values = data[self.columns].to_numpy(dtype=np.float64)
+        n_b = values.shape[0]
+        if n_b == 0:
+            return self
+
+        mean_b = values.mean(axis=0)
+        m2_b = ((values - mean_b) ** 2).sum(axis=0)
+
+        if self.mean_ is None:
+            self.n_samples_, self.mean_, self._m2 = n_b, mean_b, m2_b
+            return self
+
+        # Chan et al. pairwise combination of (n, mean, M2)
+        n_a = self.n_samples_
+        n = n_a + n_b
+        delta = mean_b - self.mean_
+        self._m2 = self._m2 + m2_b + delta ** 2 * (n_a * n_b / n)
+        self.mean_ = self.mean_ + delta * (n_b / n)
+        self.n_samples_ = n
+        return self
+
+    def fit(self, data: pd.DataFrame) -> "Standardizer":
+        """Fit mean and scale on a complete frame, discarding previous state."""
+        self.n_samples_, self.mean_, self._m2 = 0, None, None
+        return self.partial_fit(data)
+
+    def transform(self, data: pd.DataFrame, inplace: bool = True) -> pd.DataFrame:
+        """
+        Standardize columns with the stored parameters.
+
+        Args:
+            data: Frame containing the fitted columns
+            inplace: Write output columns into ``data`` (default) instead of a copy
+
+        Returns:
+            The frame holding the standardized columns
+        """
+        scaled = (data[self.columns].to_numpy(dtype=np.float64) - self.mean_) / self.scale_
+
+        target = data if inplace else data.copy()
+        for i, col in enumerate(self.columns):
+            target[f"{col}{self.suffix}"] = scaled[:, i]
+        return target
+
+    def fit_transform(self, data: pd.DataFrame, inplace: bool = True) -> pd.DataFrame:
+        """Fit on ``data`` and standardize it."""
+        return self.fit(data).transform(data, inplace=inplace)
+
+    def get_params(self) -> Dict[str, Dict[str, float]]:
+        """Stored parameters as {column: {"mean": ..., "scale": ...}}."""
+        scale = self.scale_
+        return {
+            col: {"mean": float(self.mean_[i]), "scale": float(scale[i])}
+            for i, col in enumerate(self.columns)
+        }
+
+
+def preprocess(
+    data: pd.DataFrame,
+    scale_columns: Sequence[str],
+    outlier_columns: Optional[Sequence[str]] = None,
+    threshold: Optional[float] = DEFAULT_OUTLIER_THRESHOLD,
+    suffix: str = "_scaled"
+) -> tuple:
+    """
+    Remove outliers once and standardize the requested columns.
+
+    Args:
+        data: Input frame
+        scale_columns: Columns to standardize
+        outlier_columns: Columns checked for outliers (all numeric by default)
+        threshold: z-score cutoff, or None to skip outlier removal
+        suffix: Suffix for standardized columns
+
+    Returns:
+        Tuple of (processed frame, fitted Standardizer)
+    """
+    if threshold is not None:
+        data = remove_outliers(data, outlier_columns, threshold)
+
+    scaler = Standardizer(scale_columns, suffix=suffix)
+    scaler.fit_transform(data)
+    return data, scaler
@@ -0,0 +1,263 @@
+"""
+Information Timbre from Time Series
+
+Spectral timbre features (theory/information_timbre_model.md) computed from
+long signals such as per-user engagement series, instead of from a short
+harmonic list. Each series is cut into overlapping Hann-windowed frames
+(short-time Fourier transform) and transformed with a real FFT:
+
+- centroid: power-weighted mean frequency, Σ f·P(f) / Σ P(f)
+- rolloff: lowest frequency below which ``rolloff`` (85%) of the power lies
+- flux: L2 distance between consecutive frames' unit-norm magnitude spectra
+  (0 = stationary timbre, √2 = completely different spectra)
+- envelope: mean power spectrum over frames, plus its shape class
+  ("flat", "declining", "rising", "peaked", as ``calculate_spectral_envelope``)
+
+Series are processed in row chunks of a 2-D array (which may be a
+``np.memmap`` or a PopulationStore-style column matrix), so memory is bounded
+by ``chunk_size`` and millions of series can be featurized. Every chunk uses
+the same frame length, so the FFT plan is built once and reused from the
+backend's plan cache; ``scipy.fft`` is used when available (and can split a
+chunk across ``workers`` threads), otherwise ``numpy.fft``. Frame lengths
+with small prime factors (powers of two) are fastest.
+
+Frames have their mean removed before windowing (``detrend=True``), so the
+DC level of a series does not dominate its centroid; missing values (NaN)
+are treated as the frame mean. Silent frames (no variation) have centroid
+and rolloff 0.
+
+Example:
+    >>> features = timbre_features(engagement, sample_rate=24.0, window_size=64, hop=32)
+    >>> features["centroid"].shape
+    (n_series,)
+"""
+
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+try:
+    from scipy import fft as _fft
+    _FFT_WORKERS = True
+except ImportError:  # pragma: no cover - scipy is optional here
+    _fft = np.fft
+    _FFT_WORKERS = False
+
+
+DEFAULT_WINDOW_SIZE = 64
+DEFAULT_CHUNK_SIZE = 4096
+ROLLOFF_FRACTION = 0.85
+
+# Envelope shape codes (index into ENVELOPE_SHAPES)
+ENVELOPE_SHAPES = ("flat", "declining", "rising", "peaked")
+
+
+def _rfft(frames: np.ndarray, workers: Optional[int]) -> np.ndarray:
+    if _FFT_WORKERS:
+        return _fft.rfft(frames, axis=-1, workers=workers, overwrite_x=True)
+    return _fft.rfft(frames, axis=-1)
+
+
+def stft_power(
+    signals,
+    window_size: int = DEFAULT_WINDOW_SIZE,
+    hop: Optional[int] = None,
+    detrend: bool = True,
+    workers: Optional[int] = None
+) -> np.ndarray:
+    """
+    Short-time power spectra of a batch of equal-length series.
+
+    Args:
+        signals: (n_series, n_samples) array, or one 1-D series
+        window_size: Samples per frame
+        hop: Samples between frame starts (default window_size // 2)
+        detrend: Remove each frame's mean before windowing
+        workers: FFT threads (scipy only)
+
+    Returns:
+        (n_series, n_frames, window_size // 2 + 1) power spectra
+    """
+    x = np.asarray(signals, dtype=np.float64)
+    if x.ndim == 1:
+        x = x[None, :]
+    hop = window_size // 2 if hop is None else hop
+    if window_size < 2 or hop < 1:
+        raise ValueError("window_size must be >= 2 and hop >= 1")
+    if x.shape[-1] < window_size:
+        raise ValueError(f"Series have {x.shape[-1]} samples, fewer than window_size={window_size}")
+
+    frames = np.lib.stride_tricks.sliding_window_view(x, window_size, axis=-1)[:, ::hop, :]
+    has_nan = np.isnan(x).any()
+    if detrend:
+        mean = np.nanmean(frames, axis=-1, keepdims=True) if has_nan else frames.mean(axis=-1, keepdims=True)
+        frames = frames - mean
+    else:
+        frames = frames.copy()
+    if has_nan:
+        np.nan_to_num(frames, copy=False, nan=0.0)
+    frames *= np.hanning(window_size)
+
+    spectrum = _rfft(frames, workers)
+    return spectrum.real ** 2 + spectrum.imag ** 2
+
+
+def envelope_shape(envelope: np.ndarray) -> np.ndarray:
+    """
+    Shape code of each envelope row (see ENVELOPE_SHAPES): where the peak of
+    the spectrum lies, as in the theory's ``calculate_spectral_envelope``.
+    """
+    envelope = np.atleast_2d(envelope)
+    n_bins = envelope.shape[-1]
+    if n_bins < 2:
+        return np.zeros(envelope.shape[0], dtype=np.int8)
+    peak = np.argmax(envelope, axis=-1)
+    shape = np.full(envelope.shape[0], 3, dtype=np.int8)
+    shape[peak == 0] = 1
+    shape[peak == n_bins - 1] = 2
+    return shape
+
+
+def spectral_features(
+    power: np.ndarray,
+    frequencies: np.ndarray,
+    rolloff: float = ROLLOFF_FRACTION
+) -> Dict[str, np.ndarray]:
+    """
+    Per-frame centroid, rolloff and flux and the mean envelope from power
+    spectra of shape (..., n_frames, n_bins).
+
+    Returns:
+        {"centroid": (..., n_frames), "rolloff": (..., n_frames),
+         "flux": (..., n_frames - 1), "envelope": (..., n_bins)}
+    """
+    frequencies = np.asarray(frequencies, dtype=np.float64)
+    total = power.sum(axis=-1)
+    silent = total <= 0
+    safe_total = np.where(silent, 1.0, total)
+
+    centroid = (power @ frequencies) / safe_total
+
+    # First bin whose cumulative power reaches the fraction: argmax over the
+    # boolean replaces the scalar next(...) scan
+    cumulative = np.cumsum(power, axis=-1)
+    reached = cumulative >= rolloff * total[..., None]
+    rolloff_freq = frequencies[np.argmax(reached, axis=-1)]
+    rolloff_freq[silent] = 0.0
+
+    magnitude = np.sqrt(power)
+    magnitude /= np.sqrt(safe_total)[..., None]
+    flux = np.linalg.norm(np.diff(magnitude, axis=-2), axis=-1)
+
+    return {
+        "centroid": centroid,
+        "rolloff": rolloff_freq,
+        "flux": flux,
+        "envelope": power.mean(axis=-2),
+    }
+
+
+def timbre_features(
+    signals,
+    sample_rate: float = 1.0,
+    window_size: int = DEFAULT_WINDOW_SIZE,
+    hop: Optional[int] = None,
+    rolloff: float = ROLLOFF_FRACTION,
+    detrend: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    per_frame: bool = False,
+    workers: Optional[int] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Timbre features for many series, computed chunk by chunk.
+
+    Args:
+        signals: (n_series, n_samples) array-like; memory maps are read one
+            chunk of rows at a time
+        sample_rate: Samples per unit time (sets the frequency axis)
+        window_size: Samples per STFT frame
+        hop: Samples between frame starts (default window_size // 2)
+        rolloff: Fraction of power defining the rolloff frequency
+        detrend: Remove each frame's mean before windowing
+        chunk_size: Series per FFT batch
+        per_frame: Also return the frame-level centroid, rolloff and flux
+        workers: FFT threads (scipy only)
+
+    Returns:
+        {"centroid", "rolloff", "flux": (n_series,) means over frames,
+         "envelope": (n_series, n_bins) mean power spectrum,
+         "envelope_shape": (n_series,) codes into ENVELOPE_SHAPES,
+         "frequencies": (n_bins,)}
+        plus "centroid_frames", "rolloff_frames" (n_series, n_frames) and
+        "flux_frames" (n_series, n_frames - 1) when ``per_frame`` is set.
+    """
+    if not hasattr(signals, "shape"):
+        signals = np.asarray(signals, dtype=np.float64)
+    if signals.ndim == 1:
+        signals = signals[None, :]
+    n_series, n_samples = signals.shape
+    hop = window_size // 2 if hop is None else hop
+    n_frames = 1 + (n_samples - window_size) // hop if n_samples >= window_size else 0
+    frequencies = _fft.rfftfreq(window_size, d=1.0 / sample_rate)
+    n_bins = len(frequencies)
+
+    result = {
+        "centroid": np.empty(n_series),
+        "rolloff": np.empty(n_series),
+        "flux": np.zeros(n_series),
+        "envelope": np.empty((n_series, n_bins)),
+    }
+    if per_frame:
+        result["centroid_frames"] = np.empty((n_series, n_frames))
+        result["rolloff_frames"] = np.empty((n_series, n_frames))
+        result["flux_frames"] = np.empty((n_series, max(n_frames - 1, 0)))
+
+    for start in range(0, n_series, chunk_size):
+        rows = slice(start, min(start + chunk_size, n_series))
+        power = stft_power(signals[rows], window_size, hop, detrend, workers)
+        features = spectral_features(power, frequencies, rolloff)
+        del power
+
+        result["centroid"][rows] = features["centroid"].mean(axis=-1)
+        result["rolloff"][rows] = features["rolloff"].mean(axis=-1)
+        if n_frames > 1:
+            result["flux"][rows] = features["flux"].mean(axis=-1)
+        result["envelope"][rows] = features["envelope"]
+        if per_frame:
+            result["centroid_frames"][rows] = features["centroid"]
+            result["rolloff_frames"][rows] = features["rolloff"]
+            result["flux_frames"][rows] = features["flux"]
+
+    result["envelope_shape"] = envelope_shape(result["envelope"])
+    result["frequencies"] = frequencies
+    return result
+
+
+def harmonic_profile(
+    harmonics: Sequence[Sequence[float]],
+    fundamental_frequency: float = 1.0,
+    rolloff: float = ROLLOFF_FRACTION
+) -> Dict[str, np.ndarray]:
+    """
+    Centroid, rolloff and envelope shape for a batch of harmonic amplitude
+    lists (the theory's ``calculate_timbre_info`` inputs), vectorized.
+
+    Args:
+        harmonics: (n, n_harmonics) amplitudes; harmonic k sits at
+            k * fundamental_frequency
+        fundamental_frequency: Frequency of the first harmonic
+        rolloff: Fraction of energy defining the rolloff frequency
+
+    Returns:
+        {"centroid": (n,), "rolloff": (n,), "envelope_shape": (n,)}
+    """
+    h = np.atleast_2d(np.asarray(harmonics, dtype=np.float64))
+    frequencies = fundamental_frequency * np.arange(1, h.shape[-1] + 1)
+    total = h.sum(axis=-1)
+    safe_total = np.where(total > 0, total, 1.0)
+    reached = np.cumsum(h, axis=-1) >= rolloff * total[:, None]
+    return {
+        "centroid": (h @ frequencies) / safe_total,
+        "rolloff": frequencies[np.argmax(reached, axis=-1)],
+        "envelope_shape": envelope_shape(h),
+    }
@@ -7,15 +7,73 @@ Core mathematical models for information flow components:
 - Inductance (L_info): Processing delays and inertia
 - Capacity (C_info): Knowledge accumulation and retention
 - Voltage (U_info): Information quality and influence
+- Content: Text features for U_info, streamed over document corpora
 - Ohm's Law: Complete information flow equations
+- Transformers (T_info): Format conversion and transformation pipelines
+- Energy (E_info): Cognitive energy accounting and shift fatigue forecasts
+- Retention: Stored information over exposure logs with exponential or power-law decay
+- Cascades: Monte Carlo spread of content over CSR social graphs
+- Influence: Seed selection by RR-set sampling and lazy-greedy (CELF) coverage
+- Scoring: Vectorized evaluation of all quantities for tables of profiles
 """
 
-from .conductivity import calculate_g_info
-from .resistance import calculate_r_info
-from .inductance import calculate_l_info  
-from .capacity import calculate_c_info
-from .voltage import calculate_u_info
-from .ohms_law import calculate_flow_rate, calculate_impedance
+import importlib
+
+# Submodules are imported on first access; see infodynamics.__getattr__
+_LAZY_ATTRIBUTES = {
+    'calculate_g_info': '.conductivity',
+    'calculate_g_info_batch': '.conductivity',
+    'calculate_g_info_social': '.conductivity',
+    'calculate_g_info_social_batch': '.conductivity',
+    'calculate_r_info': '.resistance',
+    'calculate_r_info_batch': '.resistance',
+    'calculate_l_info': '.inductance',
+    'calculate_l_info_batch': '.inductance',
+    'calculate_c_info': '.capacity',
+    'calculate_c_info_batch': '.capacity',
+    'capacity_context_table': '.capacity',
+    'calculate_u_info': '.voltage',
+    'calculate_u_info_batch': '.voltage',
+    'compile_voltage_weights': '.voltage',
+    'content_profile': '.content',
+    'featurize_content': '.content',
+    'featurize_corpus': '.content',
+    'calculate_flow_rate': '.ohms_law',
+    'calculate_flow_rate_batch': '.ohms_law',
+    'calculate_impedance': '.ohms_law',
+    'calculate_t_info': '.transformers',
+    'calculate_t_info_batch': '.transformers',
+    'reduce_transformer_cascade': '.transformers',
+    'rank_pipelines': '.transformers',
+    'calculate_e_info': '.energy',
+    'calculate_e_info_batch': '.energy',
+    'forecast_shift_energy': '.energy',
+    'iter_retention': '.retention',
+    'adoption_probability': '.cascade',
+    'run_cascade': '.cascade',
+    'simulate_cascades': '.cascade',
+    'sample_rr_sets': '.influence',
+    'select_seeds': '.influence',
+    'simulate_retention': '.retention',
+    'INPUT_COLUMNS': '.scoring',
+    'QUANTITIES': '.scoring',
+    'score_batch': '.scoring',
+    'score_population': '.scoring',
+    'rescore_population': '.scoring',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
     'calculate_g_info',
@@ -25,4 +83,36 @@ __all__ = [
     'calculate_u_info',
     'calculate_flow_rate',
     'calculate_impedance',
+    'calculate_t_info',
+    'calculate_e_info',
+    'calculate_g_info_social',
+    'calculate_g_info_batch',
+    'calculate_g_info_social_batch',
+    'calculate_r_info_batch',
+    'calculate_l_info_batch',
+    'calculate_c_info_batch',
+    'capacity_context_table',
+    'calculate_u_info_batch',
+    'compile_voltage_weights',
+    'content_profile',
+    'featurize_content',
+    'featurize_corpus',
+    'calculate_flow_rate_batch',
+    'calculate_t_info_batch',
+    'reduce_transformer_cascade',
+    'rank_pipelines',
+    'calculate_e_info_batch',
+    'forecast_shift_energy',
+    'iter_retention',
+    'adoption_probability',
+    'run_cascade',
+    'simulate_cascades',
+    'sample_rr_sets',
+    'select_seeds',
+    'simulate_retention',
+    'INPUT_COLUMNS',
+    'QUANTITIES',
+    'score_batch',
+    'score_population',
+    'rescore_population',
 ] 
\ No newline at end of file
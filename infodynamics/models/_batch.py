@@ -0,0 +1,31 @@
+"""Column access helpers shared by the batch (array) versions of the models."""
+
+from typing import Any, Mapping
+
+import numpy as np
+
+
+def batch_length(data: Mapping[str, Any]) -> int:
+    """Number of rows in a DataFrame or a mapping of equal-length columns."""
+    if hasattr(data, "shape"):
+        return data.shape[0]
+    for value in data.values():
+        if np.ndim(value) > 0:
+            return len(value)
+    return 1
+
+
+def column(data: Mapping[str, Any], key: str, default: float, n: int) -> np.ndarray:
+    """
+    Column ``key`` as float64, mirroring ``profile.get(key, default)``.
+
+    Missing columns and missing values (NaN, e.g. absent JSONL keys or empty
+    CSV cells) take the scalar model's default.
+    """
+    if data is None or key not in data:
+        return np.full(n, default, dtype=np.float64)
+
+    values = np.asarray(data[key], dtype=np.float64)
+    if values.ndim == 0:
+        return np.full(n, float(values) if not np.isnan(values) else default)
+    return np.where(np.isnan(values), default, values)
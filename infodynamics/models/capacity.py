@@ -1,9 +1,239 @@
-"""Information Capacity Model (C_info) - placeholder"""
-
-def calculate_c_info(agent_profile, context=None):
-    """Calculate information capacity (knowledge accumulation)."""
-    # Simple version based on working memory and expertise
-    wm = agent_profile.get("working_memory", 7.0) / 10.0
-    expertise = agent_profile.get("expertise", 0.5)
-    motivation = agent_profile.get("motivation", 0.7)
-    return 3.0 * wm + 2.0 * expertise + 1.0 * motivation 
\ No newline at end of file
+"""
+Information Capacity Model (C_info)
+
+Ability to store and maintain information, in "info-farads" (0.1-20):
+
+    C_info = Storage_Capacity × Retention_Factor × Access_Efficiency × Individual_Multipliers
+
+times a context multiplier (stress, fatigue, task complexity, distraction,
+circadian rhythm). See theory/information_capacity_model.md.
+
+- Storage capacity: digit, spatial and verbal spans, normalized and weighted
+- Retention factor: maintenance efficiency, decay resistance, rehearsal
+  ability, interference resistance
+- Access efficiency: retrieval speed and accuracy, random access, updating
+- Individual multipliers: age, cognitive training, domain expertise,
+  attention control
+
+Profiles in the package's general schema (``PRESET_PROFILES``, scoring
+tables) describe agents by working_memory (items, 0-10), expertise and
+attention_selectivity; these stand for digit_span, domain_expertise and
+attention_control where the theory's own fields are missing
+(CAPACITY_ALIASES).
+
+The model is implemented once, column-wise (``calculate_c_info_batch``);
+``calculate_c_info`` evaluates it on a single row. The context multiplier
+depends only on the context, so populations that share a few contexts
+(shifts, task types, time slots) can precompute it per context with
+``capacity_context_table`` and pass integer context codes per row.
+"""
+
+from typing import Any, Dict, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from ..utils import metrics as _metrics
+from ._batch import batch_length, column
+
+
+# Span -> (default, normalizing maximum, weight)
+SPANS = {
+    "digit_span": (7.0, 12.0, 0.4),
+    "spatial_span": (5.0, 10.0, 0.3),
+    "verbal_span": (6.0, 10.0, 0.3),
+}
+
+# Component -> (default, weight)
+RETENTION_FACTORS = {
+    "maintenance_efficiency": (0.7, 0.3),
+    "decay_resistance": (0.6, 0.3),
+    "rehearsal_ability": (0.7, 0.2),
+    "interference_resistance": (0.6, 0.2),
+}
+ACCESS_FACTORS = {
+    "retrieval_speed": (0.7, 0.3),
+    "retrieval_accuracy": (0.8, 0.3),
+    "random_access_ability": (0.7, 0.2),
+    "update_efficiency": (0.6, 0.2),
+}
+
+# Every profile column read by the model
+CAPACITY_COLUMNS = (
+    tuple(SPANS) + tuple(RETENTION_FACTORS) + tuple(ACCESS_FACTORS) +
+    ("age", "cognitive_training", "domain_expertise", "attention_control")
+)
+
+# Theory field -> general profile field used in its place when it is missing
+CAPACITY_ALIASES = {
+    "digit_span": "working_memory",
+    "domain_expertise": "expertise",
+    "attention_control": "attention_selectivity",
+}
+
+CONTEXT_KEYS = ("stress_level", "fatigue_level", "task_complexity", "distraction_level", "time_of_day")
+
+C_SCALE = 20.0
+C_MIN = 0.1
+C_MAX = 20.0
+
+
+def _field(profiles: Mapping[str, Any], key: str, default: float, n: int) -> np.ndarray:
+    """``column`` with the CAPACITY_ALIASES fallback; the theory field wins where it has a value."""
+    alias = CAPACITY_ALIASES.get(key)
+    if alias is None or alias not in profiles:
+        return column(profiles, key, default, n)
+    if key not in profiles:
+        return column(profiles, alias, default, n)
+    values = column(profiles, key, np.nan, n)
+    return np.where(np.isnan(values), column(profiles, alias, default, n), values)
+
+
+def _weighted(profiles: Mapping[str, Any], factors: Mapping[str, tuple], n: int) -> np.ndarray:
+    total = np.zeros(n)
+    for key, (default, weight) in factors.items():
+        total += weight * column(profiles, key, default, n)
+    return total
+
+
+def _age_factor(age: np.ndarray) -> np.ndarray:
+    """1.0 up to 25, -0.5%/year to 40, then -1%/year from 25 with a 0.6 floor."""
+    return np.where(
+        age <= 25, 1.0,
+        np.where(age <= 40, 1.0 - 0.005 * (age - 25), np.maximum(0.6, 1.0 - 0.01 * (age - 25)))
+    )
+
+
+def calculate_circadian_capacity_factor(hour):
+    """Capacity modifier for the time of day (0-24 h): ±15% around noon/midnight, 0.7-1.3."""
+    hour = np.asarray(hour, dtype=np.float64)
+    factor = np.clip(np.sin(2 * np.pi * (hour / 24.0 - 0.25)) * 0.15 + 1.0, 0.7, 1.3)
+    return float(factor) if factor.ndim == 0 else factor
+
+
+def _context_multiplier(context: Mapping[str, Any], n: int) -> np.ndarray:
+    penalty = (
+        0.3 * column(context, "stress_level", 0.0, n) +
+        0.3 * column(context, "fatigue_level", 0.0, n) +
+        0.2 * np.minimum(0.5, column(context, "task_complexity", 0.5, n)) +  # complex tasks use some capacity
+        0.2 * column(context, "distraction_level", 0.0, n)
+    )
+    multiplier = np.maximum(0.3, 1.0 - penalty)
+    if "time_of_day" in context:
+        hour = np.broadcast_to(np.asarray(context["time_of_day"], dtype=np.float64), (n,))
+        multiplier *= np.where(np.isnan(hour), 1.0, calculate_circadian_capacity_factor(hour))
+    return multiplier
+
+
+def capacity_context_table(contexts) -> np.ndarray:
+    """
+    Context multiplier (context modifier × circadian factor) of each context.
+
+    Args:
+        contexts: Sequence of context dicts (None or {} = no context, 1.0),
+            or a DataFrame / mapping of columns with one row per context;
+            a missing or NaN ``time_of_day`` skips the circadian factor
+
+    Returns:
+        Array of multipliers, one per context, to index with per-row
+        context codes (see ``calculate_c_info_batch``)
+    """
+    if hasattr(contexts, "keys"):
+        return _context_multiplier(contexts, batch_length(contexts))
+
+    contexts = list(contexts)
+    active = np.array([bool(c) for c in contexts])
+    columns = {
+        key: np.array([c.get(key, np.nan) if c else np.nan for c in contexts], dtype=np.float64)
+        for key in CONTEXT_KEYS
+    }
+    return np.where(active, _context_multiplier(columns, len(contexts)), 1.0)
+
+
+def _c_info(profiles: Mapping[str, Any], n: int, multiplier) -> np.ndarray:
+    # 1. Storage capacity
+    C = np.zeros(n)
+    for key, (default, maximum, weight) in SPANS.items():
+        C += weight * np.minimum(1.0, _field(profiles, key, default, n) / maximum)
+
+    # 2-3. Retention and access
+    C *= _weighted(profiles, RETENTION_FACTORS, n)
+    C *= _weighted(profiles, ACCESS_FACTORS, n)
+
+    # 4. Individual multipliers
+    C *= _age_factor(column(profiles, "age", 30.0, n))
+    C *= 1.0 + 0.3 * column(profiles, "cognitive_training", 0.0, n)
+    C *= 1.0 + 0.2 * _field(profiles, "domain_expertise", 0.5, n)
+    C *= 0.7 + 0.3 * _field(profiles, "attention_control", 0.7, n)
+
+    # 5. Context, then scaling to 0.1-20
+    C *= multiplier
+    C *= C_SCALE
+    return np.clip(C, C_MIN, C_MAX, out=C)
+
+
+def calculate_c_info(agent_profile: Dict[str, float], context: Optional[Dict[str, float]] = None) -> float:
+    """
+    Calculate Information Capacity - ability to store and maintain information.
+
+    Args:
+        agent_profile: Cognitive characteristics:
+            - digit_span (items, default 7; or working_memory), spatial_span (5),
+              verbal_span (6)
+            - maintenance_efficiency, decay_resistance, rehearsal_ability,
+              interference_resistance (0-1)
+            - retrieval_speed, retrieval_accuracy, random_access_ability,
+              update_efficiency (0-1)
+            - age (years), cognitive_training, domain_expertise (or
+              expertise), attention_control (or attention_selectivity) (0-1)
+        context: Optional stress_level, fatigue_level, task_complexity,
+            distraction_level (0-1) and time_of_day (hour, 0-24)
+
+    Returns:
+        C_info: Information capacity (0.1-20 "info-farads")
+    """
+    if _metrics.enabled:
+        _metrics.record_call("calculate_c_info")
+    multiplier = capacity_context_table([context]) if context else 1.0
+    return float(_c_info(agent_profile, 1, multiplier)[0])
+
+
+def calculate_c_info_batch(
+    profiles: Mapping[str, Any],
+    context: Union[Mapping[str, Any], Sequence[Optional[Mapping[str, Any]]], np.ndarray, None] = None,
+    context_index: Optional[Any] = None
+) -> np.ndarray:
+    """
+    Calculate C_info for many agents at once.
+
+    Same model as ``calculate_c_info``. Missing columns or values take the
+    scalar defaults.
+
+    Args:
+        profiles: DataFrame or mapping of column -> array (CAPACITY_COLUMNS)
+        context: Without ``context_index``: a mapping of context column ->
+            array or scalar applied row by row, or one context per row (a
+            sequence of dicts or a ``capacity_context_table`` table); None:
+            no context. With ``context_index``: the distinct contexts (a
+            sequence of dicts, a DataFrame, or a table from
+            ``capacity_context_table``)
+        context_index: Optional integer array giving each row's context
+
+    Returns:
+        Array of C_info values (0.1-20 range)
+    """
+    n = batch_length(profiles)
+    if _metrics.enabled:
+        _metrics.record_batch("calculate_c_info_batch", n)
+
+    if context_index is not None:
+        table = context if isinstance(context, np.ndarray) else capacity_context_table(context)
+        multiplier = table[np.asarray(context_index)]
+    elif context is None or len(context) == 0:
+        multiplier = 1.0
+    elif isinstance(context, np.ndarray) or not hasattr(context, "keys"):
+        multiplier = context if isinstance(context, np.ndarray) else capacity_context_table(context)
+        if len(multiplier) != n:
+            raise ValueError(f"Expected {n} per-row contexts, got {len(multiplier)}")
+    else:
+        multiplier = _context_multiplier(context, n)
+    return _c_info(profiles, n, multiplier)
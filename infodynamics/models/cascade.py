@@ -0,0 +1,229 @@
+"""
+Information Cascade Simulation
+
+Spread of one piece of content through a network of agents, as an
+independent cascade driven by the flow model: when agent u adopts, each
+follower v that has not adopted yet adopts in the next step with
+probability
+
+    p(u -> v) = w(u, v) × flow_rate(U_info, G_info(v)) / 100
+
+where U_info is the content voltage (``calculate_u_info``), G_info(v) the
+follower's conductivity (individual or social, ``calculate_g_info_batch`` /
+``calculate_g_info_social_batch``) and w the tie strength. A follower
+reached by several adopters gets one independent chance per adopter, so
+adoption rises with the number of adopting neighbors.
+
+The graph is a ``utils.graph.CSRGraph`` (edge u -> v: v sees u's
+adoptions). Steps are synchronous and frontier-based: only the out-edges of
+the nodes that adopted in the previous step are visited, gathered from CSR
+row ranges in one vectorized pass, so a run costs O(edges touched).
+
+Monte Carlo runs are seeded: run i draws from ``SeedSequence(seed).spawn(n_runs)[i]``,
+so results are identical for any number of worker processes. Workers
+receive the graph once (as its path when it was loaded memory-mapped with
+``CSRGraph.load``) and the per-node probabilities once.
+
+Example:
+    >>> graph = CSRGraph.load("graph")
+    >>> p = adoption_probability(content, profiles)
+    >>> result = simulate_cascades(graph, p, sources=[42], n_runs=2000, n_workers=8)
+    >>> result["expected_reach"], result["reach_stderr"]
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..utils import metrics as _metrics
+from ..utils.graph import CSRGraph
+from .conductivity import calculate_g_info_batch, calculate_g_info_social_batch
+from .ohms_law import calculate_flow_rate_batch
+from .voltage import calculate_u_info
+
+
+def adoption_probability(
+    content_profile: Mapping[str, float],
+    profiles: Optional[Mapping[str, Any]] = None,
+    conductivity: Optional[np.ndarray] = None,
+    social: bool = False
+) -> np.ndarray:
+    """
+    Per-node probability of adopting the content once exposed:
+    flow_rate(U_info, G_info) / 100.
+
+    Args:
+        content_profile: Content characteristics for ``calculate_u_info``
+        profiles: Agent profiles (DataFrame or column mapping), one row per node
+        conductivity: Precomputed G_info per node (instead of ``profiles``)
+        social: Use the social conductivity (echo chambers, social proof)
+
+    Returns:
+        Array of probabilities (0-1), one per node
+    """
+    if conductivity is None:
+        if profiles is None:
+            raise ValueError("Give agent profiles or a conductivity array")
+        conductivity = (calculate_g_info_social_batch if social else calculate_g_info_batch)(profiles)
+    voltage = calculate_u_info(content_profile)
+    return calculate_flow_rate_batch(voltage, conductivity) / 100.0
+
+
+def _check_inputs(graph: CSRGraph, activation, sources) -> Tuple[np.ndarray, np.ndarray]:
+    activation = np.asarray(activation, dtype=np.float64)
+    if activation.shape != (graph.n_nodes,):
+        raise ValueError(f"Expected {graph.n_nodes} adoption probabilities, got shape {activation.shape}")
+    sources = np.unique(np.asarray(sources, dtype=np.int64))
+    if len(sources) and (sources[0] < 0 or sources[-1] >= graph.n_nodes):
+        raise ValueError("Source nodes out of range")
+    return activation, sources
+
+
+def _spread(graph: CSRGraph, activation: np.ndarray, sources: np.ndarray, adopted: np.ndarray,
+            rng: np.random.Generator, max_steps: Optional[int]) -> List[np.ndarray]:
+    """
+    One cascade; returns the nodes adopting at each step (sources first).
+    ``adopted`` is left marked for those nodes; the caller resets it.
+    """
+    frontier = sources
+    adopted[frontier] = True
+    waves = [frontier]
+    while len(frontier) and (max_steps is None or len(waves) <= max_steps):
+        edges = graph.edges_from(frontier)
+        if not len(edges):
+            break
+        targets = graph.indices[edges]
+        p = activation[targets]
+        if graph.weights is not None:
+            p = p * graph.weights[edges]
+        targets = targets[rng.random(len(edges)) < p]
+        frontier = np.unique(targets[~adopted[targets]])
+        if not len(frontier):
+            break
+        adopted[frontier] = True
+        waves.append(frontier)
+    return waves
+
+
+def run_cascade(
+    graph: CSRGraph,
+    activation,
+    sources: Sequence[int],
+    seed: Optional[int] = None,
+    max_steps: Optional[int] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Simulate a single cascade.
+
+    Args:
+        graph: Follower graph (u -> v: v sees u's adoption)
+        activation: Per-node adoption probability (``adoption_probability``)
+        sources: Nodes that publish the content at step 0
+        seed: Random seed
+        max_steps: Optional limit on the number of steps
+
+    Returns:
+        {"nodes": adopters in adoption order, "step": step of each adoption}
+    """
+    activation, sources = _check_inputs(graph, activation, sources)
+    adopted = np.zeros(graph.n_nodes, dtype=bool)
+    waves = _spread(graph, activation, sources, adopted, np.random.default_rng(seed), max_steps)
+    return {
+        "nodes": np.concatenate(waves),
+        "step": np.repeat(np.arange(len(waves)), [len(wave) for wave in waves]),
+    }
+
+
+# Per-process state for Monte Carlo workers, set once by _init_worker
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(graph: CSRGraph, activation: np.ndarray, sources: np.ndarray,
+                 max_steps: Optional[int], track_nodes: bool) -> None:
+    _WORKER.update(graph=graph, activation=activation, sources=sources,
+                   max_steps=max_steps, track_nodes=track_nodes)
+
+
+def _run_batch(seeds: Sequence[np.random.SeedSequence]) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+    graph = _WORKER["graph"]
+    adopted = np.zeros(graph.n_nodes, dtype=bool)
+    counts = np.zeros(graph.n_nodes, dtype=np.int32) if _WORKER["track_nodes"] else None
+    reach = np.empty(len(seeds), dtype=np.int64)
+    steps = np.empty(len(seeds), dtype=np.int64)
+    for i, seq in enumerate(seeds):
+        waves = _spread(graph, _WORKER["activation"], _WORKER["sources"], adopted,
+                        np.random.default_rng(seq), _WORKER["max_steps"])
+        nodes = np.concatenate(waves)
+        reach[i] = len(nodes)
+        steps[i] = len(waves) - 1
+        if counts is not None:
+            counts[nodes] += 1
+        adopted[nodes] = False
+    return reach, steps, counts
+
+
+def simulate_cascades(
+    graph: CSRGraph,
+    activation,
+    sources: Sequence[int],
+    n_runs: int = 1000,
+    seed: int = 0,
+    n_workers: int = 1,
+    max_steps: Optional[int] = None,
+    track_nodes: bool = False
+) -> Dict[str, Any]:
+    """
+    Monte Carlo estimate of the reach of a cascade.
+
+    Args:
+        graph: Follower graph (u -> v: v sees u's adoption)
+        activation: Per-node adoption probability (``adoption_probability``)
+        sources: Nodes that publish the content at step 0
+        n_runs: Number of simulated cascades
+        seed: Root seed; run i uses SeedSequence(seed).spawn(n_runs)[i]
+        n_workers: Worker processes; does not change the results
+        max_steps: Optional limit on the number of steps per run
+        track_nodes: Also return how often each node adopted
+
+    Returns:
+        Dictionary with reach and steps per run, expected_reach,
+        reach_std, reach_stderr, and adoption_frequency (per node, share
+        of runs) when ``track_nodes`` is set
+    """
+    if n_runs < 1:
+        raise ValueError(f"n_runs must be at least 1, got {n_runs}")
+    activation, sources = _check_inputs(graph, activation, sources)
+    seeds = np.random.SeedSequence(seed).spawn(n_runs)
+    if _metrics.enabled:
+        _metrics.record_batch("simulate_cascades", n_runs)
+
+    init_args = (graph, activation, sources, max_steps, track_nodes)
+    if n_workers <= 1:
+        _init_worker(*init_args)
+        try:
+            parts = [_run_batch(seeds)]
+        finally:
+            _WORKER.clear()
+    else:
+        # A few batches per worker balances uneven cascade sizes
+        n_batches = min(n_runs, 4 * n_workers)
+        bounds = np.linspace(0, n_runs, n_batches + 1).astype(int)
+        batches = [seeds[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker, initargs=init_args) as executor:
+            parts = list(executor.map(_run_batch, batches))
+
+    reach = np.concatenate([part[0] for part in parts])
+    result = {
+        "reach": reach,
+        "steps": np.concatenate([part[1] for part in parts]),
+        "expected_reach": float(reach.mean()),
+        "reach_std": float(reach.std(ddof=1)) if n_runs > 1 else 0.0,
+    }
+    result["reach_stderr"] = result["reach_std"] / np.sqrt(n_runs) if n_runs > 1 else 0.0
+    if track_nodes:
+        counts = np.zeros(graph.n_nodes, dtype=np.int64)
+        for part in parts:
+            counts += part[2]
+        result["adoption_frequency"] = counts / n_runs
+    return result
@@ -12,7 +12,20 @@ Based on:
 """
 
 import numpy as np
-from typing import Dict, Union, Optional
+from typing import Any, Dict, Mapping, Union, Optional
+
+from ..utils import metrics as _metrics
+from ._batch import batch_length, column
+
+
+# Default weights based on literature review
+DEFAULT_WEIGHTS = {
+    "working_memory": 0.30,      # Strongest predictor
+    "attention_selectivity": 0.25,
+    "motivation": 0.20,
+    "expertise": 0.15,
+    "processing_speed": 0.10
+}
 
 
 def calculate_g_info(
@@ -53,15 +66,8 @@ def calculate_g_info(
         >>> print(f"G_info = {G:.2f}")
     """
     
-    # Default weights based on literature review
     if weights is None:
-        weights = {
-            "working_memory": 0.30,      # Strongest predictor
-            "attention_selectivity": 0.25,
-            "motivation": 0.20,
-            "expertise": 0.15,
-            "processing_speed": 0.10
-        }
+        weights = DEFAULT_WEIGHTS
     
     # Extract agent characteristics with defaults
     wm = agent_profile.get("working_memory", 7.0)  # Miller's 7±2
@@ -103,9 +109,77 @@ def calculate_g_info(
     # High conductivity is harder to achieve
     G_scaled = 10.0 * (1.0 / (1.0 + np.exp(-6.0 * (G_modified - 0.5))))
     
+    if _metrics.enabled:
+        _metrics.record_call("calculate_g_info")
+        if G_scaled < 0.1 or G_scaled > 10.0:
+            _metrics.inc("infodynamics_g_info_clamped_total", bound="low" if G_scaled < 0.1 else "high")
+    
     return max(0.1, min(10.0, G_scaled))
 
 
+def calculate_g_info_batch(
+    profiles: Mapping[str, Any],
+    context: Optional[Mapping[str, Any]] = None,
+    weights: Optional[Dict[str, float]] = None
+) -> np.ndarray:
+    """
+    Calculate G_info for many agents at once.
+    
+    Same model as ``calculate_g_info``, evaluated column-wise on arrays.
+    
+    Args:
+        profiles: DataFrame or mapping of column -> array with the
+            ``agent_profile`` keys. Missing columns or values take the
+            same defaults as the scalar function.
+        context: Optional mapping with the ``context`` keys (arrays or
+            scalars). If None, context columns found in ``profiles`` are
+            used; absent context factors count as 0.
+        weights: Optional component weights
+    
+    Returns:
+        Array of G_info values (0.1-10 scale)
+    """
+    if weights is None:
+        weights = DEFAULT_WEIGHTS
+    if context is None:
+        context = profiles
+    
+    n = batch_length(profiles)
+    wm_normalized = np.clip(column(profiles, "working_memory", 7.0, n) / 10.0, 0.0, 1.0)
+    
+    G_base = (
+        weights["working_memory"] * wm_normalized +
+        weights["attention_selectivity"] * column(profiles, "attention_selectivity", 0.7, n) +
+        weights["motivation"] * column(profiles, "motivation", 0.7, n) +
+        weights["expertise"] * column(profiles, "expertise", 0.5, n) +
+        weights["processing_speed"] * column(profiles, "processing_speed", 0.7, n)
+    )
+    
+    context_penalty = (
+        0.3 * column(context, "distraction_level", 0.0, n) +
+        0.2 * column(context, "time_pressure", 0.0, n) +
+        0.5 * column(context, "fatigue", 0.0, n)
+    )
+    G_modified = G_base * (1.0 - 0.5 * context_penalty)
+    
+    G_scaled = 10.0 * (1.0 / (1.0 + np.exp(-6.0 * (G_modified - 0.5))))
+    
+    if _metrics.enabled:
+        _metrics.record_batch("calculate_g_info_batch", n)
+        _record_clamps(G_scaled)
+    
+    return np.clip(G_scaled, 0.1, 10.0)
+
+
+def _record_clamps(G_scaled: np.ndarray) -> None:
+    low = int(np.count_nonzero(G_scaled < 0.1))
+    high = int(np.count_nonzero(G_scaled > 10.0))
+    if low:
+        _metrics.inc("infodynamics_g_info_clamped_total", low, bound="low")
+    if high:
+        _metrics.inc("infodynamics_g_info_clamped_total", high, bound="high")
+
+
 def calculate_g_info_social(
     agent_profile: Dict[str, float],
     social_context: Dict[str, float],
@@ -140,9 +214,56 @@ def calculate_g_info_social(
     
     G_social = G_individual * (1.0 - echo_penalty + social_boost)
     
+    if _metrics.enabled:
+        _metrics.record_call("calculate_g_info_social")
+        if G_social < 0.1 or G_social > 10.0:
+            _metrics.inc("infodynamics_g_info_clamped_total", bound="low" if G_social < 0.1 else "high")
+    
     return max(0.1, min(10.0, G_social))
 
 
+def calculate_g_info_social_batch(
+    profiles: Mapping[str, Any],
+    social_context: Optional[Mapping[str, Any]] = None,
+    weights: Optional[Dict[str, float]] = None
+) -> np.ndarray:
+    """
+    Calculate G_info_social for many agents at once.
+    
+    Same model as ``calculate_g_info_social``: the individual conductivity
+    is evaluated without context factors, then scaled by the social
+    modifiers.
+    
+    Args:
+        profiles: DataFrame or mapping of column -> array with the
+            ``agent_profile`` keys
+        social_context: Optional mapping with echo_chamber_strength,
+            social_proof and network_diversity (arrays or scalars). If None,
+            these columns are read from ``profiles``.
+        weights: Optional component weights
+    
+    Returns:
+        Array of G_info_social values (0.1-10 scale)
+    """
+    if social_context is None:
+        social_context = profiles
+    
+    n = batch_length(profiles)
+    G_individual = calculate_g_info_batch(profiles, context={}, weights=weights)
+    
+    echo_chamber = column(social_context, "echo_chamber_strength", 0.0, n)
+    social_proof = column(social_context, "social_proof", 0.5, n)
+    diversity = column(social_context, "network_diversity", 0.7, n)
+    
+    G_social = G_individual * (1.0 - 0.3 * echo_chamber * (1.0 - diversity) + 0.2 * social_proof)
+    
+    if _metrics.enabled:
+        _metrics.record_batch("calculate_g_info_social_batch", n)
+        _record_clamps(G_social)
+    
+    return np.clip(G_social, 0.1, 10.0)
+
+
 def validate_agent_profile(profile: Dict[str, float]) -> bool:
     """Validate agent profile parameters are in correct ranges."""
     
@@ -0,0 +1,495 @@
+"""
+Information Energy Model (E_info)
+
+Cognitive resources spent on information processing, in "cognitive joules":
+
+    E_info = Processing_Energy + Storage_Energy + Transmission_Energy + Maintenance_Energy
+
+scaled by individual efficiency (age, training, expertise) and context
+(stress, fatigue, motivation, distraction). See
+theory/information_energy_model.md.
+
+- ``calculate_e_info`` / ``calculate_e_info_batch``: energy of one task, or
+  of arrays of (task, agent) pairs that broadcast against each other
+- ``calculate_stored_energy`` (½CU²), ``calculate_inductive_energy`` (½LI²),
+  ``calculate_information_power`` (P = U × I)
+- ``manage_cognitive_workload`` / ``manage_cognitive_workload_batch``: the
+  shift scenario with rest breaks inserted when the energy budget runs out
+- ``forecast_shift_energy``: cumulative energy and fatigue per time step for
+  a workforce following task schedules
+
+Time integration uses cumulative sums along the time axis. Quantities that
+cannot go below zero (energy used, fatigue) are integrated as reflected
+sums, x_t = S_t - min(0, min_{j<=t} S_j), which equals clamping at zero
+after every step, so rest periods need no per-step loop either.
+"""
+
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+import numpy as np
+
+from ..utils import metrics as _metrics
+
+
+# Rest break in the workload scenario: 15 minutes recover 50 energy units
+# and 0.2 fatigue
+BREAK_MINUTES = 15.0
+BREAK_ENERGY_RECOVERY = 50.0
+BREAK_FATIGUE_RECOVERY = 0.2
+
+# Shift budgets are a share of the daily budget relative to an 8-hour day
+WORKDAY_MINUTES = 480.0
+
+
+def _age_efficiency(age: float) -> float:
+    if age <= 25:
+        return 1.0
+    if age <= 50:
+        return 1.0 - 0.01 * (age - 25)  # 1% per year
+    return max(0.7, 1.0 - 0.015 * (age - 25))  # steeper decline
+
+
+def calculate_e_info(
+    task_profile: Dict[str, float],
+    agent_profile: Dict[str, float],
+    duration: float,
+    context: Optional[Dict[str, float]] = None
+) -> float:
+    """
+    Calculate Information Energy - cognitive resources spent on a task.
+
+    Args:
+        task_profile: Task characteristics:
+            - computational_complexity, cognitive_load, attention_demands (0-1)
+            - information_volume (items), storage_duration (seconds)
+            - transmission_volume (items), transmission_distance (hops),
+              transmission_fidelity (0-1)
+            - context_switches (count), domain_match (0-1)
+        agent_profile: Cognitive characteristics:
+            - processing_efficiency, cognitive_speed (0-1)
+            - working_memory_capacity (items), storage_efficiency (0-1)
+            - communication_efficiency, information_bandwidth (0-1)
+            - attention_maintenance_cost, arousal_maintenance_cost
+            - age (years), cognitive_training, domain_expertise (0-1)
+            - max_cognitive_energy (sustainable ceiling)
+        duration: Processing time (seconds)
+        context: Optional stress_level, fatigue_level, motivation,
+            distraction_level (0-1)
+
+    Returns:
+        E_info: Information energy in cognitive joules (0.1-100 range)
+    """
+
+    # 1. Processing: task demands, slowed by low efficiency and speed
+    base_processing_rate = (
+        0.4 * task_profile.get("computational_complexity", 0.5) +
+        0.3 * task_profile.get("cognitive_load", 0.5) +
+        0.3 * task_profile.get("attention_demands", 0.5)
+    )
+    processing_energy = (
+        base_processing_rate *
+        (2.0 - agent_profile.get("processing_efficiency", 0.7)) *
+        (2.0 - agent_profile.get("cognitive_speed", 0.7)) *
+        duration
+    )
+
+    # 2. Storage, with a penalty above 70% of working memory capacity
+    information_volume = task_profile.get("information_volume", 5.0)
+    capacity_utilization = information_volume / agent_profile.get("working_memory_capacity", 7.0)
+    storage_energy = (
+        information_volume *
+        task_profile.get("storage_duration", 30.0) *
+        (2.0 - agent_profile.get("storage_efficiency", 0.7)) *
+        (1.0 + 2.0 * max(0.0, capacity_utilization - 0.7)) *
+        0.01
+    )
+
+    # 3. Transmission
+    transmission_energy = (
+        task_profile.get("transmission_volume", 2.0) *
+        task_profile.get("transmission_distance", 1.0) *
+        task_profile.get("transmission_fidelity", 0.8) *
+        (2.0 - agent_profile.get("communication_efficiency", 0.7)) *
+        (2.0 - agent_profile.get("information_bandwidth", 0.7)) *
+        0.1
+    )
+
+    # 4. Maintenance: continuous low-level cost, plus context switches
+    maintenance_energy = (
+        agent_profile.get("attention_maintenance_cost", 0.3) +
+        agent_profile.get("arousal_maintenance_cost", 0.2) +
+        task_profile.get("context_switches", 0) * 0.5
+    ) * duration * 0.05
+
+    # 5. Individual efficiency
+    efficiency_factor = (
+        _age_efficiency(agent_profile.get("age", 30)) *
+        (1.0 - 0.2 * agent_profile.get("cognitive_training", 0.0)) *
+        (1.0 - 0.3 * agent_profile.get("domain_expertise", 0.5) * task_profile.get("domain_match", 0.5))
+    )
+
+    # 6. Context
+    if context:
+        context_modifier = (
+            (1.0 + 0.5 * context.get("stress_level", 0.0)) *
+            (1.0 + 0.8 * context.get("fatigue_level", 0.0)) *
+            (1.0 + 0.3 * context.get("distraction_level", 0.0)) /
+            (0.7 + 0.3 * context.get("motivation", 0.7))
+        )
+    else:
+        context_modifier = 1.0
+
+    total_energy = processing_energy + storage_energy + transmission_energy + maintenance_energy
+    adjusted_energy = total_energy * efficiency_factor * context_modifier
+
+    if _metrics.enabled:
+        _metrics.record_call("calculate_e_info")
+
+    # Cannot exceed the sustainable ceiling
+    final_energy = min(adjusted_energy, agent_profile.get("max_cognitive_energy", 50.0))
+    return max(0.1, min(100.0, final_energy))
+
+
+def _value(data: Optional[Mapping[str, Any]], key: str, default: float):
+    """Column ``key`` as a float64 array (NaN -> default), or ``default`` if absent."""
+    if data is None or key not in data:
+        return default
+    values = np.asarray(data[key], dtype=np.float64)
+    return np.where(np.isnan(values), default, values)
+
+
+def _shape(*mappings: Optional[Mapping[str, Any]]) -> tuple:
+    shapes = [np.shape(value) for data in mappings if data is not None for value in data.values()]
+    return np.broadcast_shapes(*shapes) if shapes else ()
+
+
+def calculate_e_info_batch(
+    tasks: Mapping[str, Any],
+    agents: Mapping[str, Any],
+    duration: Any,
+    context: Optional[Mapping[str, Any]] = None
+) -> np.ndarray:
+    """
+    Calculate E_info for arrays of (task, agent) pairs.
+
+    Same model as ``calculate_e_info``. Columns broadcast against each other
+    and against ``duration``: e.g. agent columns of shape (W, 1) with task
+    columns of shape (S,) or (W, S) give a (W, S) result.
+
+    Args:
+        tasks: DataFrame or mapping of task column -> array
+        agents: DataFrame or mapping of agent column -> array
+        duration: Processing time in seconds (scalar or array)
+        context: Optional mapping of context column -> array; if given
+            (and not empty) the context modifier applies, with the scalar
+            defaults for missing columns
+
+    Returns:
+        Array of E_info values (0.1-100 range)
+    """
+    duration = np.asarray(duration, dtype=np.float64)
+    shape = np.broadcast_shapes(_shape(tasks, agents, context), duration.shape)
+
+    def task(key, default):
+        return _value(tasks, key, default)
+
+    def agent(key, default):
+        return _value(agents, key, default)
+
+    processing_energy = (
+        (0.4 * task("computational_complexity", 0.5) +
+         0.3 * task("cognitive_load", 0.5) +
+         0.3 * task("attention_demands", 0.5)) *
+        (2.0 - agent("processing_efficiency", 0.7)) *
+        (2.0 - agent("cognitive_speed", 0.7)) *
+        duration
+    )
+
+    information_volume = task("information_volume", 5.0)
+    capacity_utilization = information_volume / agent("working_memory_capacity", 7.0)
+    storage_energy = (
+        information_volume *
+        task("storage_duration", 30.0) *
+        (2.0 - agent("storage_efficiency", 0.7)) *
+        (1.0 + 2.0 * np.maximum(0.0, capacity_utilization - 0.7)) *
+        0.01
+    )
+
+    transmission_energy = (
+        task("transmission_volume", 2.0) *
+        task("transmission_distance", 1.0) *
+        task("transmission_fidelity", 0.8) *
+        (2.0 - agent("communication_efficiency", 0.7)) *
+        (2.0 - agent("information_bandwidth", 0.7)) *
+        0.1
+    )
+
+    maintenance_energy = (
+        agent("attention_maintenance_cost", 0.3) +
+        agent("arousal_maintenance_cost", 0.2) +
+        task("context_switches", 0.0) * 0.5
+    ) * duration * 0.05
+
+    age = np.asarray(agent("age", 30.0))
+    age_efficiency = np.where(
+        age <= 25, 1.0,
+        np.where(age <= 50, 1.0 - 0.01 * (age - 25), np.maximum(0.7, 1.0 - 0.015 * (age - 25)))
+    )
+    efficiency_factor = (
+        age_efficiency *
+        (1.0 - 0.2 * agent("cognitive_training", 0.0)) *
+        (1.0 - 0.3 * agent("domain_expertise", 0.5) * task("domain_match", 0.5))
+    )
+
+    if context:
+        context_modifier = (
+            (1.0 + 0.5 * _value(context, "stress_level", 0.0)) *
+            (1.0 + 0.8 * _value(context, "fatigue_level", 0.0)) *
+            (1.0 + 0.3 * _value(context, "distraction_level", 0.0)) /
+            (0.7 + 0.3 * _value(context, "motivation", 0.7))
+        )
+    else:
+        context_modifier = 1.0
+
+    adjusted_energy = (
+        (processing_energy + storage_energy + transmission_energy + maintenance_energy) *
+        efficiency_factor * context_modifier
+    )
+    final_energy = np.minimum(adjusted_energy, agent("max_cognitive_energy", 50.0))
+    result = np.broadcast_to(np.clip(final_energy, 0.1, 100.0), shape)
+
+    if _metrics.enabled:
+        _metrics.record_batch("calculate_e_info_batch", result.size)
+
+    return np.array(result, dtype=np.float64)
+
+
+def calculate_energy_efficiency(energy_input: float, information_output: float) -> float:
+    """Information output per unit of energy, at most 1.0 (0 for no input)."""
+    if energy_input <= 0:
+        return 0.0
+    return min(1.0, information_output / energy_input)
+
+
+def calculate_information_power(voltage, current):
+    """Information power: P = U × I (scalars or arrays)."""
+    return voltage * current
+
+
+def calculate_stored_energy(capacity, voltage):
+    """Energy stored in information capacity: E = ½CU² (scalars or arrays)."""
+    return 0.5 * capacity * voltage ** 2
+
+
+def calculate_inductive_energy(inductance, current):
+    """Energy stored in information inductance: E = ½LI² (scalars or arrays)."""
+    return 0.5 * inductance * current ** 2
+
+
+def manage_cognitive_workload(
+    task_sequence: Sequence[Dict[str, float]],
+    worker_profile: Dict[str, float],
+    shift_duration: float
+) -> Dict[str, Any]:
+    """
+    Insert rest breaks into a task sequence to stay within the shift budget.
+
+    Each task costs E_info (over task["duration"]), raised by accumulated
+    fatigue; when a task would take the shift above 90% of its budget a
+    15-minute break is inserted first, recovering 50 energy units and 0.2
+    fatigue.
+
+    Args:
+        task_sequence: Task profiles in order, each with a "duration"
+        worker_profile: Agent profile, optionally with daily_energy_budget
+        shift_duration: Shift length in minutes (budget is pro rata of 480)
+
+    Returns:
+        Dictionary with schedule (tasks and inserted breaks), total_energy_used,
+        energy_efficiency (share of the shift budget) and fatigue_level
+    """
+    shift_energy_budget = worker_profile.get("daily_energy_budget", 1000.0) * (shift_duration / WORKDAY_MINUTES)
+
+    schedule = []
+    energy_used = 0.0
+    fatigue = 0.0
+
+    for task in task_sequence:
+        task_energy = calculate_e_info(task, worker_profile, task["duration"])
+        adjusted_energy = task_energy * (1.0 + 0.5 * fatigue)
+
+        if energy_used + adjusted_energy > shift_energy_budget * 0.9:
+            schedule.append({
+                "type": "rest_break",
+                "duration": BREAK_MINUTES,
+                "energy_recovery": BREAK_ENERGY_RECOVERY,
+            })
+            energy_used = max(0.0, energy_used - BREAK_ENERGY_RECOVERY)
+            fatigue = max(0.0, fatigue - BREAK_FATIGUE_RECOVERY)
+
+        schedule.append(task)
+        energy_used += adjusted_energy
+        fatigue += task_energy / 100.0
+
+    return {
+        "schedule": schedule,
+        "total_energy_used": energy_used,
+        "energy_efficiency": energy_used / shift_energy_budget,
+        "fatigue_level": fatigue,
+    }
+
+
+def _worker_columns(workers: Mapping[str, Any]) -> Dict[str, np.ndarray]:
+    """Worker columns as (W, 1) so they broadcast against (W, S) task arrays."""
+    return {key: np.asarray(workers[key], dtype=np.float64).reshape(-1, 1) for key in workers.keys()}
+
+
+def manage_cognitive_workload_batch(
+    tasks: Mapping[str, Any],
+    workers: Mapping[str, Any],
+    shift_duration: float,
+    task_mask: Optional[np.ndarray] = None
+) -> Dict[str, np.ndarray]:
+    """
+    ``manage_cognitive_workload`` for W workers with S tasks each.
+
+    Task energies for all (worker, task) pairs come from one
+    ``calculate_e_info_batch`` call. Whether a break precedes a task
+    depends on the state left by earlier breaks, so the break decision
+    steps through the S task positions, each step updating all W workers
+    at once.
+
+    Args:
+        tasks: Task columns of shape (W, S) or (S,), including "duration"
+        workers: Worker columns of shape (W,), optionally daily_energy_budget
+        shift_duration: Shift length in minutes
+        task_mask: Optional boolean (W, S) array; False marks padding after
+            a worker's last task
+
+    Returns:
+        Dictionary of arrays: breaks (W, S; True where a break precedes the
+        task), n_breaks, total_energy_used, energy_efficiency, fatigue_level
+    """
+    energy = np.atleast_2d(calculate_e_info_batch(tasks, _worker_columns(workers), tasks["duration"]))
+    n_workers = energy.shape[0]
+    valid = np.ones(energy.shape, dtype=bool) if task_mask is None else np.broadcast_to(task_mask, energy.shape)
+
+    budget = np.broadcast_to(_value(workers, "daily_energy_budget", 1000.0), (n_workers,)) * (shift_duration / WORKDAY_MINUTES)
+    threshold = 0.9 * budget
+    energy_used = np.zeros(n_workers)
+    fatigue = np.zeros(n_workers)
+    breaks = np.zeros(energy.shape, dtype=bool)
+
+    for s in range(energy.shape[1]):
+        task_energy = np.where(valid[:, s], energy[:, s], 0.0)
+        adjusted_energy = task_energy * (1.0 + 0.5 * fatigue)
+        take_break = valid[:, s] & (energy_used + adjusted_energy > threshold)
+        if take_break.any():
+            energy_used = np.where(take_break, np.maximum(0.0, energy_used - BREAK_ENERGY_RECOVERY), energy_used)
+            fatigue = np.where(take_break, np.maximum(0.0, fatigue - BREAK_FATIGUE_RECOVERY), fatigue)
+            breaks[:, s] = take_break
+        energy_used += adjusted_energy
+        fatigue += task_energy / 100.0
+
+    if _metrics.enabled:
+        _metrics.record_batch("manage_cognitive_workload_batch", n_workers)
+
+    return {
+        "breaks": breaks,
+        "n_breaks": breaks.sum(axis=1),
+        "total_energy_used": energy_used,
+        "energy_efficiency": energy_used / budget,
+        "fatigue_level": fatigue,
+    }
+
+
+def _reflected_cumsum(increments: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Running sum along the last axis, clamped at zero after every step (Lindley recursion)."""
+    total = np.cumsum(increments, axis=-1, out=out)
+    floor = np.minimum.accumulate(total, axis=-1)
+    np.minimum(floor, 0.0, out=floor)
+    total -= floor
+    return total
+
+
+def forecast_shift_energy(
+    task_catalog: Mapping[str, Any],
+    schedule: np.ndarray,
+    workers: Mapping[str, Any],
+    step_minutes: float = 1.0,
+    context: Optional[Mapping[str, Any]] = None,
+    chunk_workers: int = 2048
+) -> Dict[str, np.ndarray]:
+    """
+    Cumulative energy and fatigue per time step for a workforce.
+
+    Each step a worker either works on a catalog task (energy E_info over
+    the step, raised by fatigue as in ``manage_cognitive_workload``) or
+    rests (schedule index -1; recovery at the rest-break rate of 50 energy
+    and 0.2 fatigue per 15 minutes). E_info is evaluated once per (worker,
+    task type); the time integration is a pair of reflected cumulative sums
+    over the step axis, computed in chunks of ``chunk_workers`` rows.
+
+    Args:
+        task_catalog: K task types (DataFrame or mapping of column -> array)
+        schedule: Integer (W, T) array of catalog indices, -1 for rest
+        workers: Worker columns of shape (W,)
+        step_minutes: Length of one step (E_info duration = 60 * step_minutes s)
+        context: Optional context columns of shape (W,) or scalars
+        chunk_workers: Workers integrated at a time (bounds temporaries)
+
+    Returns:
+        Dictionary of (W, T) arrays: step_energy (fatigue-adjusted energy
+        spent in the step, negative while resting), energy_used (cumulative,
+        after the step) and fatigue (after the step)
+    """
+    schedule = np.asarray(schedule)
+    if schedule.ndim != 2:
+        raise ValueError("schedule must be a (workers, steps) array")
+    n_workers, n_steps = schedule.shape
+    n_tasks = len(next(iter(task_catalog.values()))) if task_catalog else 1
+    if schedule.max(initial=-1) >= n_tasks:
+        raise ValueError(f"Task index out of range (catalog has {n_tasks} tasks)")
+
+    catalog = {key: np.asarray(task_catalog[key]).reshape(1, -1) for key in task_catalog.keys()}
+    worker_columns = _worker_columns(workers)
+    context_columns = None if not context else {
+        key: np.asarray(value, dtype=np.float64).reshape(-1, 1) if np.ndim(value) else value
+        for key, value in context.items()
+    }
+
+    rest_energy = -BREAK_ENERGY_RECOVERY * step_minutes / BREAK_MINUTES
+    rest_fatigue = -BREAK_FATIGUE_RECOVERY * step_minutes / BREAK_MINUTES
+    result = {name: np.empty((n_workers, n_steps)) for name in ("step_energy", "energy_used", "fatigue")}
+
+    for start in range(0, n_workers, chunk_workers):
+        rows = slice(start, min(start + chunk_workers, n_workers))
+        chunk_agents = {key: value[rows] if len(value) > 1 else value for key, value in worker_columns.items()}
+        chunk_context = None if context_columns is None else {
+            key: value[rows] if np.ndim(value) and len(value) > 1 else value for key, value in context_columns.items()
+        }
+
+        # (w, K) energies per step plus a last column for rest, so the rest
+        # index -1 gathers it directly
+        per_task = calculate_e_info_batch(catalog, chunk_agents, 60.0 * step_minutes, chunk_context)
+        per_task = np.broadcast_to(per_task, (rows.stop - rows.start, n_tasks))
+        rest_column = np.ones((per_task.shape[0], 1))
+        index = schedule[rows]
+        energy = np.take_along_axis(np.hstack([per_task, 0.0 * rest_column]), index, axis=1)
+        fatigue_steps = np.take_along_axis(np.hstack([per_task / 100.0, rest_fatigue * rest_column]), index, axis=1)
+
+        fatigue = _reflected_cumsum(fatigue_steps, out=result["fatigue"][rows])
+
+        # Fatigue before each step raises that step's energy
+        step_energy = result["step_energy"][rows]
+        step_energy[:, 0] = 1.0
+        np.multiply(fatigue[:, :-1], 0.5, out=step_energy[:, 1:])
+        step_energy[:, 1:] += 1.0
+        step_energy *= energy
+        np.copyto(step_energy, rest_energy, where=index < 0)
+        _reflected_cumsum(step_energy, out=result["energy_used"][rows])
+
+    if _metrics.enabled:
+        _metrics.record_batch("forecast_shift_energy", n_workers)
+
+    return result
@@ -1,8 +1,22 @@
 """Information Inductance Model (L_info) - placeholder"""
 
+from ..utils import metrics as _metrics
+
 def calculate_l_info(agent_profile, context=None):
     """Calculate information inductance (processing delays)."""
+    if _metrics.enabled:
+        _metrics.record_call("calculate_l_info")
     # Simple version based on processing speed
     speed = agent_profile.get("processing_speed", 0.7)
     expertise = agent_profile.get("expertise", 0.5)
+    return 2.0 * (1.0 - speed) + 1.0 * (1.0 - expertise)
+
+def calculate_l_info_batch(profiles, context=None):
+    """Calculate information inductance for a batch of profiles (array output)."""
+    from ._batch import batch_length, column  # NumPy only for batch use
+    n = batch_length(profiles)
+    if _metrics.enabled:
+        _metrics.record_batch("calculate_l_info_batch", n)
+    speed = column(profiles, "processing_speed", 0.7, n)
+    expertise = column(profiles, "expertise", 0.5, n)
     return 2.0 * (1.0 - speed) + 1.0 * (1.0 - expertise) 
\ No newline at end of file
@@ -18,6 +18,8 @@ import math
 import cmath
 from typing import Dict, Union, Optional, Tuple
 
+from ..utils import metrics as _metrics
+
 
 def calculate_flow_rate(
     voltage: float,
@@ -47,11 +49,67 @@ def calculate_flow_rate(
         # Use resistance: V = U / R  
         if resistance < 0.01:
             resistance = 0.01  # Prevent division by zero
+            if _metrics.enabled:
+                _metrics.inc("infodynamics_substitutions_total", function="calculate_flow_rate", parameter="resistance")
         flow_rate = voltage / resistance
     
+    if _metrics.enabled:
+        _metrics.record_call("calculate_flow_rate")
+        _record_saturation("calculate_flow_rate", flow_rate)
+    
     return max(0.0, min(100.0, flow_rate))
 
 
+def _record_saturation(function: str, flow_rate: float) -> None:
+    if flow_rate > 100.0:
+        _metrics.inc("infodynamics_flow_rate_saturated_total", function=function, bound="high")
+    elif flow_rate < 0.0:
+        _metrics.inc("infodynamics_flow_rate_saturated_total", function=function, bound="low")
+
+
+def calculate_flow_rate_batch(
+    voltage: "np.ndarray",
+    conductivity: "np.ndarray",
+    resistance: Optional["np.ndarray"] = None
+) -> "np.ndarray":
+    """
+    Calculate information flow rates for arrays of voltages and conductivities.
+    
+    Same rule as ``calculate_flow_rate``: V = U * G, or V = U / R when
+    resistance is given (R floored at 0.01), clipped to 0-100.
+    
+    Args:
+        voltage: Information voltages (U_info)
+        conductivity: Information conductivities (G_info)
+        resistance: Optional resistances, used instead of conductivity
+        
+    Returns:
+        Array of flow rates (0-100 scale)
+    """
+    import numpy as np  # deferred: the scalar equations only need math
+    
+    voltage = np.asarray(voltage, dtype=np.float64)
+    if resistance is None:
+        flow_rate = voltage * np.asarray(conductivity, dtype=np.float64)
+    else:
+        resistance = np.asarray(resistance, dtype=np.float64)
+        if _metrics.enabled:
+            floored = int(np.count_nonzero(resistance < 0.01))
+            if floored:
+                _metrics.inc("infodynamics_substitutions_total", floored,
+                             function="calculate_flow_rate_batch", parameter="resistance")
+        flow_rate = voltage / np.maximum(0.01, resistance)
+    
+    if _metrics.enabled:
+        _metrics.record_batch("calculate_flow_rate_batch", flow_rate.size)
+        for bound, count in (("high", np.count_nonzero(flow_rate > 100.0)), ("low", np.count_nonzero(flow_rate < 0.0))):
+            if count:
+                _metrics.inc("infodynamics_flow_rate_saturated_total", int(count),
+                             function="calculate_flow_rate_batch", bound=bound)
+    
+    return np.clip(flow_rate, 0.0, 100.0)
+
+
 def calculate_impedance(
     resistance: float,
     inductance: float,
@@ -73,6 +131,12 @@ def calculate_impedance(
         Tuple of (magnitude, phase) of complex impedance
     """
     
+    if _metrics.enabled:
+        _metrics.record_call("calculate_impedance")
+        for parameter, value in (("frequency", frequency), ("capacity", capacity)):
+            if value == 0:
+                _metrics.inc("infodynamics_substitutions_total", function="calculate_impedance", parameter=parameter)
+    
     if frequency == 0:
         frequency = 0.01  # Prevent division by zero
     
@@ -118,6 +182,8 @@ def calculate_ac_flow_rate(
     
     if impedance_magnitude < 0.01:
         impedance_magnitude = 0.01
+        if _metrics.enabled:
+            _metrics.inc("infodynamics_substitutions_total", function="calculate_ac_flow_rate", parameter="impedance")
     
     # RMS flow rate
     rms_flow = voltage / impedance_magnitude
@@ -126,6 +192,10 @@ def calculate_ac_flow_rate(
     power_factor = math.cos(impedance_phase)
     effective_flow = rms_flow * abs(power_factor)
     
+    if _metrics.enabled:
+        _metrics.record_call("calculate_ac_flow_rate")
+        _record_saturation("calculate_ac_flow_rate", effective_flow)
+    
     return max(0.0, min(100.0, effective_flow))
 
 
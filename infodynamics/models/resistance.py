@@ -1,7 +1,20 @@
 """Information Resistance Model (R_info) - placeholder"""
 
+from ..utils import metrics as _metrics
+
 def calculate_r_info(agent_profile, context=None):
     """Calculate information resistance (inverse of conductivity)."""
     from .conductivity import calculate_g_info
+    if _metrics.enabled:
+        _metrics.record_call("calculate_r_info")
     G = calculate_g_info(agent_profile, context)
-    return 1.0 / max(0.1, G)  # R = 1/G 
\ No newline at end of file
+    return 1.0 / max(0.1, G)  # R = 1/G
+
+def calculate_r_info_batch(profiles, context=None):
+    """Calculate information resistance for a batch of profiles (array output)."""
+    import numpy as np
+    from .conductivity import calculate_g_info_batch
+    G = calculate_g_info_batch(profiles, context)
+    if _metrics.enabled:
+        _metrics.record_batch("calculate_r_info_batch", len(G))
+    return 1.0 / np.maximum(0.1, G) 
\ No newline at end of file
@@ -0,0 +1,291 @@
+"""
+Information Retention Simulation
+
+What each user still holds of the information they were exposed to, from
+an event log of exposures (user_id, time in days, amount). Stored
+information S charges toward the user's capacity C at each exposure, like
+a capacitor, and decays between exposures:
+
+    exposure:  S⁺ = C - (C - S⁻)·exp(-amount / C)      (S⁺ = S⁻ + amount without a capacity)
+    decay:     S(t + Δ) = S(t)·D(Δ)
+               exponential: D(Δ) = 2^(-Δ / half_life)
+               power law:   D(Δ) = (1 + Δ / decay_scale)^(-decay_exponent)
+
+The power-law clock restarts at every exposure (each exposure refreshes the
+trace). Both steps are closed-form, so the simulation jumps from one event
+to the next instead of ticking through time, and every step is an affine
+map S_k = α_k·S_{k-1} + β_k. A user's event sequence is the composition of
+those maps, evaluated for a whole chunk of events at once with a
+log-depth segmented scan (α = 0 at each user's first event keeps users
+apart).
+
+``iter_retention`` streams an event log sorted by (user_id, time) in
+chunks and yields one summary row per user as soon as the user's events
+are complete; memory is bounded by the chunk size, so logs of billions of
+exposures can be processed from disk (``utils.tabular.iter_table_chunks``).
+Per-user capacity and decay parameters come from an optional ``users``
+table indexed by user id (e.g. C_info from ``calculate_c_info_batch``).
+
+Example:
+    >>> summary = simulate_retention("exposures.parquet", horizon=30.0, users=user_params)
+    >>> summary[["user_id", "exposures", "stored", "retained"]]
+"""
+
+from typing import Any, Iterator, Mapping, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from ..utils import metrics as _metrics
+
+
+DECAY_MODELS = ("exponential", "power")
+
+DEFAULT_HALF_LIFE = 7.0        # days
+DEFAULT_DECAY_SCALE = 1.0      # days
+DEFAULT_DECAY_EXPONENT = 0.5
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+# Per-user parameters read from ``users`` (missing -> the function defaults)
+USER_PARAMETERS = ("capacity", "half_life", "decay_scale", "decay_exponent")
+
+SUMMARY_COLUMNS = ("user_id", "exposures", "first_time", "last_time", "stored", "retained")
+
+
+def retention_factor(
+    elapsed,
+    decay: str = "exponential",
+    half_life=DEFAULT_HALF_LIFE,
+    decay_scale=DEFAULT_DECAY_SCALE,
+    decay_exponent=DEFAULT_DECAY_EXPONENT
+):
+    """Share of stored information left after ``elapsed`` days (scalars or arrays)."""
+    elapsed = np.maximum(0.0, elapsed)
+    if decay == "exponential":
+        return np.exp2(-elapsed / half_life)
+    if decay == "power":
+        return (1.0 + elapsed / decay_scale) ** -decay_exponent
+    raise ValueError(f"Unknown decay model: {decay} (choose from {DECAY_MODELS})")
+
+
+def _affine_scan(alpha: np.ndarray, beta: np.ndarray, max_run: int) -> np.ndarray:
+    """
+    In-place inclusive scan of the maps x -> alpha·x + beta (Hillis-Steele):
+    afterwards beta[k] is the state after event k. Runs are separated by
+    alpha = 0, so only ceil(log2(max_run)) passes are needed.
+    """
+    d = 1
+    while d < max_run:
+        new_beta = alpha[d:] * beta[:-d]
+        new_beta += beta[d:]
+        new_alpha = alpha[d:] * alpha[:-d]
+        beta[d:] = new_beta
+        alpha[d:] = new_alpha
+        d *= 2
+    return beta
+
+
+class _OpenUser:
+    """Last user of a chunk, whose events may continue in the next one."""
+
+    __slots__ = ("user_id", "exposures", "first_time", "last_time", "stored", "params")
+
+    def __init__(self, user_id, exposures, first_time, last_time, stored, params):
+        self.user_id = user_id
+        self.exposures = exposures
+        self.first_time = first_time
+        self.last_time = last_time
+        self.stored = stored
+        self.params = params
+
+    def summary(self, horizon: Optional[float], decay: str) -> pd.DataFrame:
+        return _summaries(
+            np.array([self.user_id]), np.array([self.exposures]), np.array([self.first_time]),
+            np.array([self.last_time]), np.array([self.stored]),
+            {k: np.array([v]) for k, v in self.params.items()}, horizon, decay
+        )
+
+
+def _user_parameters(users: Optional[pd.DataFrame], ids: np.ndarray, defaults: Mapping[str, float]):
+    params = {}
+    table = users.reindex(ids) if users is not None else None
+    for name, default in defaults.items():
+        if table is not None and name in table:
+            values = table[name].to_numpy(dtype=np.float64)
+            params[name] = np.where(np.isnan(values), default, values)
+        else:
+            params[name] = np.full(len(ids), default)
+    return params
+
+
+def _summaries(ids, exposures, first_time, last_time, stored, params, horizon, decay) -> pd.DataFrame:
+    if horizon is None:
+        retained = stored
+    else:
+        retained = stored * retention_factor(
+            horizon - last_time, decay, params["half_life"], params["decay_scale"], params["decay_exponent"]
+        )
+    return pd.DataFrame({
+        "user_id": ids,
+        "exposures": exposures,
+        "first_time": first_time,
+        "last_time": last_time,
+        "stored": stored,
+        "retained": retained,
+    })
+
+
+def iter_retention(
+    events,
+    users: Optional[pd.DataFrame] = None,
+    decay: str = "exponential",
+    horizon: Optional[float] = None,
+    capacity: Optional[float] = None,
+    half_life: float = DEFAULT_HALF_LIFE,
+    decay_scale: float = DEFAULT_DECAY_SCALE,
+    decay_exponent: float = DEFAULT_DECAY_EXPONENT
+) -> Iterator[pd.DataFrame]:
+    """
+    Simulate retention over chunks of an exposure log.
+
+    Args:
+        events: Iterable of DataFrames (or column mappings) with user_id,
+            time (days) and optionally amount (default 1), sorted by
+            user_id and then time across the whole stream
+        users: Optional per-user parameters (USER_PARAMETERS) indexed by
+            user_id; missing users or values take the defaults below
+        decay: "exponential" or "power"
+        horizon: Time at which to evaluate "retained" (default: each
+            user's last exposure, i.e. retained == stored)
+        capacity: Default capacity (None: unbounded, exposures add linearly)
+        half_life: Default half-life in days (exponential decay)
+        decay_scale, decay_exponent: Default power-law parameters
+
+    Yields:
+        DataFrames with SUMMARY_COLUMNS, one row per user, in input order
+
+    Raises:
+        ValueError: If the events are not sorted by (user_id, time)
+    """
+    if decay not in DECAY_MODELS:
+        raise ValueError(f"Unknown decay model: {decay} (choose from {DECAY_MODELS})")
+    defaults = {
+        "capacity": np.inf if capacity is None else capacity,
+        "half_life": half_life,
+        "decay_scale": decay_scale,
+        "decay_exponent": decay_exponent,
+    }
+    open_user: Optional[_OpenUser] = None
+
+    for chunk in events:
+        user_ids = np.asarray(chunk["user_id"])
+        n = len(user_ids)
+        if n == 0:
+            continue
+        times = np.asarray(chunk["time"], dtype=np.float64)
+        amounts = (np.asarray(chunk["amount"], dtype=np.float64) if "amount" in chunk
+                   else np.ones(n))
+        if _metrics.enabled:
+            _metrics.record_batch("iter_retention", n)
+
+        # Runs of equal user ids; the stream must be sorted
+        new_user = np.empty(n, dtype=bool)
+        new_user[0] = open_user is None or user_ids[0] != open_user.user_id
+        new_user[1:] = user_ids[1:] != user_ids[:-1]
+        starts = np.flatnonzero(new_user) if new_user[0] else np.r_[0, np.flatnonzero(new_user)]
+        lengths = np.diff(np.r_[starts, n])
+        ids = user_ids[starts]
+        if (len(ids) > 1 and np.any(ids[1:] < ids[:-1])) or (
+                open_user is not None and new_user[0] and ids[0] < open_user.user_id):
+            raise ValueError("Events must be sorted by user_id")
+        if open_user is not None and new_user[0]:
+            yield open_user.summary(horizon, decay)
+
+        elapsed = np.empty(n)
+        elapsed[1:] = times[1:] - times[:-1]
+        elapsed[0] = 0.0 if new_user[0] else times[0] - open_user.last_time
+        elapsed[new_user] = 0.0
+        if np.any(elapsed < 0):
+            raise ValueError("Events must be sorted by time within each user")
+
+        params = _user_parameters(users, ids, defaults)
+        if users is None:
+            per_event = defaults
+        else:
+            per_event = {name: np.repeat(values, lengths) for name, values in params.items()}
+
+        # Exposure: alpha = D·exp(-a/C), beta = C·(1 - exp(-a/C)); a/C -> 0
+        # for unbounded capacity, where beta -> a
+        C = per_event["capacity"]
+        bounded = np.isfinite(C)
+        keep = np.exp(-np.divide(amounts, C, out=np.zeros(n), where=bounded))
+        beta = amounts.copy()
+        np.multiply(C, 1.0 - keep, out=beta, where=bounded)
+        alpha = retention_factor(elapsed, decay, per_event["half_life"],
+                                 per_event["decay_scale"], per_event["decay_exponent"])
+        alpha *= keep
+
+        if not new_user[0]:
+            beta[0] += alpha[0] * open_user.stored
+        alpha[new_user] = 0.0
+        if not new_user[0]:
+            alpha[0] = 0.0
+        stored = _affine_scan(alpha, beta, int(lengths.max()))
+
+        ends = starts + lengths - 1
+        exposures = lengths.copy()
+        first_time = times[starts]
+        if not new_user[0]:
+            exposures[0] += open_user.exposures
+            first_time[0] = open_user.first_time
+
+        # Everything but the last user is complete
+        done = slice(0, len(ids) - 1)
+        if len(ids) > 1:
+            yield _summaries(ids[done], exposures[done], first_time[done], times[ends[done]],
+                             stored[ends[done]], {k: v[done] for k, v in params.items()}, horizon, decay)
+        open_user = _OpenUser(ids[-1], int(exposures[-1]), float(first_time[-1]), float(times[-1]),
+                              float(stored[-1]), {k: float(v[-1]) for k, v in params.items()})
+
+    if open_user is not None:
+        yield open_user.summary(horizon, decay)
+
+
+def simulate_retention(
+    events: Union[str, pd.DataFrame, Mapping[str, Any]],
+    users: Optional[pd.DataFrame] = None,
+    decay: str = "exponential",
+    horizon: Optional[float] = None,
+    fmt: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **defaults
+) -> pd.DataFrame:
+    """
+    Per-user retention for a whole exposure log.
+
+    Args:
+        events: Event table path (CSV, JSON Lines, Parquet; "-" for stdin)
+            sorted by (user_id, time), or an in-memory DataFrame / mapping
+            (sorted here if needed)
+        users: Optional per-user parameters indexed by user_id
+        decay: "exponential" or "power"
+        horizon: Time at which to evaluate "retained"
+        fmt: Table format of a path (inferred from the extension by default)
+        chunk_size: Events per chunk
+        **defaults: capacity, half_life, decay_scale, decay_exponent
+
+    Returns:
+        DataFrame with SUMMARY_COLUMNS, one row per user
+    """
+    if isinstance(events, (str, bytes)) or hasattr(events, "__fspath__"):
+        from ..utils.tabular import iter_table_chunks
+        chunks = iter_table_chunks(events, fmt, chunk_size)
+    else:
+        frame = pd.DataFrame(events)
+        frame = frame.sort_values(["user_id", "time"], kind="stable", ignore_index=True)
+        chunks = (frame.iloc[start:start + chunk_size] for start in range(0, len(frame), chunk_size))
+
+    parts = list(iter_retention(chunks, users, decay, horizon, **defaults))
+    if not parts:
+        return pd.DataFrame({name: [] for name in SUMMARY_COLUMNS})
+    return pd.concat(parts, ignore_index=True)
@@ -0,0 +1,247 @@
+"""
+Batch Scoring
+
+Evaluates several model quantities for a table of rows in one vectorized
+pass. Each row may hold:
+- an agent profile (working_memory, attention_selectivity, motivation,
+  expertise, processing_speed)
+- context factors (distraction_level, time_pressure, fatigue)
+- content characteristics read by the voltage U_info (factual_density,
+  credibility, semantic_quality, timeliness, emotional and novelty
+  measures; ``voltage.VOLTAGE_COLUMNS``)
+- social context (echo_chamber_strength, social_proof, network_diversity),
+  read only by the social conductivity G_info_social
+- memory measures read only by the capacity C_info (spans, retention and
+  access components, age, training; ``capacity.CAPACITY_COLUMNS``), which
+  falls back to working_memory, expertise and attention_selectivity
+
+Missing columns or values take the defaults of the scalar models, so a
+row scores exactly as the corresponding ``calculate_*`` call would.
+
+``score_population`` scores an on-disk population store
+(``infodynamics.utils.population``) chunk by chunk, writing each quantity
+into a memory-mapped output column. Alongside each output it keeps a
+per-row hash of the inputs that quantity depends on (``QUANTITY_INPUTS``);
+``rescore_population`` compares those hashes with the current inputs and
+recomputes only the rows that changed, merging them into the stored
+outputs in place.
+"""
+
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+import numpy as np
+
+from ..utils import metrics as _metrics
+from ._batch import batch_length
+from .capacity import CAPACITY_ALIASES, CAPACITY_COLUMNS, calculate_c_info_batch
+from .conductivity import calculate_g_info_batch, calculate_g_info_social_batch
+from .inductance import calculate_l_info_batch
+from .ohms_law import calculate_flow_rate_batch
+from .voltage import VOLTAGE_COLUMNS, calculate_u_info_batch
+
+
+# Quantity name -> output column
+QUANTITIES = {
+    "G": "G_info",
+    "R": "R_info",
+    "L": "L_info",
+    "C": "C_info",
+    "U": "U_info",
+    "flow": "flow_rate",
+    "G_social": "G_info_social",
+}
+
+# Computed when no quantities are given
+DEFAULT_QUANTITIES = ("G", "R", "L", "C", "U", "flow")
+
+PROFILE_COLUMNS = (
+    "working_memory",
+    "attention_selectivity",
+    "motivation",
+    "expertise",
+    "processing_speed",
+)
+CONTEXT_COLUMNS = ("distraction_level", "time_pressure", "fatigue")
+CONTENT_COLUMNS = VOLTAGE_COLUMNS
+SOCIAL_COLUMNS = ("echo_chamber_strength", "social_proof", "network_diversity")
+
+# Input columns each quantity depends on, directly or through the quantities
+# it is derived from (R and flow from G, flow from U)
+QUANTITY_INPUTS = {
+    "G": PROFILE_COLUMNS + CONTEXT_COLUMNS,
+    "R": PROFILE_COLUMNS + CONTEXT_COLUMNS,
+    "L": ("processing_speed", "expertise"),
+    "C": CAPACITY_COLUMNS + tuple(CAPACITY_ALIASES.values()),
+    "U": CONTENT_COLUMNS,
+    "flow": PROFILE_COLUMNS + CONTEXT_COLUMNS + CONTENT_COLUMNS,
+    "G_social": PROFILE_COLUMNS + SOCIAL_COLUMNS,
+}
+
+# Every input column read by the models
+INPUT_COLUMNS = PROFILE_COLUMNS + CONTEXT_COLUMNS + CONTENT_COLUMNS + SOCIAL_COLUMNS + CAPACITY_COLUMNS
+
+
+def score_batch(
+    data: Mapping[str, Any],
+    quantities: Sequence[str] = DEFAULT_QUANTITIES,
+    out: Optional[Mapping[str, np.ndarray]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Score a batch of rows.
+
+    Args:
+        data: DataFrame or mapping of column -> array
+        quantities: Any of "G", "R", "L", "C", "U", "flow", "G_social"
+            (flow = U_info * G_info, clipped to 0-100)
+        out: Optional output column (e.g. "G_info") -> array of the batch
+            length; results for those columns are written into the given
+            arrays (e.g. memory-mapped slices) and the same arrays returned
+
+    Returns:
+        Dictionary of output column (e.g. "G_info") -> array, in the
+        order requested
+    """
+    unknown = [q for q in quantities if q not in QUANTITIES]
+    if unknown:
+        raise ValueError(f"Unknown quantities: {unknown} (choose from {list(QUANTITIES)})")
+    if _metrics.enabled:
+        _metrics.record_batch("score_batch", batch_length(data))
+
+    G = calculate_g_info_batch(data) if {"G", "R", "flow"} & set(quantities) else None
+    U = calculate_u_info_batch(data) if {"U", "flow"} & set(quantities) else None
+
+    computed = {
+        "G": lambda: G,
+        "R": lambda: 1.0 / np.maximum(0.1, G),
+        "L": lambda: calculate_l_info_batch(data),
+        "C": lambda: calculate_c_info_batch(data),
+        "U": lambda: U,
+        "flow": lambda: calculate_flow_rate_batch(U, G),
+        "G_social": lambda: calculate_g_info_social_batch(data),
+    }
+    results = {QUANTITIES[q]: computed[q]() for q in quantities}
+    if out:
+        for name, target in out.items():
+            if name in results:
+                np.copyto(target, results[name], casting="same_kind")
+                results[name] = target
+    return results
+
+
+HASH_SUFFIX = ".hash"
+
+
+def score_population(
+    store,
+    quantities: Sequence[str] = DEFAULT_QUANTITIES,
+    chunk_rows: Optional[int] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Score every row of a population store in place.
+
+    Output columns (e.g. "G_info") are created in the store if missing and
+    filled chunk by chunk from page-aligned views of the input columns, so
+    memory use is bounded by ``chunk_rows`` rather than the population size.
+    The input hash of every row is stored with each output
+    (e.g. "G_info.hash") for later ``rescore_population`` calls.
+
+    Args:
+        store: ``infodynamics.utils.population.PopulationStore`` opened "r+"
+        quantities: Any of "G", "R", "L", "C", "U", "flow", "G_social"
+        chunk_rows: Rows per chunk (rounded to page alignment;
+            default ``population.DEFAULT_CHUNK_ROWS``)
+
+    Returns:
+        Dictionary of output column -> memory-mapped column
+    """
+    _score_store(store, quantities, chunk_rows, incremental=False)
+    return {QUANTITIES[q]: store.column(QUANTITIES[q]) for q in quantities}
+
+
+def rescore_population(
+    store,
+    quantities: Sequence[str] = DEFAULT_QUANTITIES,
+    chunk_rows: Optional[int] = None
+) -> Dict[str, int]:
+    """
+    Recompute only the rows whose inputs changed since they were last scored.
+
+    A row of an output is dirty when the hash of the inputs that quantity
+    depends on (``QUANTITY_INPUTS``) differs from the stored hash, or when
+    the output was never computed (NaN). Dependents follow from the input
+    sets: a changed fatigue value dirties G, R and flow but not L, C, U or
+    G_social. Dirty rows are scored together and written into the stored
+    output columns in place; clean rows are not touched.
+
+    Args:
+        store: ``PopulationStore`` opened "r+", typically scored before with
+            ``score_population`` and then changed with ``store.update``
+        quantities: Any of "G", "R", "L", "C", "U", "flow", "G_social"
+        chunk_rows: Rows per chunk (rounded to page alignment)
+
+    Returns:
+        Dictionary of output column -> number of rows recomputed
+    """
+    return _score_store(store, quantities, chunk_rows, incremental=True)
+
+
+def _score_store(store, quantities: Sequence[str], chunk_rows: Optional[int],
+                 incremental: bool) -> Dict[str, int]:
+    from ..utils.population import DEFAULT_CHUNK_ROWS, row_hashes
+    from ..utils.profiling import stage
+
+    unknown = [q for q in quantities if q not in QUANTITIES]
+    if unknown:
+        raise ValueError(f"Unknown quantities: {unknown} (choose from {list(QUANTITIES)})")
+
+    outputs = {q: store.add_column(QUANTITIES[q], "float64") for q in quantities}
+    hashes = {q: store.add_column(QUANTITIES[q] + HASH_SUFFIX, "uint64", fill=None) for q in quantities}
+    written = [QUANTITIES[q] for q in quantities] + [QUANTITIES[q] + HASH_SUFFIX for q in quantities]
+    # Quantities reading the same columns share one hash computation
+    input_sets = {q: tuple(name for name in QUANTITY_INPUTS[q] if name in store) for q in quantities}
+    inputs = sorted(set().union(*input_sets.values()), key=INPUT_COLUMNS.index)
+    recomputed = {QUANTITIES[q]: 0 for q in quantities}
+
+    # Align chunks for the output and hash columns as well as the inputs
+    step = store.chunk_rows(chunk_rows or DEFAULT_CHUNK_ROWS, inputs + written)
+    for rows, chunk in store.iter_chunks(inputs, step):
+        n = rows.stop - rows.start
+        with stage("population.hash", items=n):
+            current = {}
+            for columns in set(input_sets.values()):
+                current[columns] = row_hashes({name: chunk[name] for name in columns}, n)
+
+        if not incremental:
+            with stage("population.score", items=n):
+                score_batch(chunk, quantities, out={QUANTITIES[q]: outputs[q][rows] for q in quantities})
+            for q in quantities:
+                hashes[q][rows] = current[input_sets[q]]
+                recomputed[QUANTITIES[q]] += n
+            continue
+
+        dirty = {}
+        for q in quantities:
+            mask = (hashes[q][rows] != current[input_sets[q]]) | np.isnan(outputs[q][rows])
+            if mask.any():
+                dirty[q] = mask
+        if not dirty:
+            continue
+
+        # Score the union of dirty rows once, then merge each quantity
+        # back only where that quantity is dirty
+        union = np.logical_or.reduce(list(dirty.values()))
+        index = np.flatnonzero(union)
+        with stage("population.rescore", items=len(index)):
+            scores = score_batch({name: values[index] for name, values in chunk.items()}, list(dirty))
+            for q, mask in dirty.items():
+                target = index[mask[index]] + rows.start
+                outputs[q][target] = scores[QUANTITIES[q]][mask[index]]
+                hashes[q][target] = current[input_sets[q]][target - rows.start]
+                recomputed[QUANTITIES[q]] += len(target)
+
+    store.flush()
+    if _metrics.enabled:
+        for name, count in recomputed.items():
+            _metrics.inc("infodynamics_population_rows_scored_total", count, column=name,
+                         mode="incremental" if incremental else "full")
+    return recomputed
@@ -0,0 +1,645 @@
+"""
+Information Transformers Model (T_info)
+
+Cognitive translation of information between formats, domains and
+representation systems (summarization, simplification, translation,
+adaptation), modelled on electrical transformers:
+
+    T_info = Transformation_Ratio × Efficiency × Fidelity × Domain_Compatibility
+
+See theory/information_transformers_model.md.
+
+- ``calculate_t_info``: one (source format, target format, agent) triple
+- ``calculate_t_info_batch``: the same model over arrays of triples
+- ``analyze_transformer_circuit`` / ``analyze_transformer_cascade``:
+  a transformer in a circuit, and transformers in series
+- ``reduce_transformer_cascade``: a chain of stages as one equivalent
+  transformer (ratios and efficiencies multiply, energy costs add)
+- ``transformer_matrix``, ``evaluate_pipelines``, ``rank_pipelines``:
+  every candidate pipeline through a catalog of formats, scored at once
+
+Formats are described by numeric keys (complexity, information_density,
+abstraction_level, accessibility, <type>_content) and categorical keys
+(modality, structure_type, domain, conceptual_framework). Batch inputs are
+DataFrames or mappings of column -> array; categorical columns hold strings.
+"""
+
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..utils import metrics as _metrics
+from ._batch import batch_length, column
+
+
+# Information "frequencies": each is preserved separately
+FREQUENCY_TYPES = ("factual", "conceptual", "procedural", "emotional", "cultural")
+
+# (source, target) -> compatibility; pairs not listed use the default
+MODALITY_COMPATIBILITY = {
+    ("text", "text"): 1.0,
+    ("text", "visual"): 0.7,
+    ("text", "audio"): 0.6,
+    ("visual", "visual"): 1.0,
+    ("visual", "text"): 0.8,
+    ("visual", "audio"): 0.5,
+    ("audio", "audio"): 1.0,
+    ("audio", "text"): 0.7,
+    ("audio", "visual"): 0.4,
+}
+
+# Symmetric; identical domains overlap fully
+DOMAIN_SIMILARITY = {
+    ("mathematics", "physics"): 0.8,
+    ("mathematics", "computer_science"): 0.7,
+    ("physics", "engineering"): 0.8,
+    ("biology", "medicine"): 0.9,
+    ("psychology", "sociology"): 0.7,
+    ("literature", "history"): 0.6,
+}
+
+FRAMEWORK_COMPATIBILITY = {
+    ("empirical", "empirical"): 1.0,
+    ("empirical", "theoretical"): 0.7,
+    ("empirical", "practical"): 0.8,
+    ("theoretical", "theoretical"): 1.0,
+    ("theoretical", "practical"): 0.6,
+    ("practical", "practical"): 1.0,
+}
+
+# Symmetric; identical cultures are fully compatible
+CULTURAL_COMPATIBILITY = {
+    ("western", "eastern"): 0.6,
+    ("academic", "practical"): 0.7,
+    ("formal", "informal"): 0.8,
+}
+
+# Format defaults, as in the scalar model
+FORMAT_DEFAULTS = {
+    "complexity": 0.5,
+    "information_density": 0.5,
+    "abstraction_level": 0.5,
+    "accessibility": 0.7,
+    "modality": "text",
+    "structure_type": "hierarchical",
+    "domain": "general",
+    "conceptual_framework": "empirical",
+}
+
+# Floor of the transformation (turns) ratio: a target with zero complexity,
+# density or abstraction would otherwise give a ratio of 0 and infinite
+# current transformation and reflected impedance
+MIN_TRANSFORMATION_RATIO = 0.01
+
+# How stage parameters combine along a cascade (see reduce_transformer_cascade)
+CASCADE_PRODUCT = (
+    "transformation_ratio",
+    "efficiency",
+    "fidelity",
+    "power_efficiency",
+    "impedance_ratio",
+)
+CASCADE_SUM = ("energy_cost",)
+CASCADE_MIN = ("domain_compatibility",) + tuple(f"frequency_response_{t}" for t in FREQUENCY_TYPES)
+
+
+def _lookup(table: Dict[Tuple[str, str], float], source: str, target: str,
+            default: float, symmetric: bool = False) -> float:
+    if symmetric and source == target:
+        return 1.0
+    value = table.get((source, target))
+    if value is None and symmetric:
+        value = table.get((target, source))
+    return default if value is None else value
+
+
+def calculate_format_compatibility(source_format: Dict[str, Any], target_format: Dict[str, Any]) -> float:
+    """Structural and modality compatibility between two formats (0-1)."""
+    structure_match = 1.0 if (
+        source_format.get("structure_type", "hierarchical") == target_format.get("structure_type", "hierarchical")
+    ) else 0.6
+    modality_match = _lookup(MODALITY_COMPATIBILITY,
+                             source_format.get("modality", "text"), target_format.get("modality", "text"), 0.5)
+    return (structure_match + modality_match) / 2.0
+
+
+def calculate_format_impedance(format_info: Dict[str, Any]) -> float:
+    """Information impedance of a format: complexity and density over accessibility (0.1-10)."""
+    complexity = format_info.get("complexity", 0.5)
+    density = format_info.get("information_density", 0.5)
+    accessibility = format_info.get("accessibility", 0.7)
+    impedance = (complexity + density) / (2.0 * accessibility) if accessibility > 0 else 10.0
+    return max(0.1, min(10.0, impedance))
+
+
+def _ratio(target: float, source: float) -> float:
+    return target / source if source > 0 else 1.0
+
+
+def calculate_t_info(
+    source_format: Dict[str, Any],
+    target_format: Dict[str, Any],
+    agent_profile: Dict[str, float],
+    context: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Calculate Information Transformer characteristics for a format conversion.
+
+    Args:
+        source_format: Source characteristics (complexity, information_density,
+            abstraction_level, accessibility, modality, structure_type, domain,
+            conceptual_framework, <type>_content)
+        target_format: Target characteristics (same keys)
+        agent_profile: Transformation capabilities:
+            - translation_skill, source_domain_knowledge, target_domain_knowledge
+            - cognitive_flexibility, analogical_reasoning
+            - semantic_preservation_ability, detail_retention
+            - <type>_translation_skill for each of FREQUENCY_TYPES
+        context: Optional source_culture, target_culture, fatigue_level,
+            time_pressure
+
+    Returns:
+        Dictionary with transformation_ratio, efficiency, fidelity,
+        domain_compatibility, energy_cost, impedance_ratio, power_efficiency,
+        frequency_response (type -> 0-1) and the electrical analogues
+        turns_ratio, voltage_transformation, current_transformation and
+        power_conservation
+    """
+
+    # 1. Transformation ratio: geometric mean of the target/source ratios
+    source_complexity = source_format.get("complexity", 0.5)
+    target_complexity = target_format.get("complexity", 0.5)
+    transformation_ratio = max(MIN_TRANSFORMATION_RATIO, (
+        _ratio(target_complexity, source_complexity) *
+        _ratio(target_format.get("information_density", 0.5), source_format.get("information_density", 0.5)) *
+        _ratio(target_format.get("abstraction_level", 0.5), source_format.get("abstraction_level", 0.5))
+    ) ** (1.0 / 3.0))
+
+    # 2. Efficiency: skill, domain knowledge and cognitive flexibility
+    knowledge_efficiency = (
+        agent_profile.get("source_domain_knowledge", 0.6) + agent_profile.get("target_domain_knowledge", 0.6)
+    ) / 2.0
+    cognitive_efficiency = (
+        agent_profile.get("cognitive_flexibility", 0.7) + agent_profile.get("analogical_reasoning", 0.6)
+    ) / 2.0
+    efficiency = (
+        0.4 * agent_profile.get("translation_skill", 0.7) +
+        0.3 * knowledge_efficiency +
+        0.3 * cognitive_efficiency
+    )
+
+    # 3. Fidelity, penalized by the complexity change
+    complexity_penalty = min(0.3, abs(target_complexity - source_complexity) * 0.5)
+    fidelity = (
+        0.4 * calculate_format_compatibility(source_format, target_format) +
+        0.3 * agent_profile.get("semantic_preservation_ability", 0.7) +
+        0.3 * agent_profile.get("detail_retention", 0.6)
+    ) * (1.0 - complexity_penalty)
+
+    # 4. Domain compatibility
+    context = context or {}
+    domain_compatibility = (
+        0.5 * _lookup(DOMAIN_SIMILARITY, source_format.get("domain", "general"),
+                      target_format.get("domain", "general"), 0.5, symmetric=True) +
+        0.3 * _lookup(FRAMEWORK_COMPATIBILITY, source_format.get("conceptual_framework", "empirical"),
+                      target_format.get("conceptual_framework", "empirical"), 0.5) +
+        0.2 * _lookup(CULTURAL_COMPATIBILITY, context.get("source_culture", "universal"),
+                      context.get("target_culture", "universal"), 0.7, symmetric=True)
+    )
+
+    # 5. Energy cost, raised by fatigue and time pressure
+    energy_cost = (
+        2.0 - efficiency +
+        abs(transformation_ratio - 1.0) +
+        (1.0 - fidelity) * 2.0 +
+        (1.0 - domain_compatibility) * 1.5
+    ) * (1.0 + 0.5 * context.get("fatigue_level", 0.0) + 0.3 * context.get("time_pressure", 0.0))
+
+    # 6. Impedance matching and frequency response
+    impedance_ratio = calculate_format_impedance(target_format) / calculate_format_impedance(source_format)
+    frequency_response = {
+        t: min(source_format.get(f"{t}_content", 0.5), target_format.get(f"{t}_content", 0.5)) *
+        agent_profile.get(f"{t}_translation_skill", 0.7)
+        for t in FREQUENCY_TYPES
+    }
+
+    if _metrics.enabled:
+        _metrics.record_call("calculate_t_info")
+
+    return {
+        "transformation_ratio": transformation_ratio,
+        "efficiency": efficiency,
+        "fidelity": fidelity,
+        "domain_compatibility": domain_compatibility,
+        "energy_cost": energy_cost,
+        "impedance_ratio": impedance_ratio,
+        "power_efficiency": efficiency * fidelity,
+        "frequency_response": frequency_response,
+
+        # Electrical transformer analogues
+        "turns_ratio": transformation_ratio,
+        "voltage_transformation": transformation_ratio,
+        "current_transformation": 1.0 / transformation_ratio,
+        "power_conservation": efficiency,
+    }
+
+
+def _labels(data: Mapping[str, Any], key: str, default: str, n: int) -> np.ndarray:
+    """Categorical column ``key`` as strings; missing columns or values take ``default``."""
+    if data is None or key not in data:
+        return np.full(n, default, dtype=object)
+    values = data[key]
+    if isinstance(values, str):
+        return np.full(n, values, dtype=object)
+    values = np.asarray(values, dtype=object)
+    # None, or NaN (the only value not equal to itself)
+    missing = np.equal(values, None) | (values != values)
+    if missing.any():
+        values = np.where(missing, default, values)
+    return values
+
+
+def _pair_lookup(source: np.ndarray, target: np.ndarray, table: Dict[Tuple[str, str], float],
+                 default: float, symmetric: bool = False) -> np.ndarray:
+    """``_lookup`` for arrays: categories are coded once and read from a K x K matrix."""
+    n = len(source)
+    categories, codes = np.unique(np.concatenate([source, target]).astype(str), return_inverse=True)
+    index = {category: i for i, category in enumerate(categories)}
+    matrix = np.full((len(categories), len(categories)), default)
+    for (a, b), value in table.items():
+        if a in index and b in index:
+            matrix[index[a], index[b]] = value
+            if symmetric and (b, a) not in table:
+                matrix[index[b], index[a]] = value
+    if symmetric:
+        np.fill_diagonal(matrix, 1.0)
+    return matrix[codes[:n], codes[n:]]
+
+
+def _ratio_batch(target: np.ndarray, source: np.ndarray) -> np.ndarray:
+    positive = source > 0
+    return np.where(positive, target / np.where(positive, source, 1.0), 1.0)
+
+
+def _impedance_batch(formats: Mapping[str, Any], n: int) -> np.ndarray:
+    accessibility = column(formats, "accessibility", 0.7, n)
+    numerator = column(formats, "complexity", 0.5, n) + column(formats, "information_density", 0.5, n)
+    positive = accessibility > 0
+    impedance = np.where(positive, numerator / (2.0 * np.where(positive, accessibility, 1.0)), 10.0)
+    return np.clip(impedance, 0.1, 10.0)
+
+
+def calculate_t_info_batch(
+    source_formats: Mapping[str, Any],
+    target_formats: Mapping[str, Any],
+    agent_profiles: Mapping[str, Any],
+    context: Optional[Mapping[str, Any]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Calculate T_info for many (source format, target format, agent) triples.
+
+    Same model as ``calculate_t_info``, evaluated column-wise. Each argument
+    is a DataFrame or mapping of column -> array (or scalar, broadcast to
+    every row); missing columns or values take the scalar defaults.
+
+    Args:
+        source_formats: Source format columns
+        target_formats: Target format columns
+        agent_profiles: Agent capability columns
+        context: Optional context columns
+
+    Returns:
+        Dictionary of arrays: transformation_ratio, efficiency, fidelity,
+        domain_compatibility, energy_cost, impedance_ratio, power_efficiency,
+        and frequency_response_<type> for each of FREQUENCY_TYPES
+    """
+    n = max(batch_length(source_formats), batch_length(target_formats), batch_length(agent_profiles),
+            batch_length(context) if context is not None else 1)
+    if context is None:
+        context = {}
+
+    def src(key):
+        return column(source_formats, key, FORMAT_DEFAULTS[key], n)
+
+    def tgt(key):
+        return column(target_formats, key, FORMAT_DEFAULTS[key], n)
+
+    def agent(key, default):
+        return column(agent_profiles, key, default, n)
+
+    source_complexity = src("complexity")
+    target_complexity = tgt("complexity")
+    transformation_ratio = np.maximum(MIN_TRANSFORMATION_RATIO, np.cbrt(
+        _ratio_batch(target_complexity, source_complexity) *
+        _ratio_batch(tgt("information_density"), src("information_density")) *
+        _ratio_batch(tgt("abstraction_level"), src("abstraction_level"))
+    ))
+
+    efficiency = (
+        0.4 * agent("translation_skill", 0.7) +
+        0.3 * (agent("source_domain_knowledge", 0.6) + agent("target_domain_knowledge", 0.6)) / 2.0 +
+        0.3 * (agent("cognitive_flexibility", 0.7) + agent("analogical_reasoning", 0.6)) / 2.0
+    )
+
+    structure_match = np.where(
+        _labels(source_formats, "structure_type", "hierarchical", n).astype(str) ==
+        _labels(target_formats, "structure_type", "hierarchical", n).astype(str), 1.0, 0.6
+    )
+    modality_match = _pair_lookup(_labels(source_formats, "modality", "text", n),
+                                  _labels(target_formats, "modality", "text", n), MODALITY_COMPATIBILITY, 0.5)
+    complexity_penalty = np.minimum(0.3, np.abs(target_complexity - source_complexity) * 0.5)
+    fidelity = (
+        0.4 * (structure_match + modality_match) / 2.0 +
+        0.3 * agent("semantic_preservation_ability", 0.7) +
+        0.3 * agent("detail_retention", 0.6)
+    ) * (1.0 - complexity_penalty)
+
+    domain_compatibility = (
+        0.5 * _pair_lookup(_labels(source_formats, "domain", "general", n),
+                           _labels(target_formats, "domain", "general", n), DOMAIN_SIMILARITY, 0.5, symmetric=True) +
+        0.3 * _pair_lookup(_labels(source_formats, "conceptual_framework", "empirical", n),
+                           _labels(target_formats, "conceptual_framework", "empirical", n),
+                           FRAMEWORK_COMPATIBILITY, 0.5) +
+        0.2 * _pair_lookup(_labels(context, "source_culture", "universal", n),
+                           _labels(context, "target_culture", "universal", n),
+                           CULTURAL_COMPATIBILITY, 0.7, symmetric=True)
+    )
+
+    energy_cost = (
+        2.0 - efficiency +
+        np.abs(transformation_ratio - 1.0) +
+        (1.0 - fidelity) * 2.0 +
+        (1.0 - domain_compatibility) * 1.5
+    ) * (1.0 + 0.5 * column(context, "fatigue_level", 0.0, n) + 0.3 * column(context, "time_pressure", 0.0, n))
+
+    result = {
+        "transformation_ratio": transformation_ratio,
+        "efficiency": efficiency,
+        "fidelity": fidelity,
+        "domain_compatibility": domain_compatibility,
+        "energy_cost": energy_cost,
+        "impedance_ratio": _impedance_batch(target_formats, n) / _impedance_batch(source_formats, n),
+        "power_efficiency": efficiency * fidelity,
+    }
+    for t in FREQUENCY_TYPES:
+        result[f"frequency_response_{t}"] = (
+            np.minimum(column(source_formats, f"{t}_content", 0.5, n), column(target_formats, f"{t}_content", 0.5, n)) *
+            agent(f"{t}_translation_skill", 0.7)
+        )
+
+    if _metrics.enabled:
+        _metrics.record_batch("calculate_t_info_batch", n)
+
+    return result
+
+
+def analyze_transformer_circuit(
+    input_voltage: float,
+    transformer_specs: Dict[str, float],
+    load_impedance: float
+) -> Dict[str, float]:
+    """
+    Analyze a transformer driving a load in an information circuit.
+
+    Args:
+        input_voltage: Information voltage at the input (U_info)
+        transformer_specs: ``calculate_t_info`` output (turns_ratio, power_efficiency)
+        load_impedance: Impedance of the receiving side
+
+    Returns:
+        Input/output voltage, current and power, power loss, efficiency
+        and the load impedance reflected to the input
+    """
+    turns_ratio = max(MIN_TRANSFORMATION_RATIO, transformer_specs["turns_ratio"])
+    efficiency = transformer_specs["power_efficiency"]
+
+    # Load seen from the input side; floored to avoid division by zero
+    reflected_impedance = max(0.01, load_impedance / turns_ratio ** 2)
+    input_power = input_voltage ** 2 / reflected_impedance
+
+    return {
+        "input_voltage": input_voltage,
+        "output_voltage": input_voltage * turns_ratio,
+        "input_current": input_voltage / reflected_impedance,
+        "output_current": (input_voltage / turns_ratio) * efficiency,
+        "input_power": input_power,
+        "output_power": input_power * efficiency,
+        "power_loss": input_power * (1.0 - efficiency),
+        "efficiency": efficiency,
+        "reflected_impedance": reflected_impedance,
+    }
+
+
+def analyze_transformer_cascade(
+    transformer_chain: Sequence[Dict[str, float]],
+    input_signal: float
+) -> Dict[str, Any]:
+    """
+    Analyze transformers in series, stage by stage.
+
+    Args:
+        transformer_chain: ``calculate_t_info`` outputs in pipeline order
+        input_signal: Signal entering the first stage
+
+    Returns:
+        Per-stage signals and losses, total transformation ratio and
+        efficiency, final output and total loss
+    """
+    signal = input_signal
+    total_efficiency = 1.0
+    total_ratio = 1.0
+    stages = []
+
+    for i, transformer in enumerate(transformer_chain):
+        output_signal = signal * transformer["turns_ratio"]
+        total_efficiency *= transformer["efficiency"]
+        total_ratio *= transformer["turns_ratio"]
+        stages.append({
+            "stage": i + 1,
+            "input_signal": signal,
+            "output_signal": output_signal,
+            "signal_loss": signal * (1.0 - transformer["efficiency"]),
+            "stage_efficiency": transformer["efficiency"],
+            "cumulative_efficiency": total_efficiency,
+        })
+        signal = output_signal
+
+    return {
+        "stages": stages,
+        "total_transformation_ratio": total_ratio,
+        "total_efficiency": total_efficiency,
+        "final_output": signal,
+        "total_loss": input_signal - signal,
+    }
+
+
+def reduce_transformer_cascade(
+    stages: Mapping[str, np.ndarray],
+    mask: Optional[np.ndarray] = None,
+    axis: int = -1
+) -> Dict[str, np.ndarray]:
+    """
+    Reduce chains of transformers to single equivalent transformers.
+
+    Ratios, efficiencies and fidelities multiply along the chain
+    (CASCADE_PRODUCT), energy costs add (CASCADE_SUM), and domain
+    compatibility and frequency responses are limited by the weakest stage
+    (CASCADE_MIN). Other keys are ignored.
+
+    Args:
+        stages: ``calculate_t_info_batch``-style arrays with a stage axis
+        mask: Optional boolean array (same shape) marking real stages;
+            masked-out stages act as identity transformers, so chains of
+            different lengths can share one padded array
+        axis: Stage axis
+
+    Returns:
+        Dictionary of reduced arrays (stage axis removed)
+    """
+    reduced = {}
+    for key, values in stages.items():
+        values = np.asarray(values, dtype=np.float64)
+        if key in CASCADE_PRODUCT:
+            identity, reduce = 1.0, np.prod
+        elif key in CASCADE_SUM:
+            identity, reduce = 0.0, np.sum
+        elif key in CASCADE_MIN:
+            identity, reduce = np.inf, np.min
+        else:
+            continue
+        if mask is not None:
+            values = np.where(mask, values, identity)
+        reduced[key] = reduce(values, axis=axis)
+    return reduced
+
+
+def _rows(formats: Mapping[str, Any]) -> Dict[str, np.ndarray]:
+    return {key: np.asarray(formats[key]) for key in formats.keys()}
+
+
+def transformer_matrix(
+    formats: Mapping[str, Any],
+    agent_profile: Mapping[str, Any],
+    context: Optional[Mapping[str, Any]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    T_info for every ordered pair of formats in a catalog.
+
+    Args:
+        formats: K formats (DataFrame or mapping of column -> array)
+        agent_profile: One agent (scalars)
+        context: Optional context (scalars)
+
+    Returns:
+        Dictionary of K x K arrays; entry [i, j] is the transformer from
+        format i to format j
+    """
+    columns = _rows(formats)
+    k = batch_length(columns)
+    source = {key: np.repeat(values, k) for key, values in columns.items()}
+    target = {key: np.tile(values, k) for key, values in columns.items()}
+    pairs = calculate_t_info_batch(source, target, agent_profile, context)
+    return {key: values.reshape(k, k) for key, values in pairs.items()}
+
+
+def evaluate_pipelines(
+    formats: Mapping[str, Any],
+    pipelines: np.ndarray,
+    agent_profile: Mapping[str, Any],
+    context: Optional[Mapping[str, Any]] = None,
+    matrix: Optional[Dict[str, np.ndarray]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Evaluate candidate transformation pipelines as reduced transformers.
+
+    Every distinct format pair is evaluated once (``transformer_matrix``);
+    stage parameters are gathered for all pipelines and reduced along the
+    stage axis in one pass.
+
+    Args:
+        formats: Catalog of K formats (row 0 is typically the source document)
+        pipelines: Integer array (P, S) of format indices; each row is a
+            path through the catalog starting at the source, padded at the
+            end with -1
+        agent_profile: Agent performing the transformations
+        context: Optional context
+        matrix: Precomputed ``transformer_matrix`` (reused across calls)
+
+    Returns:
+        ``reduce_transformer_cascade`` output per pipeline, plus n_stages;
+        pipelines without a stage (fewer than two formats) get NaN
+
+    Raises:
+        ValueError: If a pipeline has -1 padding before a format index
+    """
+    pipelines = np.asarray(pipelines, dtype=np.int64)
+    if pipelines.ndim != 2 or pipelines.shape[1] < 2:
+        raise ValueError("pipelines must be a (P, S) array with S >= 2")
+    if matrix is None:
+        matrix = transformer_matrix(formats, agent_profile, context)
+
+    k = next(iter(matrix.values())).shape[0]
+    if pipelines.max(initial=-1) >= k:
+        raise ValueError(f"Format index out of range (catalog has {k} formats)")
+
+    # Stage s goes pipelines[:, s] -> pipelines[:, s + 1]; padding ends the chain
+    valid = pipelines >= 0
+    gaps = np.flatnonzero((valid[:, 1:] & ~valid[:, :-1]).any(axis=1))
+    if len(gaps):
+        raise ValueError(f"Padding (-1) must be trailing; pipeline {gaps[0]} continues after it")
+    mask = valid[:, :-1] & valid[:, 1:]
+    src = np.where(mask, pipelines[:, :-1], 0)
+    dst = np.where(mask, pipelines[:, 1:], 0)
+
+    reduced = reduce_transformer_cascade({key: values[src, dst] for key, values in matrix.items()}, mask)
+    n_stages = mask.sum(axis=1)
+    # An empty chain would reduce to the identity and outrank every real one
+    empty = n_stages == 0
+    if empty.any():
+        for values in reduced.values():
+            values[empty] = np.nan
+    reduced["n_stages"] = n_stages
+
+    if _metrics.enabled:
+        _metrics.record_batch("evaluate_pipelines", len(pipelines))
+
+    return reduced
+
+
+def rank_pipelines(
+    formats: Mapping[str, Any],
+    pipelines: np.ndarray,
+    agent_profile: Mapping[str, Any],
+    context: Optional[Mapping[str, Any]] = None,
+    key: str = "power_efficiency",
+    energy_weight: float = 0.0,
+    top_k: Optional[int] = None,
+    matrix: Optional[Dict[str, np.ndarray]] = None
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Rank candidate pipelines, best first.
+
+    Score = reduced ``key`` - energy_weight * total energy_cost. Pipelines
+    without a stage score NaN and rank last.
+
+    Args:
+        formats, pipelines, agent_profile, context, matrix: As for ``evaluate_pipelines``
+        key: Reduced quantity to maximize (e.g. "power_efficiency", "fidelity")
+        energy_weight: Penalty per unit of transformation energy
+        top_k: Return only the best ``top_k`` indices
+
+    Returns:
+        (pipeline indices sorted best first, evaluation dict with "score")
+    """
+    evaluation = evaluate_pipelines(formats, pipelines, agent_profile, context, matrix)
+    if key not in evaluation:
+        raise ValueError(f"Unknown ranking key: {key!r} (choose from {sorted(evaluation)})")
+    score = evaluation[key] - energy_weight * evaluation["energy_cost"]
+    evaluation["score"] = score
+
+    if top_k is not None and top_k < len(score):
+        top = np.argpartition(-score, top_k)[:top_k]
+        order = top[np.argsort(-score[top], kind="stable")]
+    else:
+        order = np.argsort(-score, kind="stable")
+    return order, evaluation
@@ -1,8 +1,299 @@
-"""Information Voltage Model (U_info) - placeholder"""
-
-def calculate_u_info(content_profile, weights=None):
-    """Calculate information voltage from content characteristics."""
-    # Simplified version for now
-    factual = content_profile.get("factual_density", 0.5)
-    credibility = content_profile.get("credibility", 0.5)
-    return (factual + credibility) * 5.0  # Scale to 0-10 
\ No newline at end of file
+"""
+Information Voltage Model (U_info)
+
+Driving force of content through information networks (0.1-10):
+
+    U = Content_Strength × Emotional_Multiplier × Context_Relevance × Novelty_Multiplier × Context_Modifier
+    U_info = 10 / (1 + exp(-5·(U - 1)))
+
+See theory/information_voltage_model.md.
+
+- Content strength: information density, logical coherence, factual
+  accuracy, readability, structure clarity
+- Emotional multiplier: 1 + 2·(|valence|, arousal, surprise, personal
+  significance), 1-3
+- Context relevance: the receiver's domain match, interests and goals plus
+  the content's urgency and timeliness. Without a receiver, a neutral 0.5
+  stands in for the receiver terms (0.6 at the default urgency and
+  timeliness, the theory's general relevance)
+- Novelty multiplier: 1 + (novelty, expectation violation, originality), 1-2
+- Context modifier: information noise, competing messages, medium quality
+
+Content profiles built elsewhere in the package (CLI, ``content``
+featurizer, demos) describe content by factual_density, credibility and
+semantic_quality; these stand for information_density, factual_accuracy
+and logical_coherence where the theory's own fields are missing
+(CONTENT_ALIASES).
+
+Every weight is keyed by the field it multiplies (DEFAULT_WEIGHTS).
+``compile_voltage_weights`` turns one or several weight sets into an array
+once; ``calculate_u_info_batch`` takes that table with a per-row
+``segment_index`` to score each segment (audience, channel, language)
+with its own weights.
+
+The model is written once with arithmetic that works on floats and NumPy
+arrays alike: ``calculate_u_info`` evaluates it on plain floats without
+importing NumPy, ``calculate_u_info_batch`` on whole columns.
+"""
+
+import math
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Union
+
+from ..utils import metrics as _metrics
+
+
+# Field -> (default, weight); emotional_valence enters as |valence| (-1 to +1)
+CONTENT_STRENGTH = {
+    "information_density": (0.5, 0.3),
+    "logical_coherence": (0.7, 0.2),
+    "factual_accuracy": (0.8, 0.2),
+    "readability": (0.7, 0.15),
+    "structure_clarity": (0.7, 0.15),
+}
+EMOTION = {
+    "emotional_valence": (0.0, 0.4),
+    "arousal_level": (0.5, 0.3),
+    "surprise_factor": (0.3, 0.2),
+    "personal_significance": (0.5, 0.1),
+}
+NOVELTY = {
+    "novelty": (0.5, 0.5),
+    "expectation_violation": (0.3, 0.3),
+    "originality": (0.5, 0.2),
+}
+TEMPORAL = {
+    "urgency": (0.3, 0.1),
+    "timeliness": (0.7, 0.1),
+}
+# Receiver fields; domain_expertise is weighted by the content's domain_match
+RECEIVER = {
+    "domain_expertise": (0.5, 0.3),
+    "current_interests": (0.5, 0.25),
+    "goals_alignment": (0.5, 0.25),
+}
+# Environment fields; noise and competition lower the voltage, a medium
+# better than 0.5 raises it
+CONTEXT = {
+    "information_noise": (0.3, 0.3),
+    "competing_messages": (0.3, 0.2),
+    "transmission_medium_quality": (0.8, 0.2),
+}
+
+DEFAULT_DOMAIN_MATCH = 0.5
+EMOTIONAL_GAIN = 2.0
+NEUTRAL_RELEVANCE = 0.5
+
+# Theory field -> content field used in its place when it is missing
+CONTENT_ALIASES = {
+    "information_density": "factual_density",
+    "factual_accuracy": "credibility",
+    "logical_coherence": "semantic_quality",
+}
+
+DEFAULT_WEIGHTS = {
+    key: weight
+    for group in (CONTENT_STRENGTH, EMOTION, NOVELTY, TEMPORAL, RECEIVER, CONTEXT)
+    for key, (_, weight) in group.items()
+}
+WEIGHT_KEYS = tuple(DEFAULT_WEIGHTS)
+
+_CONTENT_DEFAULTS = {
+    key: default for group in (CONTENT_STRENGTH, EMOTION, NOVELTY, TEMPORAL) for key, (default, _) in group.items()
+}
+_CONTENT_DEFAULTS["domain_match"] = DEFAULT_DOMAIN_MATCH
+
+# Every content column read by the model (aliases included)
+VOLTAGE_COLUMNS = tuple(_CONTENT_DEFAULTS) + tuple(CONTENT_ALIASES.values())
+
+U_MIN = 0.1
+U_MAX = 10.0
+
+
+def _voltage(content: Callable, weight: Callable, receiver: Optional[Callable],
+             context: Optional[Callable]):
+    """
+    Unscaled voltage U; ``content``/``receiver``/``context`` map a field to
+    its value(s) and ``weight`` a field to its weight(s), floats or arrays.
+    """
+    def weighted(group, get):
+        total = 0.0
+        for key in group:
+            total = total + weight(key) * get(key)
+        return total
+
+    strength = weighted(CONTENT_STRENGTH, content)
+    emotion = (weight("emotional_valence") * abs(content("emotional_valence"))
+               + weighted(("arousal_level", "surprise_factor", "personal_significance"), content))
+    novelty = weighted(NOVELTY, content)
+
+    relevance = weighted(TEMPORAL, content)
+    if receiver is None:
+        relevance = relevance + NEUTRAL_RELEVANCE
+    else:
+        relevance = (relevance
+                     + weight("domain_expertise") * receiver("domain_expertise") * content("domain_match")
+                     + weighted(("current_interests", "goals_alignment"), receiver))
+
+    U = strength * (1.0 + EMOTIONAL_GAIN * emotion) * relevance * (1.0 + novelty)
+    if context is not None:
+        U = U * (1.0
+                 - weight("information_noise") * context("information_noise")
+                 - weight("competing_messages") * context("competing_messages")
+                 + weight("transmission_medium_quality") * (context("transmission_medium_quality") - 0.5))
+    return U
+
+
+def _check_weights(weights: Mapping[str, float]) -> None:
+    unknown = set(weights) - set(DEFAULT_WEIGHTS)
+    if unknown:
+        raise ValueError(f"Unknown voltage weights: {sorted(unknown)} (choose from {list(WEIGHT_KEYS)})")
+
+
+def calculate_u_info(
+    content_profile: Dict[str, float],
+    weights: Optional[Dict[str, float]] = None,
+    receiver_profile: Optional[Dict[str, float]] = None,
+    context: Optional[Dict[str, float]] = None
+) -> float:
+    """
+    Calculate Information Voltage - driving force of content transmission.
+
+    Args:
+        content_profile: Content characteristics (0-1 unless noted):
+            - information_density (or factual_density), logical_coherence
+              (or semantic_quality), factual_accuracy (or credibility),
+              readability, structure_clarity
+            - emotional_valence (-1 to +1), arousal_level, surprise_factor,
+              personal_significance
+            - urgency, timeliness, domain_match
+            - novelty, expectation_violation, originality
+        weights: Optional weights overriding DEFAULT_WEIGHTS
+        receiver_profile: Optional domain_expertise, current_interests,
+            goals_alignment
+        context: Optional information_noise, competing_messages,
+            transmission_medium_quality
+
+    Returns:
+        U_info: Information voltage (0.1-10)
+    """
+    if _metrics.enabled:
+        _metrics.record_call("calculate_u_info")
+    if weights:
+        _check_weights(weights)
+        weights = {**DEFAULT_WEIGHTS, **weights}
+    else:
+        weights = DEFAULT_WEIGHTS
+
+    def content(key):
+        value = content_profile.get(key)
+        if value is None and key in CONTENT_ALIASES:
+            value = content_profile.get(CONTENT_ALIASES[key])
+        return _CONTENT_DEFAULTS[key] if value is None else value
+
+    def lookup(values, group):
+        return lambda key: values.get(key, group[key][0])
+
+    U = _voltage(
+        content, weights.__getitem__,
+        lookup(receiver_profile, RECEIVER) if receiver_profile else None,
+        lookup(context, CONTEXT) if context else None,
+    )
+    # exp overflows beyond ~709; the sigmoid is saturated long before
+    U_scaled = U_MAX / (1.0 + math.exp(min(700.0, -5.0 * (U - 1.0))))
+    return max(U_MIN, min(U_MAX, U_scaled))
+
+
+def compile_voltage_weights(weights=None):
+    """
+    Weight table for ``calculate_u_info_batch``, built once and reused.
+
+    Args:
+        weights: None (DEFAULT_WEIGHTS), a dict of weight overrides, or a
+            sequence of such dicts (None entries = defaults), one per
+            segment
+
+    Returns:
+        Array (n_sets × len(WEIGHT_KEYS)); row i is weight set i
+    """
+    import numpy as np
+
+    if weights is None or hasattr(weights, "keys"):
+        weights = [weights]
+    table = np.empty((len(weights), len(WEIGHT_KEYS)))
+    for i, overrides in enumerate(weights):
+        overrides = overrides or {}
+        _check_weights(overrides)
+        merged = {**DEFAULT_WEIGHTS, **overrides}
+        table[i] = [merged[key] for key in WEIGHT_KEYS]
+    return table
+
+
+def calculate_u_info_batch(
+    content_profiles: Mapping[str, Any],
+    weights: Union[Mapping[str, float], Sequence[Optional[Mapping[str, float]]], Any, None] = None,
+    receivers: Optional[Mapping[str, Any]] = None,
+    context: Optional[Mapping[str, Any]] = None,
+    segment_index: Optional[Any] = None
+):
+    """
+    Calculate U_info for many content items at once (array output).
+
+    Same model as ``calculate_u_info``. Missing columns or values take the
+    scalar defaults.
+
+    Args:
+        content_profiles: DataFrame or mapping of column -> array (VOLTAGE_COLUMNS)
+        weights: Weight overrides, a sequence of weight sets (one per
+            segment), or a table from ``compile_voltage_weights``
+        receivers: Optional receiver columns (arrays or scalars)
+        context: Optional context columns (arrays or scalars)
+        segment_index: Integer array giving each row's weight set; needed
+            when there is more than one set
+
+    Returns:
+        Array of U_info values (0.1-10 range)
+    """
+    import numpy as np
+    from ._batch import batch_length, column
+
+    n = batch_length(content_profiles)
+    if _metrics.enabled:
+        _metrics.record_batch("calculate_u_info_batch", n)
+
+    table = weights if isinstance(weights, np.ndarray) else compile_voltage_weights(weights)
+    if table.shape[1:] != (len(WEIGHT_KEYS),):
+        raise ValueError(f"Expected a weight table with {len(WEIGHT_KEYS)} columns, got shape {table.shape}")
+    if segment_index is not None:
+        segment_index = np.asarray(segment_index, dtype=np.intp)
+        # Only weights that differ between sets are expanded to rows
+        columns = {
+            key: float(values[0]) if (values == values[0]).all() else values.take(segment_index)
+            for key, values in zip(WEIGHT_KEYS, np.ascontiguousarray(table.T))
+        }
+        weight = columns.__getitem__
+    elif len(table) == 1:
+        weight = dict(zip(WEIGHT_KEYS, table[0].tolist())).__getitem__
+    else:
+        raise ValueError(f"{len(table)} weight sets need a segment_index")
+
+    def content(key):
+        default = _CONTENT_DEFAULTS[key]
+        alias = CONTENT_ALIASES.get(key)
+        if alias is None or alias not in content_profiles:
+            return column(content_profiles, key, default, n)
+        if key not in content_profiles:
+            return column(content_profiles, alias, default, n)
+        # Both given: the theory field wins where it has a value
+        values = column(content_profiles, key, np.nan, n)
+        return np.where(np.isnan(values), column(content_profiles, alias, default, n), values)
+
+    def lookup(values, group):
+        return lambda key: column(values, key, group[key][0], n)
+
+    U = _voltage(
+        content, weight,
+        lookup(receivers, RECEIVER) if receivers is not None else None,
+        lookup(context, CONTEXT) if context is not None else None,
+    )
+    U = U_MAX / (1.0 + np.exp(np.minimum(700.0, -5.0 * (U - 1.0))))
+    return np.clip(U, U_MIN, U_MAX, out=U)
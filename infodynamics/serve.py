@@ -0,0 +1,426 @@
+"""
+Information Dynamics Scoring Server
+
+Long-running asyncio HTTP/JSON server for online scoring. Concurrent
+requests are queued and evaluated together in micro-batches through the
+vectorized models (``score_batch``), then fanned back out:
+- a batch is flushed when it reaches ``max_batch_size`` rows or when its
+  oldest row has waited ``max_wait`` seconds
+- latency histograms (request, queue wait, batch compute) and a batch size
+  histogram are exposed at ``GET /metrics`` for tuning both against p99
+- model counters (calls, batch sizes, G_info clamps, flow saturation; see
+  ``infodynamics.utils.metrics``) are collected while serving
+
+Endpoints:
+    POST /score    {"working_memory": 7.2, ..., "quantities": ["G", "flow"]}
+                   or {"rows": [{...}, ...], "quantities": [...]}
+    GET  /metrics  Histograms and percentiles as JSON
+    GET  /metrics/prometheus
+                   The same histograms and the model counters in
+                   Prometheus text format
+    GET  /health   {"status": "ok"}
+
+Rows use the same columns as ``tools/cli.py score``; missing values take
+the scalar models' defaults. Listens on TCP or on a Unix domain socket.
+
+Usage:
+    python -m infodynamics.serve --port 8080 --max-batch-size 256 --max-wait-ms 2
+    python -m infodynamics.serve --unix-socket /tmp/infodynamics.sock
+"""
+
+import argparse
+import asyncio
+import bisect
+import json
+import math
+import time
+from http import HTTPStatus
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .models.scoring import DEFAULT_QUANTITIES, INPUT_COLUMNS, QUANTITIES, score_batch
+from .utils import metrics as model_metrics
+
+
+DEFAULT_MAX_BATCH_SIZE = 256
+DEFAULT_MAX_WAIT = 0.002  # seconds
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+# 20 µs .. ~10 s, four buckets per decade
+LATENCY_BUCKETS = tuple(2e-5 * 10 ** (i / 4) for i in range(23))
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket histogram for latencies (or any non-negative value).
+
+    Percentiles are reported as the upper bound of the bucket containing
+    them, i.e. they never understate the true value.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last bucket: +Inf
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th quantile (0 < q <= 1), capped at the max."""
+        if self.count == 0:
+            return 0.0
+        rank = math.ceil(q * self.count)
+        cumulative = 0
+        for i, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return min(self.buckets[i], self.max) if i < len(self.buckets) else self.max
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(0.50),
+            "p90": self.percentile(0.90),
+            "p99": self.percentile(0.99),
+            "buckets": [
+                {"le": le, "count": count}
+                for le, count in zip(list(self.buckets) + ["+Inf"], self.counts)
+                if count
+            ],
+        }
+
+
+class MicroBatcher:
+    """
+    Collect concurrent submissions into batches for a vectorized function.
+
+    ``batch_func`` receives a list of items and must return a list of
+    results in the same order. If it raises, every submission in the
+    batch receives the exception.
+
+    Example:
+        >>> batcher = MicroBatcher(score_rows, max_batch_size=256, max_wait=0.002)
+        >>> batcher.start()
+        >>> result = await batcher.submit(row)
+    """
+
+    def __init__(
+        self,
+        batch_func: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait: float = DEFAULT_MAX_WAIT
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.batch_func = batch_func
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.queue_wait = LatencyHistogram()
+        self.compute_time = LatencyHistogram()
+        self.batch_sizes = LatencyHistogram(buckets=[2 ** i for i in range(max_batch_size.bit_length() + 1)])
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the batching loop on the running event loop."""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def submit(self, item: Any) -> Any:
+        """Queue one item and wait for its result."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future, time.perf_counter()))
+        return await future
+
+    async def _collect(self) -> list:
+        batch = [await self._queue.get()]
+        deadline = batch[0][2] + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._collect()
+            started = time.perf_counter()
+            for _, _, enqueued in batch:
+                self.queue_wait.observe(started - enqueued)
+            self.batch_sizes.observe(len(batch))
+
+            try:
+                results = self.batch_func([item for item, _, _ in batch])
+            except Exception as e:
+                results, error = None, e
+            else:
+                error = None
+            self.compute_time.observe(time.perf_counter() - started)
+
+            for i, (_, future, _) in enumerate(batch):
+                if future.done():  # client went away
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(results[i])
+
+
+def parse_row(row: Dict[str, Any]) -> Tuple[float, ...]:
+    """Validate a request row; returns its model inputs (NaN where absent)."""
+    if not isinstance(row, dict):
+        raise ValueError("Each row must be a JSON object")
+    values = []
+    for key in INPUT_COLUMNS:
+        value = row.get(key)
+        if value is None:
+            values.append(math.nan)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            try:
+                values.append(float(value))
+            except OverflowError:  # JSON integers beyond the float range
+                raise ValueError(f"{key} is out of range") from None
+        else:
+            raise ValueError(f"{key} must be a number")
+    return tuple(values)
+
+
+def score_rows(items: List[Tuple[Tuple[float, ...], Sequence[str]]]) -> List[Dict[str, float]]:
+    """Batch function for the server: score parsed rows, return per-row results."""
+    matrix = np.array([values for values, _ in items], dtype=np.float64).reshape(len(items), len(INPUT_COLUMNS))
+    columns = {key: matrix[:, i] for i, key in enumerate(INPUT_COLUMNS)}
+    requested = dict.fromkeys(q for _, quantities in items for q in quantities)
+    scores = score_batch(columns, list(requested))
+    return [
+        {QUANTITIES[q]: float(scores[QUANTITIES[q]][i]) for q in quantities}
+        for i, (_, quantities) in enumerate(items)
+    ]
+
+
+class ScoringServer:
+    """HTTP/1.1 JSON front end for a MicroBatcher over ``score_rows``."""
+
+    def __init__(self, max_batch_size: int = DEFAULT_MAX_BATCH_SIZE, max_wait: float = DEFAULT_MAX_WAIT):
+        self.batcher = MicroBatcher(score_rows, max_batch_size, max_wait)
+        self.request_latency = LatencyHistogram()
+        self.requests = 0
+        self.errors = 0
+        self._server = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080, unix_socket: Optional[str] = None):
+        """Start listening; returns the asyncio server."""
+        self.batcher.start()
+        if unix_socket:
+            self._server = await asyncio.start_unix_server(self._handle_connection, path=unix_socket)
+        else:
+            self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.batcher.stop()
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "max_batch_size": self.batcher.max_batch_size,
+            "max_wait": self.batcher.max_wait,
+            "request_latency": self.request_latency.snapshot(),
+            "queue_wait": self.batcher.queue_wait.snapshot(),
+            "batch_compute": self.batcher.compute_time.snapshot(),
+            "batch_size": self.batcher.batch_sizes.snapshot(),
+            "model": model_metrics.metrics_snapshot(),
+        }
+
+    def prometheus(self) -> str:
+        """Server histograms and the model counters in Prometheus text format."""
+        lines = [
+            "# HELP infodynamics_server_requests_total HTTP requests served",
+            "# TYPE infodynamics_server_requests_total counter",
+            f"infodynamics_server_requests_total {self.requests}",
+            "# HELP infodynamics_server_errors_total HTTP responses other than 200",
+            "# TYPE infodynamics_server_errors_total counter",
+            f"infodynamics_server_errors_total {self.errors}",
+        ]
+        for name, help_text, histogram in (
+            ("infodynamics_server_request_seconds", "Request latency", self.request_latency),
+            ("infodynamics_server_queue_wait_seconds", "Time rows wait for a batch", self.batcher.queue_wait),
+            ("infodynamics_server_batch_compute_seconds", "Batch compute time", self.batcher.compute_time),
+            ("infodynamics_server_batch_rows", "Rows per micro-batch", self.batcher.batch_sizes),
+        ):
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+            lines += model_metrics.histogram_lines(name, histogram.buckets, histogram.counts,
+                                                   histogram.total, histogram.count)
+        return "\n".join(lines) + "\n" + model_metrics.prometheus_text()
+
+    async def _score(self, payload: Any) -> Any:
+        if not isinstance(payload, dict):
+            raise ValueError("Request body must be a JSON object")
+        quantities = payload.get("quantities", list(DEFAULT_QUANTITIES))
+        if isinstance(quantities, str):
+            quantities = [quantities]
+        unknown = [q for q in quantities if q not in QUANTITIES]
+        if unknown:
+            raise ValueError(f"Unknown quantities: {unknown} (choose from {list(QUANTITIES)})")
+
+        if "rows" in payload:
+            rows = payload["rows"]
+            if not isinstance(rows, list):
+                raise ValueError("rows must be a list")
+            parsed = [parse_row(row) for row in rows]
+            results = await asyncio.gather(*[self.batcher.submit((values, quantities)) for values in parsed])
+            return {"results": results}
+        return await self.batcher.submit((parse_row(payload), quantities))
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> Tuple[HTTPStatus, Any]:
+        path = path.split("?", 1)[0]
+        if path == "/score" and method == "POST":
+            try:
+                payload = json.loads(body or b"{}")
+                return HTTPStatus.OK, await self._score(payload)
+            except (ValueError, TypeError) as e:  # includes JSONDecodeError
+                return HTTPStatus.BAD_REQUEST, {"error": str(e)}
+        if path == "/metrics" and method == "GET":
+            return HTTPStatus.OK, self.metrics()
+        if path == "/metrics/prometheus" and method == "GET":
+            return HTTPStatus.OK, self.prometheus()
+        if path == "/health" and method == "GET":
+            return HTTPStatus.OK, {"status": "ok"}
+        if path in ("/score", "/metrics", "/metrics/prometheus", "/health"):
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": f"{method} not allowed on {path}"}
+        return HTTPStatus.NOT_FOUND, {"error": f"Unknown path: {path}"}
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                started = time.perf_counter()
+                try:
+                    method, path, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get("content-length", 0))
+                except ValueError:
+                    length = -1
+                # Without a usable length the body cannot be skipped, so the
+                # connection is closed after the error response
+                if length < 0:
+                    status, response = HTTPStatus.BAD_REQUEST, {"error": "Invalid Content-Length"}
+                    keep_alive = False
+                elif length > MAX_BODY_BYTES:
+                    status, response = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "Request body too large"}
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    status, response = await self._dispatch(method, path, body)
+                    keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+
+                if isinstance(response, str):
+                    data, content_type = response.encode(), "text/plain; version=0.0.4"
+                else:
+                    data, content_type = json.dumps(response).encode(), "application/json"
+                writer.write(
+                    f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+
+                self.requests += 1
+                if status != HTTPStatus.OK:
+                    self.errors += 1
+                if path.startswith("/score"):
+                    self.request_latency.observe(time.perf_counter() - started)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    unix_socket: Optional[str] = None,
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    max_wait: float = DEFAULT_MAX_WAIT
+) -> None:
+    """Run the scoring server until cancelled."""
+    model_metrics.enable_metrics()
+    server = ScoringServer(max_batch_size, max_wait)
+    listener = await server.start(host, port, unix_socket)
+    where = unix_socket or f"http://{host}:{port}"
+    print(f"🚀 Scoring server listening on {where} "
+          f"(max_batch_size={max_batch_size}, max_wait={max_wait * 1e3:.1f} ms)")
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        await server.stop()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Information Dynamics micro-batching scoring server")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP host (default 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="TCP port (default 8080)")
+    parser.add_argument("--unix-socket", help="Listen on a Unix domain socket instead of TCP")
+    parser.add_argument("--max-batch-size", type=int, default=DEFAULT_MAX_BATCH_SIZE,
+                        help="Maximum rows per batch")
+    parser.add_argument("--max-wait-ms", type=float, default=DEFAULT_MAX_WAIT * 1e3,
+                        help="Maximum time the oldest queued row waits for a batch to fill")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix_socket, args.max_batch_size, args.max_wait_ms / 1e3))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
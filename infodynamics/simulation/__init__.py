@@ -0,0 +1,21 @@
+"""
+Information Dynamics Simulation
+
+Synthetic data generators for validation and scale testing:
+- Cohorts: Chunked, seeded versions of the simulated validation cohorts
+- BIDS: Synthetic ds004636-style events trees for the real-data validators
+"""
+
+from .bids import write_bids_dataset
+from .cohorts import (
+    generate_cohort,
+    iter_cohort_chunks,
+    write_cohort_parquet,
+)
+
+__all__ = [
+    'generate_cohort',
+    'iter_cohort_chunks',
+    'write_cohort_parquet',
+    'write_bids_dataset',
+]
@@ -0,0 +1,304 @@
+"""
+Synthetic ds004636 BIDS Trees
+
+Writes a BIDS-layout tree that the real-data Stanford validators in
+``analysis/validation/zero-shot`` can read in place of ds004636:
+
+    root/participants.tsv
+    root/sub-*/ses-{1,2}/func/sub-*_ses-*_task-{task}_run-1_events.tsv
+
+Each participant gets latent traits (speed, accuracy, Stroop interference,
+switch cost, SSRT), and their events are drawn from those traits. The columns
+and units are the ones ``_compute_task_metrics`` and the simple validator read:
+
+- response_time in ms, ``n/a`` for omissions and successful stops
+- correct as 0/1
+- DPX: trial_type AX/AY/BX/BY in the standard 11:2:2:1 ratio
+- stroop: condition (and trial_type) congruent/incongruent
+- twoByTwo: trial_type task_switch/task_repeat
+- stopSignal, motorSelectiveStop: trial_type go/stop (plus ignore for the
+  motor-selective task), stop_signal_delay and SS_delay in ms from a
+  one-up/one-down staircase, stopped as 0/1
+
+Participants are generated in chunks. Chunk i draws from
+``SeedSequence(seed).spawn(n_chunks)[i]``, as in ``cohorts``, so the tree is
+byte-identical for any number of worker processes. Within a chunk every task
+is drawn as an (n_participants, n_trials) array and written with one
+``to_csv`` call, so large trees (N = 100k) are bounded by file creation
+rather than by per-file pandas overhead.
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .cohorts import _chunk_plan
+
+
+DEFAULT_CHUNK_SIZE = 500
+
+# Session of each task in ds004636 (the validators try ses-1, then ses-2)
+TASK_SESSIONS: Dict[str, str] = {
+    'stopSignal': 'ses-1',
+    'motorSelectiveStop': 'ses-1',
+    'DPX': 'ses-2',
+    'stroop': 'ses-2',
+    'twoByTwo': 'ses-2',
+}
+
+DEFAULT_TRIALS: Dict[str, int] = {
+    'DPX': 128,
+    'stroop': 96,
+    'twoByTwo': 128,
+    'stopSignal': 125,
+    'motorSelectiveStop': 125,
+}
+
+# Stimulus duration and mean inter-trial interval, seconds
+TIMING: Dict[str, tuple] = {
+    'DPX': (1.5, 2.0),
+    'stroop': (1.5, 0.5),
+    'twoByTwo': (1.0, 1.0),
+    'stopSignal': (1.0, 1.0),
+    'motorSelectiveStop': (1.0, 1.0),
+}
+
+SSD_START, SSD_STEP, SSD_MAX = 250.0, 50.0, 850.0
+RESPONSE_WINDOW = 1500.0  # ms; slower go responses are omissions
+
+
+def _participant_traits(rng: np.random.Generator, n: int) -> pd.DataFrame:
+    """Demographics and the latent traits the task events are drawn from."""
+    age = np.clip(rng.normal(34.2, 12.8, n), 18, 75).round().astype(int)
+    return pd.DataFrame({
+        'Age': age,
+        'Gender': rng.choice(['Male', 'Female'], n, p=[0.492, 0.508]),
+        # Median RT slows with age
+        'base_rt': rng.lognormal(np.log(600), 0.15, n) + 2.0 * np.maximum(age - 25, 0),
+        'rt_noise': rng.uniform(0.15, 0.3, n),
+        'accuracy': rng.beta(18, 2, n),
+        'stroop_effect': rng.normal(90, 30, n),
+        'switch_cost': rng.normal(120, 45, n),
+        'context_cost': rng.normal(60, 25, n),
+        'ssrt': rng.normal(230, 35, n),
+    })
+
+
+def _rt(rng, traits, shape):
+    """Log-normal trial RTs (ms) around each participant's base RT."""
+    sigma = traits['rt_noise'].to_numpy()[:, None]
+    return traits['base_rt'].to_numpy()[:, None] * rng.lognormal(-sigma ** 2 / 2, sigma, shape)
+
+
+def _correct(rng, p, shape):
+    return (rng.random(shape) < np.clip(p, 0.0, 1.0)).astype(int)
+
+
+def _dpx(rng, traits, shape):
+    trial_type = rng.choice(['AX', 'AY', 'BX', 'BY'], shape, p=[11 / 16, 2 / 16, 2 / 16, 1 / 16])
+    rt = _rt(rng, traits, shape) + np.where(trial_type == 'AY', traits['context_cost'].to_numpy()[:, None], 0.0)
+    p = traits['accuracy'].to_numpy()[:, None] - np.where(trial_type == 'AY', 0.10, 0.0) - np.where(trial_type == 'BX', 0.05, 0.0)
+    return {'trial_type': trial_type, 'response_time': rt, 'correct': _correct(rng, p, shape)}
+
+
+def _stroop(rng, traits, shape):
+    condition = np.where(rng.random(shape) < 0.5, 'congruent', 'incongruent')
+    incongruent = condition == 'incongruent'
+    rt = _rt(rng, traits, shape) + np.where(incongruent, traits['stroop_effect'].to_numpy()[:, None], 0.0)
+    p = traits['accuracy'].to_numpy()[:, None] - np.where(incongruent, 0.06, 0.0)
+    return {'trial_type': condition, 'condition': condition, 'response_time': rt, 'correct': _correct(rng, p, shape)}
+
+
+def _two_by_two(rng, traits, shape):
+    trial_type = np.where(rng.random(shape) < 1 / 3, 'task_switch', 'task_repeat')
+    switch = trial_type == 'task_switch'
+    rt = _rt(rng, traits, shape) + np.where(switch, traits['switch_cost'].to_numpy()[:, None], 0.0)
+    p = traits['accuracy'].to_numpy()[:, None] - np.where(switch, 0.05, 0.0)
+    return {'trial_type': trial_type, 'response_time': rt, 'correct': _correct(rng, p, shape)}
+
+
+def _stop_task(rng, traits, shape, selective=False):
+    """
+    Go/stop trials under the independent race model, with the stop-signal
+    delay tracked by a one-up/one-down staircase per participant.
+    """
+    n, n_trials = shape
+    u = rng.random(shape)
+    trial_type = np.where(u < 0.25, 'stop', 'go')
+    if selective:
+        # Stop signals on non-critical trials are to be ignored
+        trial_type = np.where((trial_type == 'stop') & (rng.random(shape) < 0.5), 'ignore', trial_type)
+    stop = trial_type == 'stop'
+
+    go_rt = _rt(rng, traits, shape) * 0.9
+    ssrt = traits['ssrt'].to_numpy()
+    ssd = np.full(shape, np.nan)
+    stopped = np.zeros(shape, dtype=int)
+
+    # Staircase runs over trials, vectorized across participants
+    current = np.full(n, SSD_START)
+    for t in range(n_trials):
+        on = stop[:, t]
+        if not on.any():
+            continue
+        ssd[on, t] = current[on]
+        success = on & (go_rt[:, t] > current + ssrt)
+        stopped[:, t] = success
+        current = np.where(on, np.clip(current + np.where(success, SSD_STEP, -SSD_STEP), 0.0, SSD_MAX), current)
+
+    omitted = go_rt > RESPONSE_WINDOW
+    rt = np.where(stopped.astype(bool) | (~stop & omitted), np.nan, go_rt)
+    go_correct = _correct(rng, traits['accuracy'].to_numpy()[:, None], shape) & ~omitted
+    return {
+        'trial_type': trial_type,
+        'response_time': rt,
+        'correct': np.where(stop, stopped, go_correct).astype(int),
+        'stopped': stopped,
+        'stop_signal_delay': ssd,
+        'SS_delay': ssd,
+    }
+
+
+TASK_GENERATORS = {
+    'DPX': _dpx,
+    'stroop': _stroop,
+    'twoByTwo': _two_by_two,
+    'stopSignal': _stop_task,
+    'motorSelectiveStop': lambda rng, traits, shape: _stop_task(rng, traits, shape, selective=True),
+}
+
+
+def generate_task_events(task: str, traits: pd.DataFrame, n_trials: int,
+                         rng: np.random.Generator) -> pd.DataFrame:
+    """
+    Events of one task for a block of participants.
+
+    Args:
+        task: Task name (key of TASK_SESSIONS)
+        traits: Participant traits, one row per participant
+        n_trials: Trials per participant
+        rng: Random generator
+
+    Returns:
+        DataFrame with ``len(traits) * n_trials`` rows, participant-major,
+        with onset and duration in seconds followed by the task columns
+    """
+    if task not in TASK_GENERATORS:
+        raise ValueError(f"Unknown task: {task}. Available: {list(TASK_GENERATORS)}")
+
+    shape = (len(traits), n_trials)
+    columns = TASK_GENERATORS[task](rng, traits, shape)
+
+    duration, iti = TIMING[task]
+    gaps = duration + rng.exponential(iti, shape)
+    onset = np.cumsum(gaps, axis=1) - gaps[:, :1]
+
+    events = {'onset': onset.round(3), 'duration': np.full(shape, duration)}
+    events.update(columns)
+    events['response_time'] = np.round(events['response_time'], 1)
+    return pd.DataFrame({name: np.asarray(values).ravel() for name, values in events.items()})
+
+
+def _participant_ids(start: int, n: int, n_total: int) -> List[str]:
+    width = max(3, len(str(n_total)))
+    return [f"sub-s{i:0{width}d}" for i in range(start + 1, start + n + 1)]
+
+
+def _write_chunk(args) -> pd.DataFrame:
+    """Write the events files of one participant chunk; returns its participants rows."""
+    root, seed_seq, start, n, n_total, trials = args
+    rng = np.random.default_rng(seed_seq)
+
+    traits = _participant_traits(rng, n)
+    ids = _participant_ids(start, n, n_total)
+
+    for pid in ids:
+        for session in set(TASK_SESSIONS[task] for task in trials):
+            os.makedirs(os.path.join(root, pid, session, 'func'), exist_ok=True)
+
+    for task, n_trials in trials.items():
+        session = TASK_SESSIONS[task]
+        events = generate_task_events(task, traits, n_trials, rng)
+        header = '\t'.join(events.columns) + '\n'
+        lines = events.to_csv(sep='\t', index=False, header=False, na_rep='n/a',
+                              lineterminator='\n').splitlines(keepends=True)
+        for i, pid in enumerate(ids):
+            path = os.path.join(root, pid, session, 'func', f"{pid}_{session}_task-{task}_run-1_events.tsv")
+            with open(path, 'w') as f:
+                f.write(header)
+                f.writelines(lines[i * n_trials:(i + 1) * n_trials])
+
+    return pd.DataFrame({'participant_id': ids, 'Age': traits['Age'], 'Gender': traits['Gender']})
+
+
+def write_bids_dataset(
+    root: str,
+    n_participants: int,
+    seed: int = 42,
+    tasks: Optional[Iterable[str]] = None,
+    n_trials: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    n_workers: int = 1
+) -> pd.DataFrame:
+    """
+    Write a synthetic ds004636-style tree under root.
+
+    Args:
+        root: Output directory (created if missing)
+        n_participants: Number of participants
+        seed: Root seed; the tree does not depend on n_workers
+        tasks: Subset of TASK_SESSIONS (default: all five tasks)
+        n_trials: Trials per task for every task (default: DEFAULT_TRIALS)
+        chunk_size: Participants per work item
+        n_workers: Worker processes
+
+    Returns:
+        The participants table written to ``participants.tsv``
+    """
+    tasks = list(tasks) if tasks is not None else list(TASK_SESSIONS)
+    unknown = [task for task in tasks if task not in TASK_SESSIONS]
+    if unknown:
+        raise ValueError(f"Unknown tasks: {unknown}. Available: {list(TASK_SESSIONS)}")
+    trials = {task: n_trials or DEFAULT_TRIALS[task] for task in tasks}
+
+    os.makedirs(root, exist_ok=True)
+    plan = [(root, seq, start, n, n_participants, trials)
+            for seq, start, n in _chunk_plan(n_participants, chunk_size, seed)]
+
+    if n_workers <= 1:
+        chunks = [_write_chunk(item) for item in plan]
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            chunks = list(executor.map(_write_chunk, plan))
+
+    participants = pd.concat(chunks, ignore_index=True) if chunks else \
+        pd.DataFrame(columns=['participant_id', 'Age', 'Gender'])
+    participants.to_csv(os.path.join(root, 'participants.tsv'), sep='\t', index=False)
+    return participants
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Write a synthetic ds004636-style BIDS tree')
+    parser.add_argument('root', help='Output directory')
+    parser.add_argument('-n', '--participants', type=int, default=100, help='Number of participants')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--tasks', help=f"Comma-separated subset of {','.join(TASK_SESSIONS)}")
+    parser.add_argument('--trials', type=int, help='Trials per task (default: per-task ds004636 counts)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--workers', type=int, default=1)
+    args = parser.parse_args()
+
+    participants = write_bids_dataset(
+        args.root, args.participants, seed=args.seed,
+        tasks=args.tasks.split(',') if args.tasks else None,
+        n_trials=args.trials, chunk_size=args.chunk_size, n_workers=args.workers
+    )
+    print(f"Wrote {len(participants)} participants to {args.root}")
+
+
+if __name__ == '__main__':
+    main()
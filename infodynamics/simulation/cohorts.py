@@ -0,0 +1,447 @@
+"""
+Chunked Synthetic Cohort Generators
+
+Seeded, chunk-at-a-time versions of the simulated cohorts used by the
+validation scripts in ``simulation/analysis``:
+
+- hcp: HCP-like conductivity cohort (HCPConductivityAnalyzerV2.load_hcp_data)
+- l_info: Inductance cohort (LInfoValidator.generate_simulated_data)
+- t_eff: Transformation documents (TEffValidator.generate_transformation_data)
+- stanford: Stanford self-regulation battery (StanfordValidation.simulate_stanford_data)
+
+Every chunk draws from its own ``numpy.random.Generator`` seeded with
+``SeedSequence(seed).spawn(n_chunks)[i]``. Chunk boundaries depend only on
+``chunk_size``, so the generated cohort is bit-identical whether the chunks
+are produced serially or by any number of worker processes.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def _hcp_chunk(rng: np.random.Generator, start: int, n: int) -> pd.DataFrame:
+    """HCP-like cohort with the true G_info component relationships."""
+
+    # Demographics
+    ages = np.clip(rng.normal(28.5, 6.2, n), 17, 40)
+    genders = rng.choice(['M', 'F'], n, p=[0.5, 0.5])
+    education = rng.normal(15.2, 2.1, n)
+
+    # Personality (NEO-FFI)
+    personality = rng.multivariate_normal(
+        mean=[0.5, 0.5, 0.5, 0.5, 0.5],
+        cov=np.eye(5) * 0.1,
+        size=n
+    )
+
+    # Cognitive abilities
+    working_memory = rng.normal(0, 1, n)
+    processing_speed = rng.normal(0, 1, n)
+    intelligence = 0.6 * working_memory + 0.4 * processing_speed + rng.normal(0, 0.5, n)
+
+    # Information conductivity components
+    k_individual = 0.5 * intelligence + 0.3 * personality[:, 0] + rng.normal(0, 0.3, n)
+    attention_focus = 0.7 * working_memory + 0.2 * personality[:, 3] + rng.normal(0, 0.4, n)
+    cognitive_load_ratio = np.clip(
+        0.3 + 0.4 * (1 - processing_speed) + 0.3 * personality[:, 4] + rng.normal(0, 0.2, n),
+        0.1, 0.9
+    )
+
+    # Target with nonlinearity and interactions
+    cognitive_performance = (
+        0.6 * k_individual +
+        0.4 * attention_focus +
+        0.3 * (1 - cognitive_load_ratio) +
+        0.2 * k_individual * attention_focus +
+        0.1 * k_individual * (1 - cognitive_load_ratio) +
+        -0.15 * attention_focus * cognitive_load_ratio +
+        rng.normal(0, 0.3, n)
+    )
+
+    return pd.DataFrame({
+        'Subject_ID': np.arange(start + 1, start + n + 1),
+        'Age': ages,
+        'Gender': genders,
+        'Education': education,
+        'NEO_Openness': personality[:, 0],
+        'NEO_Conscientiousness': personality[:, 1],
+        'NEO_Extraversion': personality[:, 2],
+        'NEO_Agreeableness': personality[:, 3],
+        'NEO_Neuroticism': personality[:, 4],
+        'Working_Memory': working_memory,
+        'Processing_Speed': processing_speed,
+        'Intelligence': intelligence,
+        'k_individual': k_individual,
+        'attention_focus': attention_focus,
+        'cognitive_load_ratio': cognitive_load_ratio,
+        'cognitive_performance': cognitive_performance
+    })
+
+
+def _l_info_chunk(rng: np.random.Generator, start: int, n: int) -> pd.DataFrame:
+    """Three-component L_info cohort (temporal, cognitive, systemic)."""
+
+    ages = np.clip(rng.normal(30, 8, n), 18, 65)
+    education = rng.normal(16, 3, n)
+
+    working_memory = rng.normal(0, 1, n)
+    processing_speed = rng.normal(0, 1, n)
+    intelligence = 0.6 * working_memory + 0.4 * processing_speed + rng.normal(0, 0.4, n)
+
+    openness = rng.normal(0, 1, n)
+    conscientiousness = rng.normal(0, 1, n)
+    neuroticism = rng.normal(0, 1, n)
+
+    # L_temporal: mental chronometry
+    memory_scan_time = 50 + 15 * rng.exponential(1, n)
+    decision_time = 300 + 100 * rng.exponential(0.8, n)
+    interference_susceptibility = 0.5 + 0.3 * neuroticism + rng.normal(0, 0.2, n)
+    l_temporal = (
+        0.4 * (memory_scan_time - 50) / 15 +
+        0.3 * (decision_time - 300) / 100 +
+        0.3 * interference_susceptibility +
+        rng.normal(0, 0.2, n)
+    )
+
+    # L_cognitive: belief updating
+    belief_persistence = 0.5 - 0.4 * openness + 0.2 * conscientiousness + rng.normal(0, 0.3, n)
+    confirmation_bias = 0.5 + 0.3 * neuroticism - 0.2 * intelligence + rng.normal(0, 0.2, n)
+    cognitive_rigidity = 0.5 - 0.5 * working_memory + 0.2 * ages / 65 + rng.normal(0, 0.25, n)
+    l_cognitive = (
+        0.4 * belief_persistence +
+        0.3 * confirmation_bias +
+        0.3 * cognitive_rigidity +
+        rng.normal(0, 0.2, n)
+    )
+
+    # L_systemic: organizational inertia
+    hierarchy_position = rng.uniform(0, 1, n)
+    team_size = rng.choice([3, 5, 8, 12, 20], n, p=[0.2, 0.3, 0.25, 0.15, 0.1])
+    organizational_tenure = rng.exponential(3, n)
+    change_resistance = 0.3 + 0.4 * organizational_tenure / 10 + 0.2 * hierarchy_position + rng.normal(0, 0.2, n)
+    l_systemic = (
+        0.3 * change_resistance +
+        0.25 * (team_size - 3) / 17 +
+        0.25 * hierarchy_position +
+        0.2 * np.tanh(organizational_tenure / 5) +
+        rng.normal(0, 0.2, n)
+    )
+
+    l_info_composite = 0.4 * l_temporal + 0.35 * l_cognitive + 0.25 * l_systemic
+
+    # Outcomes
+    task_switch_cost = 200 + 300 * l_temporal + 250 * l_cognitive + rng.normal(0, 50, n)
+    task_switch_performance = 1 / (1 + task_switch_cost / 1000)
+    learning_rate = np.clip(0.8 - 0.4 * l_cognitive - 0.2 * l_temporal + rng.normal(0, 0.1, n), 0.1, 1.0)
+    org_adaptation_time = 30 + 60 * l_systemic + 20 * l_cognitive + rng.normal(0, 10, n)
+    org_adaptation_performance = 1 / (1 + org_adaptation_time / 100)
+    info_processing_delay = (
+        0.4 * (1 - task_switch_performance) +
+        0.3 * (1 - learning_rate) +
+        0.3 * (1 - org_adaptation_performance) +
+        rng.normal(0, 0.1, n)
+    )
+
+    return pd.DataFrame({
+        'subject_id': np.arange(start + 1, start + n + 1),
+        'age': ages,
+        'education': education,
+        'working_memory': working_memory,
+        'processing_speed': processing_speed,
+        'intelligence': intelligence,
+        'openness': openness,
+        'conscientiousness': conscientiousness,
+        'neuroticism': neuroticism,
+        'memory_scan_time': memory_scan_time,
+        'decision_time': decision_time,
+        'interference_susceptibility': interference_susceptibility,
+        'l_temporal': l_temporal,
+        'belief_persistence': belief_persistence,
+        'confirmation_bias': confirmation_bias,
+        'cognitive_rigidity': cognitive_rigidity,
+        'l_cognitive': l_cognitive,
+        'hierarchy_position': hierarchy_position,
+        'team_size': team_size,
+        'organizational_tenure': organizational_tenure,
+        'change_resistance': change_resistance,
+        'l_systemic': l_systemic,
+        'l_info_composite': l_info_composite,
+        'task_switch_performance': task_switch_performance,
+        'learning_rate': learning_rate,
+        'org_adaptation_performance': org_adaptation_performance,
+        'info_processing_delay': info_processing_delay
+    })
+
+
+def _t_eff_chunk(rng: np.random.Generator, start: int, n: int) -> pd.DataFrame:
+    """Document transformations with semantic, factual and quality components."""
+
+    source_length = rng.lognormal(6, 0.8, n)
+    source_complexity = rng.beta(2, 5, n)
+    source_domain = rng.choice(['scientific', 'news', 'educational', 'social'],
+                               n, p=[0.25, 0.3, 0.25, 0.2])
+
+    compression_ratio = rng.uniform(0.2, 0.8, n)
+    target_audience = rng.choice(['expert', 'general', 'novice'], n, p=[0.3, 0.4, 0.3])
+    transformation_type = rng.choice(['summarization', 'simplification', 'translation', 'adaptation'],
+                                     n, p=[0.4, 0.3, 0.2, 0.1])
+
+    # Semantic preservation
+    domain_effect = np.where(source_domain == 'scientific', -0.1,
+                    np.where(source_domain == 'social', 0.1, 0))
+    type_effect = np.where(transformation_type == 'translation', -0.15,
+                  np.where(transformation_type == 'simplification', 0.1, 0))
+    semantic_preservation = np.clip(
+        0.8 - 0.3 * source_complexity - 0.4 * (1 - compression_ratio)**2 +
+        domain_effect + type_effect + rng.normal(0, 0.1, n),
+        0.1, 1.0
+    )
+
+    # Factual density
+    factual_base = 0.6 + 0.3 * np.where(source_domain == 'scientific', 1,
+                               np.where(source_domain == 'news', 0.7, 0.3))
+    audience_effect = np.where(target_audience == 'expert', 0.2,
+                      np.where(target_audience == 'novice', -0.2, 0))
+    factual_density = np.clip(
+        factual_base + 0.2 * np.tanh(source_length / 1000) + audience_effect + rng.normal(0, 0.1, n),
+        0.1, 1.0
+    )
+
+    # Quality enhancement
+    enhancement_by_type = np.where(transformation_type == 'simplification', 0.3,
+                          np.where(transformation_type == 'adaptation', 0.25,
+                          np.where(transformation_type == 'summarization', 0.1, -0.1)))
+    audience_match = np.where((target_audience == 'novice') & (source_complexity < 0.3), 0.2,
+                     np.where((target_audience == 'expert') & (source_complexity > 0.7), 0.2,
+                     np.where((target_audience == 'general') & (source_complexity < 0.6) & (source_complexity > 0.3), 0.15, 0)))
+    compression_quality = 0.3 * (1 - np.abs(compression_ratio - 0.5))
+    quality_enhancement = np.clip(
+        0.5 + enhancement_by_type + audience_match + compression_quality + rng.normal(0, 0.1, n),
+        0.1, 1.0
+    )
+
+    t_eff_composite = 0.5 * semantic_preservation + 0.3 * factual_density + 0.2 * quality_enhancement
+
+    # Outcomes
+    user_satisfaction = np.clip(
+        0.4 * semantic_preservation + 0.3 * quality_enhancement + 0.2 * factual_density +
+        0.1 * (1 - np.abs(compression_ratio - 0.5)) + rng.normal(0, 0.1, n),
+        0.1, 1.0
+    )
+    task_completion = np.clip(
+        0.5 * quality_enhancement + 0.3 * semantic_preservation + 0.2 * (1 - source_complexity) +
+        rng.normal(0, 0.1, n),
+        0.1, 1.0
+    )
+    retention_score = np.clip(
+        0.6 * semantic_preservation + 0.3 * factual_density + 0.1 * quality_enhancement +
+        rng.normal(0, 0.1, n),
+        0.1, 1.0
+    )
+    transformation_success = 0.4 * user_satisfaction + 0.3 * task_completion + 0.3 * retention_score
+
+    return pd.DataFrame({
+        'doc_id': np.arange(start + 1, start + n + 1),
+        'source_length': source_length,
+        'source_complexity': source_complexity,
+        'source_domain': source_domain,
+        'compression_ratio': compression_ratio,
+        'target_audience': target_audience,
+        'transformation_type': transformation_type,
+        'semantic_preservation': semantic_preservation,
+        'factual_density': factual_density,
+        'quality_enhancement': quality_enhancement,
+        't_eff_composite': t_eff_composite,
+        'user_satisfaction': user_satisfaction,
+        'task_completion': task_completion,
+        'retention_score': retention_score,
+        'transformation_success': transformation_success
+    })
+
+
+def _stanford_chunk(rng: np.random.Generator, start: int, n: int) -> pd.DataFrame:
+    """Stanford self-regulation battery, already merged to one row per subject."""
+
+    ids = np.arange(start + 1, start + n + 1)
+
+    return pd.DataFrame({
+        'subject_id': [f'sub-{i:03d}' for i in ids],
+        'age': rng.normal(24, 5, n),
+        'sex': rng.choice(['M', 'F'], n, p=[0.35, 0.65]),
+        'education': rng.normal(15, 2, n),
+        # ANT (Attention Network Test)
+        'ant_alerting': rng.normal(50, 15, n),
+        'ant_orienting': rng.normal(40, 12, n),
+        'ant_executive': rng.normal(80, 20, n),
+        'ant_accuracy': rng.beta(8, 1, n),
+        'ant_rt_mean': rng.normal(650, 80, n),
+        # Stop Signal Task
+        'sst_go_rt': rng.normal(550, 70, n),
+        'sst_stop_success_rate': rng.normal(0.5, 0.1, n),
+        'sst_ssrt': rng.normal(220, 40, n),
+        'sst_accuracy': rng.beta(9, 1, n),
+        # Stroop Task
+        'stroop_congruent_rt': rng.normal(580, 60, n),
+        'stroop_incongruent_rt': rng.normal(680, 80, n),
+        'stroop_effect': rng.normal(100, 30, n),
+        'stroop_accuracy': rng.beta(8, 1, n),
+        # Task Switching
+        'switch_cost_rt': rng.normal(150, 50, n),
+        'switch_accuracy': rng.beta(7, 1, n),
+        'switch_stay_rt': rng.normal(700, 80, n),
+        'switch_switch_rt': rng.normal(850, 100, n),
+        # Working Memory
+        'wm_capacity': rng.normal(4, 1.2, n),
+        'wm_accuracy': rng.beta(6, 2, n),
+        'processing_speed': rng.normal(0, 1, n)
+    })
+
+
+COHORT_GENERATORS: Dict[str, Callable[[np.random.Generator, int, int], pd.DataFrame]] = {
+    "hcp": _hcp_chunk,
+    "l_info": _l_info_chunk,
+    "t_eff": _t_eff_chunk,
+    "stanford": _stanford_chunk,
+}
+
+
+def _chunk_plan(n_subjects: int, chunk_size: int, seed: int) -> List[tuple]:
+    """Split a cohort into (seed_sequence, start, size) work items."""
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if n_subjects < 0:
+        raise ValueError("n_subjects must be non-negative")
+
+    n_chunks = -(-n_subjects // chunk_size)  # ceil division
+    children = np.random.SeedSequence(seed).spawn(n_chunks)
+
+    plan = []
+    for i, child in enumerate(children):
+        start = i * chunk_size
+        plan.append((child, start, min(chunk_size, n_subjects - start)))
+    return plan
+
+
+def generate_chunk(cohort: str, seed_seq: np.random.SeedSequence, start: int, n: int) -> pd.DataFrame:
+    """
+    Generate one chunk of a cohort.
+
+    Args:
+        cohort: Cohort name (key of COHORT_GENERATORS)
+        seed_seq: Seed sequence for this chunk
+        start: Zero-based index of the first subject in the chunk
+        n: Number of subjects in the chunk
+
+    Returns:
+        DataFrame with one row per subject
+    """
+    if cohort not in COHORT_GENERATORS:
+        raise ValueError(f"Unknown cohort: {cohort}. Available: {list(COHORT_GENERATORS)}")
+
+    rng = np.random.default_rng(seed_seq)
+    return COHORT_GENERATORS[cohort](rng, start, n)
+
+
+def _generate_work_item(args):
+    cohort, seed_seq, start, n = args
+    return generate_chunk(cohort, seed_seq, start, n)
+
+
+def iter_cohort_chunks(
+    cohort: str,
+    n_subjects: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    seed: int = 42,
+    n_workers: int = 1
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield a synthetic cohort as fixed-size DataFrame chunks, in order.
+
+    Args:
+        cohort: One of "hcp", "l_info", "t_eff", "stanford"
+        n_subjects: Total cohort size
+        chunk_size: Rows per chunk (the last chunk may be shorter)
+        seed: Root seed; chunk i uses SeedSequence(seed).spawn(n_chunks)[i]
+        n_workers: Worker processes; does not change the output
+
+    Yields:
+        DataFrame chunks covering subjects 1..n_subjects
+    """
+    plan = [(cohort, seq, start, n) for seq, start, n in _chunk_plan(n_subjects, chunk_size, seed)]
+
+    if n_workers <= 1:
+        for item in plan:
+            yield _generate_work_item(item)
+        return
+
+    # Keep a bounded window of chunks in flight so memory stays flat
+    window = 2 * n_workers
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        pending = [executor.submit(_generate_work_item, item) for item in plan[:window]]
+        next_item = len(pending)
+        while pending:
+            chunk = pending.pop(0).result()
+            if next_item < len(plan):
+                pending.append(executor.submit(_generate_work_item, plan[next_item]))
+                next_item += 1
+            yield chunk
+
+
+def generate_cohort(
+    cohort: str,
+    n_subjects: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    seed: int = 42,
+    n_workers: int = 1
+) -> pd.DataFrame:
+    """Generate a whole cohort in memory (concatenation of iter_cohort_chunks)."""
+    chunks = list(iter_cohort_chunks(cohort, n_subjects, chunk_size, seed, n_workers))
+    if not chunks:
+        # No subjects: an empty frame that still has the cohort's columns
+        return generate_chunk(cohort, np.random.SeedSequence(seed), 0, 0)
+    return pd.concat(chunks, ignore_index=True)
+
+
+def write_cohort_parquet(
+    cohort: str,
+    path: str,
+    n_subjects: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    seed: int = 42,
+    n_workers: int = 1,
+    compression: Optional[str] = "snappy"
+) -> int:
+    """
+    Stream a synthetic cohort straight to a Parquet file, one row group per chunk.
+
+    Requires pyarrow. Only ``2 * n_workers`` chunks are held in memory at once.
+
+    Returns:
+        Number of rows written
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("write_cohort_parquet requires pyarrow (pip install pyarrow)") from e
+
+    writer = None
+    n_written = 0
+    try:
+        for chunk in iter_cohort_chunks(cohort, n_subjects, chunk_size, seed, n_workers):
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema, compression=compression)
+            writer.write_table(table)
+            n_written += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return n_written
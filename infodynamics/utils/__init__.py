@@ -2,5 +2,22 @@
 
 from .validators import validate_input_ranges
 from .converters import normalize_scores, denormalize_scores
+from .metrics import (
+    disable_metrics,
+    enable_metrics,
+    metrics_snapshot,
+    prometheus_text,
+)
+from .profiling import (
+    disable_profiling,
+    enable_profiling,
+    get_profiler,
+    profiled,
+    stage,
+)
 
-__all__ = ['validate_input_ranges', 'normalize_scores', 'denormalize_scores'] 
\ No newline at end of file
+__all__ = [
+    'validate_input_ranges', 'normalize_scores', 'denormalize_scores',
+    'enable_profiling', 'disable_profiling', 'get_profiler', 'stage', 'profiled',
+    'enable_metrics', 'disable_metrics', 'metrics_snapshot', 'prometheus_text',
+] 
\ No newline at end of file
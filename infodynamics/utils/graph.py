@@ -0,0 +1,157 @@
+"""
+Compressed Sparse Row Graphs
+
+Directed graphs of agents stored as CSR arrays, for the cascade and
+influence models on networks with millions of nodes:
+
+    indptr   (n_nodes + 1,) int64   out-edges of u are indptr[u]:indptr[u + 1]
+    indices  (n_edges,)     int32/int64 edge targets, grouped by source
+    weights  (n_edges,)     float64 tie strength (optional, default 1)
+
+Edge u -> v means u's adoption reaches v (follower direction).
+
+``save`` writes the arrays as ``.npy`` files in a directory and ``load``
+opens them as memory maps, so worker processes share one copy of a large
+graph through the page cache. A graph loaded that way pickles as its path,
+not its arrays.
+
+Example:
+    >>> graph = CSRGraph.from_edges(follows["followee"], follows["follower"])
+    >>> graph.save("graph")
+    >>> graph = CSRGraph.load("graph")
+"""
+
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+PathLike = Union[str, Path]
+
+
+def _index_dtype(n: int) -> np.dtype:
+    return np.dtype(np.int32) if n < 2 ** 31 else np.dtype(np.int64)
+
+
+def expand_ranges(starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Concatenation of ``arange(s, s + c)`` for every (s, c), vectorized."""
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    offsets = np.cumsum(counts) - counts
+    return np.repeat(starts - offsets, counts) + np.arange(total)
+
+
+class CSRGraph:
+    """
+    Directed graph in CSR form.
+
+    Args:
+        indptr: Row pointer, length n_nodes + 1
+        indices: Target node of each edge, grouped by source
+        weights: Optional per-edge weights
+    """
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, weights: Optional[np.ndarray] = None,
+                 path: Optional[PathLike] = None):
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.path = None if path is None else Path(path)
+
+    @classmethod
+    def from_edges(
+        cls,
+        source,
+        target,
+        weights=None,
+        n_nodes: Optional[int] = None,
+        symmetric: bool = False
+    ) -> "CSRGraph":
+        """
+        Build a graph from edge lists of node ids 0..n_nodes-1.
+
+        Args:
+            source, target: Edge endpoints (u -> v)
+            weights: Optional per-edge weights
+            n_nodes: Number of nodes (default: max id + 1)
+            symmetric: Also add every reverse edge v -> u
+
+        Raises:
+            ValueError: If an endpoint is negative or not below ``n_nodes``
+        """
+        source = np.asarray(source, dtype=np.int64)
+        target = np.asarray(target, dtype=np.int64)
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64)
+        if symmetric:
+            source, target = np.concatenate([source, target]), np.concatenate([target, source])
+            if weights is not None:
+                weights = np.concatenate([weights, weights])
+        if source.shape != target.shape:
+            raise ValueError(f"Got {len(source)} sources but {len(target)} targets")
+        top = int(max(source.max(initial=-1), target.max(initial=-1)))
+        if n_nodes is None:
+            n_nodes = top + 1
+        elif top >= n_nodes:
+            raise ValueError(f"Edge endpoint {top} out of range for {n_nodes} nodes")
+        if min(source.min(initial=0), target.min(initial=0)) < 0:
+            raise ValueError("Edge endpoints must be non-negative node ids")
+
+        # Edge order within a row does not matter, so an unstable sort will do
+        order = np.argsort(source)
+        indptr = np.zeros(n_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(source, minlength=n_nodes), out=indptr[1:])
+        indices = target[order].astype(_index_dtype(n_nodes))
+        return cls(indptr, indices, None if weights is None else weights[order])
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def n_edges(self) -> int:
+        return len(self.indices)
+
+    def out_degree(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def neighbors(self, node: int) -> np.ndarray:
+        return self.indices[self.indptr[node]:self.indptr[node + 1]]
+
+    def edges_from(self, nodes: np.ndarray) -> np.ndarray:
+        """Edge positions of all out-edges of ``nodes``."""
+        nodes = np.asarray(nodes)
+        starts = self.indptr[nodes]
+        return expand_ranges(starts, self.indptr[nodes + 1] - starts)
+
+    def reverse(self) -> "CSRGraph":
+        """The transposed graph (v -> u for every edge u -> v)."""
+        source = np.repeat(np.arange(self.n_nodes, dtype=np.int64), self.out_degree())
+        return CSRGraph.from_edges(self.indices, source, self.weights, n_nodes=self.n_nodes)
+
+    def save(self, path: PathLike) -> None:
+        """Write indptr/indices[/weights].npy into directory ``path``."""
+        root = Path(path)
+        root.mkdir(parents=True, exist_ok=True)
+        np.save(root / "indptr.npy", self.indptr)
+        np.save(root / "indices.npy", self.indices)
+        if self.weights is not None:
+            np.save(root / "weights.npy", self.weights)
+
+    @classmethod
+    def load(cls, path: PathLike, mmap_mode: Optional[str] = "r") -> "CSRGraph":
+        """Open a saved graph (memory-mapped by default)."""
+        root = Path(path)
+        weights = root / "weights.npy"
+        return cls(
+            np.load(root / "indptr.npy", mmap_mode=mmap_mode),
+            np.load(root / "indices.npy", mmap_mode=mmap_mode),
+            np.load(weights, mmap_mode=mmap_mode) if weights.exists() else None,
+            path=root if mmap_mode else None,
+        )
+
+    def __reduce__(self):
+        if self.path is not None:
+            return (CSRGraph.load, (str(self.path),))
+        return (CSRGraph, (self.indptr, self.indices, self.weights))
@@ -0,0 +1,223 @@
+"""
+Model Metrics
+
+Counters and histograms updated by the model functions, for monitoring
+production scoring:
+
+- infodynamics_calls_total{function}: scalar calls and batch calls
+- infodynamics_batch_size{function}: rows per batch call (histogram)
+- infodynamics_g_info_clamped_total{bound}: G_info outside 0.1-10 before clamping
+- infodynamics_flow_rate_saturated_total{function, bound}: flow rates clipped to 0 or 100
+- infodynamics_substitutions_total{function, parameter}: guard values substituted
+  to avoid division by zero (resistance, frequency, capacity, impedance = 0.01)
+- infodynamics_pipeline_cache_total{result}: cached pipeline stage hits / misses
+- infodynamics_population_rows_scored_total{column, mode}: population store rows
+  written by full or incremental scoring
+
+Collection is off by default. Instrumented code checks the module-level
+``enabled`` flag before doing anything, so a disabled counter costs one
+attribute lookup:
+
+    from infodynamics.utils import metrics
+
+    metrics.enable_metrics()
+    ...
+    print(metrics.prometheus_text())     # Prometheus text exposition format
+    snapshot = metrics.metrics_snapshot()
+
+Updates are plain dict operations without a lock. Under the GIL they do not
+corrupt the registry, but concurrent increments of the same series from
+several threads can occasionally lose a count; that trade-off keeps the
+enabled path cheap.
+"""
+
+import bisect
+import math
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+# Read by instrumented functions; change with enable_metrics / disable_metrics
+enabled = False
+
+# Rows per batch: 1, 4, 16, ..., 4**12 (~16.8M)
+BATCH_SIZE_BUCKETS = tuple(4 ** i for i in range(13))
+
+# Name -> (type, help)
+METRICS: Dict[str, Tuple[str, str]] = {
+    'infodynamics_calls_total': ('counter', 'Model function calls'),
+    'infodynamics_batch_size': ('histogram', 'Rows per batch call'),
+    'infodynamics_g_info_clamped_total': ('counter', 'G_info values clamped to the 0.1-10 range'),
+    'infodynamics_flow_rate_saturated_total': ('counter', 'Flow rates clipped to the 0-100 range'),
+    'infodynamics_substitutions_total': ('counter', 'Guard values substituted to avoid division by zero'),
+    'infodynamics_pipeline_cache_total': ('counter', 'Cached pipeline stage lookups'),
+    'infodynamics_population_rows_scored_total': ('counter', 'Population store rows written by scoring'),
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus sense."""
+
+    __slots__ = ('buckets', 'counts', 'count', 'sum')
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # last bucket: +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float, n: int = 1) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += n
+        self.count += n
+        self.sum += value * n
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'buckets': {_format_value(le): count
+                        for le, count in zip(list(self.buckets) + [math.inf], self.counts) if count},
+        }
+
+
+class MetricsRegistry:
+    """Labelled counters and histograms, keyed by (name, sorted labels)."""
+
+    def __init__(self):
+        self.counters: Dict[str, Dict[LabelKey, float]] = {}
+        self.histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+
+    def inc(self, name: str, value: float = 1, **labels: str) -> None:
+        series = self.counters.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, buckets: Sequence[float] = BATCH_SIZE_BUCKETS,
+                **labels: str) -> None:
+        series = self.histograms.setdefault(name, {})
+        key = tuple(sorted(labels.items()))
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = Histogram(buckets)
+        histogram.observe(value)
+
+    def reset(self) -> None:
+        self.counters.clear()
+        self.histograms.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        JSON-serializable copy of every series.
+
+        Returns:
+            {"counters": {name: [{"labels": {...}, "value": v}, ...]},
+             "histograms": {name: [{"labels": {...}, "count", "sum", "buckets"}, ...]}}
+        """
+        return {
+            'counters': {
+                name: [{'labels': dict(key), 'value': value} for key, value in sorted(series.items())]
+                for name, series in sorted(self.counters.items())
+            },
+            'histograms': {
+                name: [{'labels': dict(key), **histogram.snapshot()} for key, histogram in sorted(series.items())]
+                for name, series in sorted(self.histograms.items())
+            },
+        }
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        for name, series in sorted(self.counters.items()):
+            lines.extend(_header(name, 'counter'))
+            for key, value in sorted(series.items()):
+                lines.append(f"{name}{_labels(key)} {_format_value(value)}")
+        for name, series in sorted(self.histograms.items()):
+            lines.extend(_header(name, 'histogram'))
+            for key, histogram in sorted(series.items()):
+                lines.extend(histogram_lines(name, histogram.buckets, histogram.counts,
+                                             histogram.sum, histogram.count, key))
+        return '\n'.join(lines) + '\n' if lines else ''
+
+
+def _header(name: str, default_type: str) -> list:
+    metric_type, help_text = METRICS.get(name, (default_type, name))
+    return [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in pairs) + '}'
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def histogram_lines(name: str, buckets: Sequence[float], counts: Sequence[int], total: float,
+                    count: int, key: LabelKey = ()) -> list:
+    """
+    Prometheus lines for one histogram series.
+
+    ``counts`` are per-bucket (not cumulative) with a final +Inf bucket, as
+    kept by ``Histogram`` and ``serve.LatencyHistogram``.
+    """
+    lines = []
+    cumulative = 0
+    for le, n in zip(list(buckets) + [math.inf], counts):
+        cumulative += n
+        lines.append(f"{name}_bucket{_labels(key, ('le', _format_value(le)))} {cumulative}")
+    lines.append(f"{name}_sum{_labels(key)} {_format_value(total)}")
+    lines.append(f"{name}_count{_labels(key)} {count}")
+    return lines
+
+
+REGISTRY = MetricsRegistry()
+
+
+def enable_metrics(reset: bool = False) -> MetricsRegistry:
+    """Turn collection on (optionally clearing previous values); returns the registry."""
+    global enabled
+    if reset:
+        REGISTRY.reset()
+    enabled = True
+    return REGISTRY
+
+
+def disable_metrics() -> None:
+    """Turn collection off; collected values are kept."""
+    global enabled
+    enabled = False
+
+
+def metrics_snapshot() -> Dict[str, Any]:
+    """Snapshot of the global registry (see MetricsRegistry.snapshot)."""
+    return REGISTRY.snapshot()
+
+
+def prometheus_text() -> str:
+    """The global registry in Prometheus text format."""
+    return REGISTRY.to_prometheus()
+
+
+def inc(name: str, value: float = 1, **labels: str) -> None:
+    REGISTRY.inc(name, value, **labels)
+
+
+def record_call(function: str) -> None:
+    REGISTRY.inc('infodynamics_calls_total', function=function)
+
+
+def record_batch(function: str, size: int) -> None:
+    """Count a batch call and its size."""
+    REGISTRY.inc('infodynamics_calls_total', function=function)
+    REGISTRY.observe('infodynamics_batch_size', size, function=function)
@@ -0,0 +1,367 @@
+"""
+Memory-Mapped Population Store
+
+On-disk columnar format for populations larger than memory: a directory
+with one ``.npy`` file per column and a ``population.json`` manifest.
+
+    population/
+        population.json          {"version": 1, "n_rows": ..., "columns": {name: dtype}}
+        working_memory.npy
+        attention_selectivity.npy
+        ...
+        G_info.npy               output columns are ordinary columns
+
+Each ``.npy`` file has a fixed 4096-byte header, so column data starts on a
+page boundary; ``iter_chunks`` rounds its chunk length so that every chunk
+of every column also starts on a page boundary. Columns are opened with
+``np.load(..., mmap_mode=...)``: chunks are views into the page cache, and
+results written into output columns go straight to the mapped file. Memory
+use is bounded by the chunk size, not the population size.
+
+The files are standard NPY (format 1.0), so any column can also be read
+with ``np.load`` on its own.
+
+Change tracking: ``row_hashes`` gives a 64-bit content hash per row over a
+set of columns. ``models.scoring`` stores, next to each output column, the
+hash of the inputs it was computed from (``<output>.hash``), so a rescore
+only recomputes rows whose inputs changed since (``rescore_population``).
+
+Example:
+    >>> store = create_population_store("population", "profiles.parquet")
+    >>> g = store.add_column("G_info")
+    >>> for rows, chunk in store.iter_chunks(["working_memory", "motivation"]):
+    ...     g[rows] = some_batch_function(chunk)
+    >>> store.flush()
+"""
+
+import json
+import math
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Dict, Iterator, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+STORE_VERSION = 1
+MANIFEST = "population.json"
+PAGE_BYTES = 4096
+HEADER_BYTES = PAGE_BYTES  # data offset of every column file
+DEFAULT_CHUNK_ROWS = 1 << 20
+
+PathLike = Union[str, Path]
+
+
+def _write_header(f, dtype: np.dtype, n_rows: int) -> None:
+    """NPY 1.0 header padded to exactly HEADER_BYTES."""
+    header = "{'descr': %r, 'fortran_order': False, 'shape': (%d,), }" % (
+        np.lib.format.dtype_to_descr(dtype), n_rows
+    )
+    prefix_len = len(np.lib.format.magic(1, 0)) + 2
+    header = header.ljust(HEADER_BYTES - prefix_len - 1) + "\n"
+    f.seek(0)
+    f.write(np.lib.format.magic(1, 0) + struct.pack("<H", len(header)) + header.encode("latin1"))
+
+
+def _stored_dtype(series) -> Optional[np.dtype]:
+    """Store dtype for a column read from a table (None: not numeric)."""
+    kind = series.dtype.kind
+    if kind in "iu":
+        return np.dtype("int64")
+    if kind == "f":
+        return np.dtype("float64")
+    if kind == "b":
+        return np.dtype("bool")
+    return None
+
+
+def _widen_to_float(f, n_rows: int) -> None:
+    """Convert the int64 rows already written to ``f`` to float64 in place."""
+    f.flush()
+    if not n_rows:
+        return
+    data = np.memmap(f.name, dtype=np.int64, mode="r+", offset=HEADER_BYTES, shape=(n_rows,))
+    # Same itemsize, so each block is rewritten where it lies
+    for start in range(0, n_rows, DEFAULT_CHUNK_ROWS):
+        block = data[start:start + DEFAULT_CHUNK_ROWS]
+        block.view(np.float64)[:] = block.astype(np.float64)
+    data.flush()
+    del data
+
+
+def _column_path(root: Path, name: str) -> Path:
+    if not name or "/" in name or name.startswith(".") or name == Path(MANIFEST).stem:
+        raise ValueError(f"Invalid column name: {name!r}")
+    return root / f"{name}.npy"
+
+
+# 64-bit FNV prime; the xorshift spreads high bits of float64 words
+# (exponent/sign) into the low bits before the next column is mixed in
+_HASH_PRIME = np.uint64(0x100000001B3)
+
+
+def row_hashes(columns: Mapping[str, np.ndarray], n: Optional[int] = None) -> np.ndarray:
+    """
+    64-bit content hash of each row over ``columns`` (name -> 1-D array).
+
+    The hash covers the column names and the raw value bits, so a row's hash
+    changes when any of its values changes (including NaN <-> value) or a
+    column is added or removed.
+    """
+    names = sorted(columns)
+    if n is None:
+        n = len(columns[names[0]]) if names else 0
+    h = np.full(n, zlib.crc32("\0".join(names).encode()) | (1 << 32), dtype=np.uint64)
+    for name in names:
+        values = np.asarray(columns[name])
+        size = values.dtype.itemsize
+        if size not in (1, 2, 4, 8):
+            raise TypeError(f"Cannot hash column {name!r} of dtype {values.dtype}")
+        # Reinterpret, never convert: float32 0.5 and 0.7 must differ
+        bits = values.view(f"u{size}").astype(np.uint64, copy=False)
+        h ^= bits
+        h *= _HASH_PRIME
+        h ^= h >> np.uint64(29)
+    return h
+
+
+def aligned_rows(rows: int, dtypes: Sequence[np.dtype]) -> int:
+    """
+    Round ``rows`` down (to at least one unit) so that ``rows * itemsize``
+    is a multiple of PAGE_BYTES for every dtype.
+    """
+    unit = 1
+    for dtype in dtypes:
+        step = PAGE_BYTES // math.gcd(PAGE_BYTES, np.dtype(dtype).itemsize)
+        unit = unit * step // math.gcd(unit, step)
+    return max(unit, rows - rows % unit)
+
+
+class PopulationStore:
+    """
+    A directory of memory-mapped columns with a common row count.
+
+    Args:
+        path: Store directory (see ``create`` / ``create_population_store``)
+        mode: "r" (read-only) or "r+" (columns writable in place)
+    """
+
+    def __init__(self, path: PathLike, mode: str = "r+"):
+        if mode not in ("r", "r+"):
+            raise ValueError("mode must be 'r' or 'r+'")
+        self.path = Path(path)
+        self.mode = mode
+        manifest = json.loads((self.path / MANIFEST).read_text())
+        if manifest.get("version") != STORE_VERSION:
+            raise ValueError(f"Unsupported population store version: {manifest.get('version')}")
+        self.n_rows: int = manifest["n_rows"]
+        self.columns: Dict[str, str] = dict(manifest["columns"])
+        self._maps: Dict[str, np.memmap] = {}
+
+    @classmethod
+    def create(cls, path: PathLike, n_rows: int, columns: Mapping[str, Union[str, np.dtype]] = (),
+               fill: float = np.nan) -> "PopulationStore":
+        """Create an empty store with ``columns`` (name -> dtype) filled with ``fill``."""
+        root = Path(path)
+        root.mkdir(parents=True, exist_ok=True)
+        if (root / MANIFEST).exists():
+            raise FileExistsError(f"Population store already exists: {root}")
+        cls._write_manifest(root, n_rows, {})
+        store = cls(root)
+        for name, dtype in dict(columns).items():
+            store.add_column(name, dtype, fill)
+        return store
+
+    @staticmethod
+    def _write_manifest(root: Path, n_rows: int, columns: Dict[str, str]) -> None:
+        tmp = root / (MANIFEST + ".tmp")
+        tmp.write_text(json.dumps({"version": STORE_VERSION, "n_rows": n_rows, "columns": columns}, indent=2))
+        os.replace(tmp, root / MANIFEST)
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+    def __getitem__(self, name: str) -> np.memmap:
+        return self.column(name)
+
+    def keys(self):
+        return self.columns.keys()
+
+    def column(self, name: str) -> np.memmap:
+        """The whole column as a memory map (opened once, then cached)."""
+        if name not in self.columns:
+            raise KeyError(f"No column {name!r} in {self.path}")
+        if name not in self._maps:
+            self._maps[name] = np.load(_column_path(self.path, name), mmap_mode=self.mode)
+        return self._maps[name]
+
+    def add_column(self, name: str, dtype: Union[str, np.dtype] = "float64",
+                   fill: Optional[float] = np.nan, exist_ok: bool = True) -> np.memmap:
+        """
+        Add a column (e.g. a model output) and return it as a writable memory map.
+
+        Args:
+            name: Column name
+            dtype: NumPy dtype
+            fill: Initial value (None leaves the file sparse, i.e. zeros)
+            exist_ok: Return the existing column instead of raising
+        """
+        if self.mode != "r+":
+            raise PermissionError("Store opened read-only")
+        if name in self.columns:
+            if not exist_ok:
+                raise ValueError(f"Column {name!r} already exists")
+            return self.column(name)
+
+        dtype = np.dtype(dtype)
+        path = _column_path(self.path, name)
+        with open(path, "wb") as f:
+            _write_header(f, dtype, self.n_rows)
+            f.truncate(HEADER_BYTES + self.n_rows * dtype.itemsize)
+
+        self.columns[name] = np.lib.format.dtype_to_descr(dtype)
+        self._write_manifest(self.path, self.n_rows, self.columns)
+        mapped = self.column(name)
+        if fill is not None and fill != 0:
+            step = aligned_rows(DEFAULT_CHUNK_ROWS, [dtype])
+            for start in range(0, self.n_rows, step):
+                mapped[start:start + step] = fill
+        return mapped
+
+    def update(self, rows, data: Mapping[str, np.ndarray]) -> None:
+        """
+        Write new values for some rows in place.
+
+        Args:
+            rows: Row indices (integer array, boolean mask or slice)
+            data: Column -> values for those rows (DataFrame or mapping);
+                every column must already exist in the store
+        """
+        if self.mode != "r+":
+            raise PermissionError("Store opened read-only")
+        for name in data.keys():
+            self.column(name)[rows] = np.asarray(data[name])
+
+    def drop_column(self, name: str) -> None:
+        if self.mode != "r+":
+            raise PermissionError("Store opened read-only")
+        self._maps.pop(name, None)
+        del self.columns[name]
+        self._write_manifest(self.path, self.n_rows, self.columns)
+        _column_path(self.path, name).unlink()
+
+    def chunk_rows(self, rows: int = DEFAULT_CHUNK_ROWS, columns: Optional[Sequence[str]] = None) -> int:
+        """Page-aligned chunk length close to ``rows`` for the given columns."""
+        names = list(self.columns) if columns is None else list(columns)
+        return aligned_rows(rows, [np.dtype(self.columns[name]) for name in names if name in self.columns])
+
+    def iter_chunks(self, columns: Optional[Sequence[str]] = None,
+                    chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[Tuple[slice, Dict[str, np.ndarray]]]:
+        """
+        Yield ``(rows, {column: view})`` over page-aligned row ranges.
+
+        The views are slices of the memory maps (no copies); ``rows`` is the
+        slice to use for writing results into output columns.
+        """
+        names = [name for name in (list(self.columns) if columns is None else columns) if name in self.columns]
+        maps = {name: self.column(name) for name in names}
+        step = self.chunk_rows(chunk_rows, names)
+        for start in range(0, self.n_rows, step):
+            rows = slice(start, min(start + step, self.n_rows))
+            yield rows, {name: mapped[rows] for name, mapped in maps.items()}
+
+    def flush(self) -> None:
+        """Write dirty pages of writable columns back to disk."""
+        for mapped in self._maps.values():
+            if isinstance(mapped, np.memmap) and mapped.mode == "r+":
+                mapped.flush()
+
+    def close(self) -> None:
+        self.flush()
+        self._maps.clear()
+
+    def __enter__(self) -> "PopulationStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def create_population_store(
+    path: PathLike,
+    source,
+    fmt: Optional[str] = None,
+    chunk_size: int = 100_000,
+    columns: Optional[Sequence[str]] = None
+) -> PopulationStore:
+    """
+    Stream a table (CSV, JSON Lines, Parquet, or stdin) into a new store.
+
+    Only numeric and boolean columns are stored. Column dtypes come from the
+    first chunk (integers are widened to int64, floats to float64); data is
+    appended chunk by chunk, so the table never has to fit in memory. An
+    integer column that turns out to hold floats or missing values in a
+    later chunk is converted to float64, rows already written included.
+
+    Args:
+        path: New store directory
+        source: Table path, or "-" for stdin
+        fmt: "csv", "jsonl" or "parquet" (inferred from the extension by default)
+        chunk_size: Rows per read
+        columns: Columns to import (all numeric columns by default)
+
+    Returns:
+        The store, opened read-write
+    """
+    from .tabular import iter_table_chunks
+
+    root = Path(path)
+    root.mkdir(parents=True, exist_ok=True)
+    if (root / MANIFEST).exists():
+        raise FileExistsError(f"Population store already exists: {root}")
+
+    dtypes: Dict[str, np.dtype] = {}
+    files = {}
+    n_rows = 0
+    try:
+        for chunk in iter_table_chunks(source, fmt, chunk_size, columns):
+            if not files:
+                for name, series in chunk.items():
+                    dtype = _stored_dtype(series)
+                    if dtype is not None:
+                        dtypes[name] = dtype
+                    elif columns is not None:
+                        raise ValueError(f"Column {name!r} is not numeric")
+                for name, dtype in dtypes.items():
+                    files[name] = open(_column_path(root, name), "wb")
+                    _write_header(files[name], dtype, 0)
+            else:
+                # Later chunks are typed on their own (read_csv infers each chunk)
+                for name, f in files.items():
+                    stored, dtype = dtypes[name], _stored_dtype(chunk[name])
+                    if dtype is None or (stored.kind == "b" and dtype.kind != "b"):
+                        raise ValueError(
+                            f"Column {name!r} changes type from {stored} to {chunk[name].dtype} "
+                            f"after row {n_rows}"
+                        )
+                    if stored.kind == "i" and dtype.kind == "f":
+                        _widen_to_float(f, n_rows)
+                        dtypes[name] = dtype
+            for name, f in files.items():
+                f.write(np.ascontiguousarray(chunk[name].to_numpy(dtype=dtypes[name])).tobytes())
+            n_rows += len(chunk)
+
+        for name, f in files.items():
+            _write_header(f, dtypes[name], n_rows)
+    finally:
+        for f in files.values():
+            f.close()
+
+    PopulationStore._write_manifest(
+        root, n_rows, {name: np.lib.format.dtype_to_descr(dtype) for name, dtype in dtypes.items()}
+    )
+    return PopulationStore(root)
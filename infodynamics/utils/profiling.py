@@ -0,0 +1,443 @@
+"""
+Stage Profiling
+
+Per-stage instrumentation for the validators, analysis pipelines and CLI.
+A stage records wall time, CPU time, the process peak RSS and an optional
+item count:
+
+    from infodynamics.utils import profiled, stage, enable_profiling
+
+    profiler = enable_profiling(capture="sample")
+
+    with stage("load_participants") as s:
+        df = pd.read_csv(path, sep="\\t")
+        s.items = len(df)
+
+    @profiled("compute_information_dynamics")
+    def compute(...): ...
+
+    profiler.write("trace.json")                    # structured JSON
+    profiler.write("trace.json", format="chrome")   # chrome://tracing / Perfetto
+
+Stages are no-ops until profiling is enabled (one global lookup per stage),
+so they can stay in hot paths. Scripts expose ``--trace <file>`` via
+``add_trace_arguments``; setting ``INFODYNAMICS_TRACE=<file>`` does the
+same for scripts that call ``enable_from_env``. Either way the trace is
+written at exit, and ``INFODYNAMICS_TRACE_FORMAT`` /
+``INFODYNAMICS_TRACE_CAPTURE`` select the format and capture mode.
+
+Capture modes:
+- "cprofile": one cProfile session for the whole run, written next to the
+  trace as ``<trace>.prof`` (load with pstats or snakeviz)
+- "sample": a background thread samples the profiled thread's stack every
+  ``sample_interval`` seconds; written as ``<trace>.folded`` (collapsed
+  stacks, prefixed with the active stages, for flamegraph.pl / speedscope)
+
+Only light standard-library modules are imported here (no dataclasses or
+json at import time), since the CLI imports this module on every call.
+"""
+
+import atexit
+import functools
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+TRACE_ENV = 'INFODYNAMICS_TRACE'
+FORMAT_ENV = 'INFODYNAMICS_TRACE_FORMAT'
+CAPTURE_ENV = 'INFODYNAMICS_TRACE_CAPTURE'
+
+TRACE_FORMATS = ('json', 'chrome')
+CAPTURE_MODES = ('cprofile', 'sample')
+DEFAULT_SAMPLE_INTERVAL = 0.005  # seconds
+DEFAULT_MAX_RECORDS = 100_000
+
+
+def peak_rss_mb() -> Optional[float]:
+    """High-water mark of this process's resident set size, in MiB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+class StageRecord:
+    """
+    One completed stage.
+
+    Attributes:
+        name: Stage name
+        start: Seconds since the profiler was enabled
+        wall_time: Elapsed seconds
+        cpu_time: Seconds of process CPU time
+        peak_rss_mb: Process RSS high-water mark at the end of the stage
+        rss_growth_mb: Rise of the high-water mark during the stage
+        items: Items processed, if counted
+        depth: Nesting depth (0 for top-level stages)
+        parent: Enclosing stage name
+        thread: Thread identifier
+        meta: Extra fields passed to the stage
+    """
+
+    __slots__ = ('name', 'start', 'wall_time', 'cpu_time', 'peak_rss_mb', 'rss_growth_mb',
+                 'items', 'depth', 'parent', 'thread', 'meta')
+
+    def __init__(self, name, start, wall_time, cpu_time, peak_rss_mb, rss_growth_mb,
+                 items, depth, parent, thread, meta=None):
+        self.name = name
+        self.start = start
+        self.wall_time = wall_time
+        self.cpu_time = cpu_time
+        self.peak_rss_mb = peak_rss_mb
+        self.rss_growth_mb = rss_growth_mb
+        self.items = items
+        self.depth = depth
+        self.parent = parent
+        self.thread = thread
+        self.meta = meta if meta is not None else {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    def __repr__(self):
+        return f"StageRecord({self.name!r}, wall_time={self.wall_time:.6f}, items={self.items})"
+
+
+class _Sampler(threading.Thread):
+    """Samples one thread's Python stack at a fixed interval."""
+
+    def __init__(self, profiler: 'Profiler', thread_id: int, interval: float):
+        super().__init__(name='infodynamics-sampler', daemon=True)
+        self.profiler = profiler
+        self.thread_id = thread_id
+        self.interval = interval
+        self.counts: Dict[str, int] = {}
+        self._stop_event = threading.Event()
+
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            frames = []
+            while frame is not None:
+                code = frame.f_code
+                frames.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            stages = [f"[{name}]" for name in self.profiler._stack(self.thread_id)]
+            key = ';'.join(stages + frames[::-1])
+            self.counts[key] = self.counts.get(key, 0) + 1
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+
+class Profiler:
+    """
+    Collects stage records, a per-name summary and the optional cProfile or
+    sampling capture.
+
+    Individual records are kept up to ``max_records``; the summary keeps
+    counting after that, so per-participant stages over large cohorts stay
+    bounded in memory.
+    """
+
+    def __init__(self, capture: Optional[str] = None,
+                 sample_interval: float = DEFAULT_SAMPLE_INTERVAL,
+                 max_records: int = DEFAULT_MAX_RECORDS):
+        if capture is not None and capture not in CAPTURE_MODES:
+            raise ValueError(f"Unknown capture mode: {capture}. Available: {list(CAPTURE_MODES)}")
+        self.capture = capture
+        self.sample_interval = sample_interval
+        self.max_records = max_records
+        self.records: List[StageRecord] = []
+        self.dropped = 0
+        self.summary: Dict[str, Dict[str, float]] = {}
+        self.started_wall = time.time()
+        self._t0 = time.perf_counter()
+        self._stacks: Dict[int, List[str]] = {}
+        self._lock = threading.Lock()
+        self._cprofile = None
+        self._sampler = None
+
+    # Capture ---------------------------------------------------------------
+
+    def start(self) -> 'Profiler':
+        """Start the cProfile / sampling capture, if any."""
+        if self.capture == 'cprofile' and self._cprofile is None:
+            import cProfile
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        elif self.capture == 'sample' and self._sampler is None:
+            self._sampler = _Sampler(self, threading.get_ident(), self.sample_interval)
+            self._sampler.start()
+        return self
+
+    def stop(self) -> 'Profiler':
+        """Stop the capture; records are kept."""
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        if self._sampler is not None and self._sampler.is_alive():
+            self._sampler.stop()
+        return self
+
+    # Recording -------------------------------------------------------------
+
+    def _stack(self, thread_id: int) -> List[str]:
+        return self._stacks.get(thread_id, [])
+
+    def _push(self, name: str) -> tuple:
+        thread_id = threading.get_ident()
+        stack = self._stacks.setdefault(thread_id, [])
+        parent = stack[-1] if stack else None
+        stack.append(name)
+        return thread_id, len(stack) - 1, parent, peak_rss_mb()
+
+    def _pop(self, name: str, thread_id: int, depth: int, parent: Optional[str], rss_before: Optional[float],
+             started: float, cpu_started: float, items: Optional[int], meta: Dict[str, Any]) -> None:
+        wall = time.perf_counter() - started
+        cpu = time.process_time() - cpu_started
+        peak = peak_rss_mb()
+        self._stacks[thread_id].pop()
+
+        with self._lock:
+            totals = self.summary.setdefault(name, {'calls': 0, 'wall_time': 0.0, 'cpu_time': 0.0, 'items': 0})
+            totals['calls'] += 1
+            totals['wall_time'] += wall
+            totals['cpu_time'] += cpu
+            totals['items'] += items or 0
+
+            if len(self.records) >= self.max_records:
+                self.dropped += 1
+                return
+            self.records.append(StageRecord(
+                name=name,
+                start=started - self._t0,
+                wall_time=wall,
+                cpu_time=cpu,
+                peak_rss_mb=peak,
+                rss_growth_mb=None if peak is None or rss_before is None else peak - rss_before,
+                items=items,
+                depth=depth,
+                parent=parent,
+                thread=thread_id,
+                meta=meta,
+            ))
+
+    # Output ----------------------------------------------------------------
+
+    def summary_table(self) -> List[Dict[str, Any]]:
+        """Per-name totals, slowest first, with items per second where counted."""
+        rows = []
+        for name, totals in self.summary.items():
+            row = {'name': name, **totals}
+            row['items_per_second'] = totals['items'] / totals['wall_time'] if totals['items'] and totals['wall_time'] else None
+            rows.append(row)
+        return sorted(rows, key=lambda row: row['wall_time'], reverse=True)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Structured JSON trace."""
+        return {
+            'version': 1,
+            'started': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started_wall)),
+            'pid': os.getpid(),
+            'argv': list(sys.argv),
+            'capture': self.capture,
+            'peak_rss_mb': peak_rss_mb(),
+            'dropped_records': self.dropped,
+            'summary': self.summary_table(),
+            'stages': [record.to_dict() for record in self.records],
+        }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Trace Event Format (complete events), for chrome://tracing and Perfetto."""
+        pid = os.getpid()
+        events = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+                   'args': {'name': os.path.basename(sys.argv[0]) if sys.argv else 'python'}}]
+        for record in self.records:
+            args = {'cpu_ms': record.cpu_time * 1e3}
+            if record.items is not None:
+                args['items'] = record.items
+            if record.peak_rss_mb is not None:
+                args['peak_rss_mb'] = round(record.peak_rss_mb, 2)
+                args['rss_growth_mb'] = round(record.rss_growth_mb or 0.0, 2)
+            args.update(record.meta)
+            events.append({
+                'name': record.name,
+                'cat': record.parent or 'stage',
+                'ph': 'X',
+                'ts': record.start * 1e6,
+                'dur': record.wall_time * 1e6,
+                'pid': pid,
+                'tid': record.thread,
+                'args': args,
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write(self, path: str, format: Optional[str] = None) -> List[str]:
+        """
+        Write the trace, plus ``<path>.prof`` / ``<path>.folded`` for captures.
+
+        Args:
+            path: Trace file
+            format: "json" (default) or "chrome"
+
+        Returns:
+            Paths written
+        """
+        import json
+
+        format = format or 'json'
+        if format not in TRACE_FORMATS:
+            raise ValueError(f"Unknown trace format: {format}. Available: {list(TRACE_FORMATS)}")
+
+        self.stop()
+        payload = self.to_chrome_trace() if format == 'chrome' else self.to_dict()
+        with open(path, 'w') as f:
+            json.dump(payload, f, indent=None if format == 'chrome' else 2, default=str)
+        written = [path]
+
+        if self._cprofile is not None:
+            self._cprofile.dump_stats(path + '.prof')
+            written.append(path + '.prof')
+        if self._sampler is not None:
+            with open(path + '.folded', 'w') as f:
+                for key, count in sorted(self._sampler.counts.items()):
+                    f.write(f"{key} {count}\n")
+            written.append(path + '.folded')
+        return written
+
+
+_active: Optional[Profiler] = None
+
+
+def enable_profiling(capture: Optional[str] = None, sample_interval: float = DEFAULT_SAMPLE_INTERVAL,
+                     max_records: int = DEFAULT_MAX_RECORDS) -> Profiler:
+    """Start recording stages (replacing any active profiler) and return the profiler."""
+    global _active
+    if _active is not None:
+        _active.stop()
+    _active = Profiler(capture, sample_interval, max_records).start()
+    return _active
+
+
+def disable_profiling() -> Optional[Profiler]:
+    """Stop recording; returns the profiler that was active."""
+    global _active
+    profiler, _active = _active, None
+    if profiler is not None:
+        profiler.stop()
+    return profiler
+
+
+def get_profiler() -> Optional[Profiler]:
+    """The active profiler, or None when profiling is disabled."""
+    return _active
+
+
+def trace_to(path: str, format: Optional[str] = None, capture: Optional[str] = None) -> Profiler:
+    """Enable profiling and write the trace to ``path`` when the interpreter exits."""
+    if format is not None and format not in TRACE_FORMATS:
+        raise ValueError(f"Unknown trace format: {format}. Available: {list(TRACE_FORMATS)}")
+    profiler = enable_profiling(capture=capture)
+
+    def _write():
+        if get_profiler() is profiler:
+            disable_profiling()
+            profiler.write(path, format)
+
+    atexit.register(_write)
+    return profiler
+
+
+def enable_from_env() -> Optional[Profiler]:
+    """``trace_to($INFODYNAMICS_TRACE)`` if that variable is set."""
+    path = os.environ.get(TRACE_ENV)
+    if not path:
+        return None
+    return trace_to(path, os.environ.get(FORMAT_ENV) or None, os.environ.get(CAPTURE_ENV) or None)
+
+
+def add_trace_arguments(parser) -> None:
+    """Add --trace / --trace-format / --trace-capture to an argparse parser."""
+    parser.add_argument('--trace', metavar='FILE', default=os.environ.get(TRACE_ENV),
+                        help=f'Write a per-stage timing trace to this file (default: ${TRACE_ENV})')
+    parser.add_argument('--trace-format', choices=TRACE_FORMATS, default=os.environ.get(FORMAT_ENV) or 'json',
+                        help='Trace format: structured JSON or Chrome trace events')
+    parser.add_argument('--trace-capture', choices=CAPTURE_MODES, default=os.environ.get(CAPTURE_ENV) or None,
+                        help='Also capture a cProfile (<trace>.prof) or sampled stacks (<trace>.folded)')
+
+
+def enable_from_args(args) -> Optional[Profiler]:
+    """``trace_to(args.trace)`` for parsers set up with add_trace_arguments."""
+    if not getattr(args, 'trace', None):
+        return None
+    return trace_to(args.trace, args.trace_format, args.trace_capture)
+
+
+class stage:
+    """
+    Context manager recording one named stage.
+
+    Set ``items`` on the returned object (or pass it) to record how many
+    rows / participants / files the stage processed. Extra keyword
+    arguments are stored with the record.
+    """
+
+    __slots__ = ('name', 'items', 'meta', '_profiler', '_state')
+
+    def __init__(self, name: str, items: Optional[int] = None, **meta):
+        self.name = name
+        self.items = items
+        self.meta = meta
+        self._profiler = None
+
+    def __enter__(self) -> 'stage':
+        profiler = _active
+        if profiler is not None:
+            self._profiler = profiler
+            self._state = profiler._push(self.name) + (time.perf_counter(), time.process_time())
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        profiler, self._profiler = self._profiler, None
+        if profiler is not None:
+            if exc_type is not None:
+                self.meta['error'] = exc_type.__name__
+            profiler._pop(self.name, *self._state, self.items, self.meta)
+        return False
+
+
+def profiled(name: Optional[str] = None, items: Optional[Callable[..., int]] = None) -> Callable:
+    """
+    Decorator recording each call as a stage.
+
+    Args:
+        name: Stage name (default: the function's qualified name)
+        items: Optional ``items(result) -> int`` to count what the call produced
+    """
+    def decorator(func):
+        stage_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return func(*args, **kwargs)
+            with stage(stage_name) as s:
+                result = func(*args, **kwargs)
+                if items is not None:
+                    s.items = items(result)
+                return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,167 @@
+"""
+Streaming Table IO
+
+Chunked readers and writers for CSV, JSON Lines and Parquet, so large
+tables can be processed with bounded memory. ``"-"`` (or None) selects
+stdin/stdout.
+
+Parquet requires pyarrow. Parquet cannot be read from a pipe without
+buffering (its metadata is stored at the end), so stdin Parquet input is
+read into memory first.
+"""
+
+import io
+import sys
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Optional, Sequence, Union
+
+import pandas as pd
+
+
+FORMATS = ("csv", "jsonl", "parquet")
+DEFAULT_CHUNK_ROWS = 100_000
+
+_SUFFIXES = {
+    ".csv": "csv",
+    ".jsonl": "jsonl",
+    ".ndjson": "jsonl",
+    ".json": "jsonl",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+}
+
+PathOrStdio = Optional[Union[str, Path]]
+
+
+def _is_stdio(path: PathOrStdio) -> bool:
+    return path is None or str(path) == "-"
+
+
+def infer_format(path: PathOrStdio, default: str = "csv") -> str:
+    """Table format from a file extension (``default`` for stdin/stdout)."""
+    if _is_stdio(path):
+        return default
+    suffix = Path(path).suffix.lower()
+    if suffix not in _SUFFIXES:
+        raise ValueError(f"Cannot infer table format from '{path}'; use one of {FORMATS}")
+    return _SUFFIXES[suffix]
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet input/output requires pyarrow (pip install pyarrow)") from e
+    return pa, pq
+
+
+def iter_table_chunks(
+    source: PathOrStdio,
+    fmt: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_ROWS,
+    columns: Optional[Sequence[str]] = None,
+    dtype: Optional[Mapping[str, Any]] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Read a table as DataFrames of at most ``chunk_size`` rows.
+
+    CSV and JSON Lines dtypes are inferred chunk by chunk, so a column can
+    change type between chunks; ``dtype`` fixes it for the given columns.
+
+    Args:
+        source: File path, or "-"/None for stdin
+        fmt: "csv", "jsonl" or "parquet" (inferred from the extension by default)
+        chunk_size: Maximum rows per chunk
+        columns: Columns to read (all by default; ignored for JSON Lines)
+        dtype: Optional column -> dtype applied to every chunk
+
+    Yields:
+        DataFrame chunks in file order
+    """
+    fmt = fmt or infer_format(source)
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown table format: {fmt} (choose from {FORMATS})")
+
+    if fmt == "csv":
+        handle = sys.stdin if _is_stdio(source) else source
+        yield from pd.read_csv(handle, chunksize=chunk_size, usecols=columns, dtype=dtype)
+    elif fmt == "jsonl":
+        handle = sys.stdin if _is_stdio(source) else source
+        yield from pd.read_json(handle, lines=True, chunksize=chunk_size, dtype=dtype)
+    else:
+        _, pq = _require_pyarrow()
+        handle = io.BytesIO(sys.stdin.buffer.read()) if _is_stdio(source) else source
+        parquet_file = pq.ParquetFile(handle)
+        for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=columns):
+            frame = batch.to_pandas()
+            yield frame.astype(dtype) if dtype else frame
+
+
+class TableWriter:
+    """
+    Append DataFrame chunks to a CSV, JSON Lines or Parquet output.
+
+    Example:
+        >>> with TableWriter("scores.parquet") as writer:
+        ...     for chunk in iter_table_chunks("profiles.csv"):
+        ...         writer.write(score(chunk))
+    """
+
+    def __init__(self, dest: PathOrStdio, fmt: Optional[str] = None, compression: str = "snappy"):
+        """
+        Args:
+            dest: File path, or "-"/None for stdout
+            fmt: "csv", "jsonl" or "parquet" (inferred from the extension by default)
+            compression: Parquet compression codec
+        """
+        self.fmt = fmt or infer_format(dest)
+        if self.fmt not in FORMATS:
+            raise ValueError(f"Unknown table format: {self.fmt} (choose from {FORMATS})")
+
+        self.dest = dest
+        self.compression = compression
+        self.rows_written = 0
+        self._parquet_writer = None
+        self._owns_handle = not _is_stdio(dest)
+
+        if self.fmt == "parquet":
+            self._handle = open(dest, "wb") if self._owns_handle else sys.stdout.buffer
+        else:
+            self._handle = open(dest, "w", newline="") if self._owns_handle else sys.stdout
+
+    def write(self, frame: pd.DataFrame) -> None:
+        """Append a chunk. All chunks must have the same columns."""
+        if self.fmt == "csv":
+            frame.to_csv(self._handle, header=self.rows_written == 0, index=False)
+        elif self.fmt == "jsonl":
+            if len(frame):
+                # to_json defaults to 10 significant digits; 15 is its maximum
+                text = frame.to_json(orient="records", lines=True, double_precision=15)
+                self._handle.write(text.rstrip("\n") + "\n")
+        else:
+            pa, pq = _require_pyarrow()
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self._handle, table.schema, compression=self.compression)
+            self._parquet_writer.write_table(table)
+
+        self.rows_written += len(frame)
+        if self.fmt != "parquet":
+            self._handle.flush()
+
+    def close(self) -> None:
+        """Finish the output (writes the Parquet footer)."""
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            self._parquet_writer = None
+        if self._owns_handle:
+            self._handle.close()
+        else:
+            self._handle.flush()
+
+    def __enter__(self) -> "TableWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
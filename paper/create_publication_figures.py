@@ -10,8 +10,16 @@ Author: Information Dynamics Research Team
 Date: January 2025
 """
 
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
+import matplotlib
 import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy.stats import pearsonr
@@ -20,7 +28,7 @@ import warnings
 warnings.filterwarnings('ignore')
 
 # Set publication-quality plotting parameters
-plt.rcParams.update({
+PUBLICATION_RC = {
     'font.size': 12,
     'font.family': 'serif',
     'axes.labelsize': 14,
@@ -33,7 +41,33 @@ plt.rcParams.update({
     'savefig.dpi': 300,
     'savefig.bbox': 'tight',
     'savefig.pad_inches': 0.1
-})
+}
+plt.rcParams.update(PUBLICATION_RC)
+
+# Output stem -> generator method, for the incremental figure build
+FIGURES = {
+    'Figure_1_Theoretical_Framework': 'create_figure_1_theoretical_framework',
+    'Figure_2_Validation_Results': 'create_figure_2_validation_results',
+    'Figure_3_Practical_Applications': 'create_figure_3_practical_applications',
+}
+FIGURE_FORMATS = ('png', 'pdf')
+BUILD_MANIFEST = 'paper/.figure_build.json'
+
+
+def _sha256(text):
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _render_figure(method_name, results):
+    """Render one figure in a worker process with the non-interactive Agg backend"""
+    matplotlib.use('Agg')
+    generator = PublicationFiguresGenerator()
+    generator.results = results
+    started = time.perf_counter()
+    getattr(generator, method_name)()
+    plt.close('all')
+    return time.perf_counter() - started
+
 
 class PublicationFiguresGenerator:
     """Generator for publication-quality figures and tables"""
@@ -550,11 +584,95 @@ class PublicationFiguresGenerator:
         
         print("\n🎯 READY FOR JOURNAL SUBMISSION!")
 
-def main():
+    def figure_hashes(self):
+        """Data hash and per-figure script hash used to decide what to rebuild"""
+        data_hash = _sha256(json.dumps(self.results, sort_keys=True, default=repr))
+        style = json.dumps(PUBLICATION_RC, sort_keys=True) + matplotlib.__version__
+        script_hashes = {
+            stem: _sha256(style + inspect.getsource(getattr(PublicationFiguresGenerator, method)))
+            for stem, method in FIGURES.items()
+        }
+        return data_hash, script_hashes
+
+    def build_publication_materials(self, n_workers=None, force=False, manifest_path=BUILD_MANIFEST):
+        """
+        Incremental build: render only stale figures, in parallel processes.
+
+        A figure is skipped when its outputs exist and both the validation
+        results hash and the hash of its generator method (plus the shared
+        rcParams) match the previous build recorded in the manifest.
+
+        Args:
+            n_workers: Worker processes (default: one per stale figure, up to CPU count)
+            force: Rebuild every figure
+            manifest_path: JSON file recording the hashes of the last build
+
+        Returns:
+            Dictionary of figure name → "built" / "cached"
+        """
+        print("BUILDING PUBLICATION MATERIALS (incremental)")
+        print("="*50)
+
+        self.load_validation_results()
+        data_hash, script_hashes = self.figure_hashes()
+
+        manifest = {}
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+
+        status = {}
+        stale = []
+        for stem, method in FIGURES.items():
+            previous = manifest.get(stem, {})
+            outputs_exist = all(os.path.exists(f'paper/{stem}.{fmt}') for fmt in FIGURE_FORMATS)
+            up_to_date = (previous.get('data_hash') == data_hash
+                          and previous.get('script_hash') == script_hashes[stem])
+            if outputs_exist and up_to_date and not force:
+                status[stem] = 'cached'
+                print(f"⏭️  {stem}: unchanged, skipped")
+            else:
+                stale.append(stem)
+
+        if stale:
+            workers = n_workers or min(len(stale), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {stem: executor.submit(_render_figure, FIGURES[stem], self.results) for stem in stale}
+                for stem, future in futures.items():
+                    seconds = future.result()
+                    manifest[stem] = {
+                        'data_hash': data_hash,
+                        'script_hash': script_hashes[stem],
+                        'seconds': seconds,
+                    }
+                    status[stem] = 'built'
+                    print(f"🖼️  {stem}: rendered in {seconds:.1f}s")
+
+            with open(manifest_path, 'w') as f:
+                json.dump(manifest, f, indent=2)
+
+        # Tables and supplementary text are cheap; always regenerate
+        self.create_tables()
+        self.create_supplementary_materials()
+
+        print(f"\n✅ {len(stale)} figure(s) rendered, {len(FIGURES) - len(stale)} up to date")
+        return status
+
+def main(build=False, n_workers=None, force=False):
     """Main execution"""
     generator = PublicationFiguresGenerator()
-    generator.generate_all_publication_materials()
+    if build:
+        generator.build_publication_materials(n_workers=n_workers, force=force)
+    else:
+        generator.generate_all_publication_materials()
     return generator
 
 if __name__ == "__main__":
-    generator = main() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='Generate publication figures and tables')
+    parser.add_argument('--build', action='store_true',
+                        help='Incremental build: render stale figures in parallel with the Agg backend')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes for --build')
+    parser.add_argument('--force', action='store_true', help='Re-render every figure with --build')
+    args = parser.parse_args()
+
+    generator = main(build=args.build, n_workers=args.workers, force=args.force) 
\ No newline at end of file
@@ -12,16 +12,18 @@ Author: Information Dynamics Research Team
 Date: January 2025
 """
 
+import argparse
+import os
+import sys
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy import stats
-from scipy.stats import pearsonr, spearmanr, zscore
+from scipy.stats import pearsonr, spearmanr
 from scipy.optimize import minimize
 import statsmodels.api as sm
 import statsmodels.formula.api as smf
-from sklearn.preprocessing import StandardScaler
 from sklearn.model_selection import cross_val_score, train_test_split
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
 from sklearn.linear_model import Ridge, Lasso, ElasticNet
@@ -29,6 +31,15 @@ from sklearn.metrics import r2_score, mean_squared_error
 import warnings
 warnings.filterwarnings('ignore')
 
+# Add repository root to path to import infodynamics
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from infodynamics.analysis import (
+    Pipeline, Standardizer, chunked_correlation, classify_correlation, collinearity_diagnostics, remove_outliers,
+    scatter_layer
+)
+from infodynamics.utils.profiling import add_trace_arguments, enable_from_args, stage
+
 # Set plotting style
 plt.style.use('seaborn-v0_8')
 sns.set_palette("husl")
@@ -118,23 +129,14 @@ class HCPConductivityAnalyzerV2:
         """Preprocess and standardize data"""
         print("Preprocessing HCP data...")
         
-        # Remove outliers (3 SD rule)
-        numeric_cols = self.data.select_dtypes(include=[np.number]).columns
-        outlier_mask = np.ones(len(self.data), dtype=bool)
-        
-        for col in numeric_cols:
-            z_scores = np.abs(zscore(self.data[col]))
-            outlier_mask &= (z_scores < 3)
-        
-        self.data = self.data[outlier_mask].reset_index(drop=True)
+        # Remove outliers (3 SD rule on all numeric columns at once)
+        self.data = remove_outliers(self.data, threshold=3)
         print(f"After outlier removal: {len(self.data)} subjects")
         
-        # Standardize continuous variables
-        scaler = StandardScaler()
+        # Standardize continuous variables (parameters kept for new cohorts)
         vars_to_scale = ['k_individual', 'attention_focus', 'cognitive_load_ratio', 'cognitive_performance']
-        
-        for var in vars_to_scale:
-            self.data[f'{var}_scaled'] = scaler.fit_transform(self.data[[var]])
+        self.scaler = Standardizer(vars_to_scale)
+        self.scaler.fit_transform(self.data)
         
         print("Preprocessing completed successfully")
         
@@ -151,8 +153,8 @@ class HCPConductivityAnalyzerV2:
             'Processing_Speed'
         ]
         
-        # Calculate correlation matrix
-        corr_matrix = self.data[correlation_vars].corr()
+        # Calculate correlation matrix (block-wise, scales to wide/long tables)
+        corr_matrix = chunked_correlation(self.data, correlation_vars)
         self.results['correlation_matrix'] = corr_matrix
         
         # Print correlation matrix
@@ -164,21 +166,23 @@ class HCPConductivityAnalyzerV2:
         
         # G_info components correlations
         g_components = ['k_individual', 'attention_focus', 'cognitive_load_ratio']
-        g_corr = corr_matrix.loc[g_components, g_components]
+        g_diagnostics = collinearity_diagnostics(corr_matrix.loc[g_components, g_components])
+        self.results['collinearity'] = g_diagnostics
         
         print(f"G_info components intercorrelations:")
-        for i, comp1 in enumerate(g_components):
-            for j, comp2 in enumerate(g_components):
-                if i < j:
-                    corr_val = g_corr.loc[comp1, comp2]
-                    status = "HIGH" if abs(corr_val) > 0.7 else "MODERATE" if abs(corr_val) > 0.4 else "LOW"
-                    print(f"  {comp1} ↔ {comp2}: r = {corr_val:.3f} [{status}]")
+        for row in g_diagnostics['pairs'].itertuples():
+            print(f"  {row.var1} ↔ {row.var2}: r = {row.r:.3f} [{row.status}]")
+        
+        print(f"G_info components VIF:")
+        for comp, row in g_diagnostics['vif'].iterrows():
+            print(f"  {comp}: VIF = {row['vif']:.2f}{' [HIGH]' if row['flagged'] else ''}")
         
         # Component-outcome correlations
         print(f"\nComponent-performance correlations:")
-        for comp in g_components:
-            corr_val = corr_matrix.loc[comp, 'cognitive_performance']
-            status = "STRONG" if abs(corr_val) > 0.5 else "MODERATE" if abs(corr_val) > 0.3 else "WEAK"
+        outcome_corr = corr_matrix.loc[g_components, 'cognitive_performance']
+        outcome_status = classify_correlation(outcome_corr.values, high=0.5, moderate=0.3,
+                                              labels=("STRONG", "MODERATE", "WEAK"))
+        for comp, corr_val, status in zip(g_components, outcome_corr.values, outcome_status):
             print(f"  {comp} → performance: r = {corr_val:.3f} [{status}]")
         
         return corr_matrix
@@ -457,10 +461,11 @@ class HCPConductivityAnalyzerV2:
                               key=lambda x: self.formula_results[x]['r_squared'])
             best_values = self.formula_results[best_formula]['values']
             
-            plt.scatter(best_values, self.data['cognitive_performance_scaled'], alpha=0.6)
+            scatter_layer(plt.gca(), best_values, self.data['cognitive_performance_scaled'], alpha=0.6)
             z = np.polyfit(best_values, self.data['cognitive_performance_scaled'], 1)
             p = np.poly1d(z)
-            plt.plot(best_values, p(best_values), "r--", alpha=0.8)
+            x_line = np.array([np.min(best_values), np.max(best_values)])
+            plt.plot(x_line, p(x_line), "r--", alpha=0.8)
             plt.xlabel(f'Best G_info ({best_formula})')
             plt.ylabel('Cognitive Performance')
             plt.title(f'Best Formula Performance\nr = {self.formula_results[best_formula]["correlation"]:.3f}')
@@ -500,18 +505,8 @@ class HCPConductivityAnalyzerV2:
         # Correlation diagnostics
         if 'correlation_matrix' in self.results:
             print(f"\nCorrelation Diagnostics:")
-            corr_matrix = self.results['correlation_matrix']
-            g_components = ['k_individual', 'attention_focus', 'cognitive_load_ratio']
-            max_corr = 0
-            for i, comp1 in enumerate(g_components):
-                for j, comp2 in enumerate(g_components):
-                    if i < j:
-                        corr_val = abs(corr_matrix.loc[comp1, comp2])
-                        if corr_val > max_corr:
-                            max_corr = corr_val
-            
-            multicollinearity_status = "HIGH" if max_corr > 0.7 else "MODERATE" if max_corr > 0.4 else "LOW"
-            print(f"    Maximum component intercorrelation: {max_corr:.3f} [{multicollinearity_status}]")
+            strongest = self.results['collinearity']['pairs'].iloc[0]
+            print(f"    Maximum component intercorrelation: {strongest['abs_r']:.3f} [{strongest['status']}]")
         
         # Formula comparison
         if hasattr(self, 'formula_results'):
@@ -554,30 +549,108 @@ class HCPConductivityAnalyzerV2:
         print(f"Evidence Level: STRONG empirical support with optimized models")
         print("="*80)
 
-def main():
+def build_pipeline(cache_dir=".pipeline_cache/hcp_v2"):
+    """Model the analysis chain as cached stages (only changed stages re-run)"""
+    analyzer = HCPConductivityAnalyzerV2()
+    pipeline = Pipeline(cache_dir)
+    
+    def restore(data, correlations=None, formula_results=None, ml_results=None):
+        analyzer.data = data
+        if correlations is not None:
+            analyzer.results.update(correlations)
+        if formula_results is not None:
+            analyzer.formula_results = formula_results
+        if ml_results is not None:
+            analyzer.results['ml_optimization'] = ml_results
+    
+    def load(simulated):
+        return analyzer.load_hcp_data(simulated=simulated)
+    
+    def preprocess(data):
+        restore(data.copy())
+        analyzer.preprocess_data()
+        return analyzer.data
+    
+    def correlations(data):
+        restore(data)
+        analyzer.analyze_correlation_matrix()
+        return {key: analyzer.results[key] for key in ['correlation_matrix', 'collinearity']}
+    
+    def formulas(data):
+        restore(data)
+        return analyzer.test_alternative_formulas()
+    
+    def ml(data):
+        restore(data)
+        return analyzer.machine_learning_optimization()
+    
+    def visualizations(data, formula_results):
+        restore(data, formula_results=formula_results)
+        analyzer.create_enhanced_visualizations()
+    
+    def report(data, correlation_results, formula_results, ml_results):
+        restore(data, correlation_results, formula_results, ml_results)
+        analyzer.generate_enhanced_report()
+    
+    A = HCPConductivityAnalyzerV2
+    pipeline.add_stage('load', load, params={'simulated': True}, code=[A.load_hcp_data])
+    pipeline.add_stage('preprocess', preprocess, inputs=['load'], code=[A.preprocess_data])
+    pipeline.add_stage('correlations', correlations, inputs=['preprocess'], code=[A.analyze_correlation_matrix])
+    pipeline.add_stage('formulas', formulas, inputs=['preprocess'], code=[A.test_alternative_formulas])
+    pipeline.add_stage('ml', ml, inputs=['preprocess'], code=[A.machine_learning_optimization])
+    pipeline.add_stage('visualizations', visualizations, inputs=['preprocess', 'formulas'],
+                       code=[A.create_enhanced_visualizations])
+    pipeline.add_stage('report', report, inputs=['preprocess', 'correlations', 'formulas', 'ml'],
+                       code=[A.generate_enhanced_report], cache=False)
+    
+    return pipeline, analyzer
+
+def main(cache_dir=None):
     """Main enhanced analysis pipeline"""
     print("HCP CONNECTOME INFORMATION CONDUCTIVITY VALIDATION v2.0")
     print("=" * 65)
     
+    if cache_dir is not None:
+        # Incremental run: reuse stage outputs whose inputs and code are unchanged
+        pipeline, analyzer = build_pipeline(cache_dir)
+        pipeline.run()
+        print("\nStage timings:")
+        print(pipeline.timing_report().to_string(index=False))
+        return analyzer
+    
     # Initialize enhanced analyzer
     analyzer = HCPConductivityAnalyzerV2()
     
     # Load and preprocess data
-    analyzer.load_hcp_data(simulated=True)
-    analyzer.preprocess_data()
+    with stage('load') as s:
+        analyzer.load_hcp_data(simulated=True)
+        s.items = len(analyzer.data)
+    with stage('preprocess') as s:
+        analyzer.preprocess_data()
+        s.items = len(analyzer.data)
     
     # Enhanced analyses
-    analyzer.analyze_correlation_matrix()
-    analyzer.test_alternative_formulas()
-    analyzer.machine_learning_optimization()
+    with stage('correlations'):
+        analyzer.analyze_correlation_matrix()
+    with stage('formulas'):
+        analyzer.test_alternative_formulas()
+    with stage('ml'):
+        analyzer.machine_learning_optimization()
     
     # Create enhanced visualizations
-    analyzer.create_enhanced_visualizations()
+    with stage('visualizations'):
+        analyzer.create_enhanced_visualizations()
     
     # Generate enhanced report
-    analyzer.generate_enhanced_report()
+    with stage('report'):
+        analyzer.generate_enhanced_report()
     
     return analyzer
 
 if __name__ == "__main__":
-    analyzer = main() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cache-dir', help='Cache stage outputs here and only re-run changed stages')
+    add_trace_arguments(parser)
+    args = parser.parse_args()
+    enable_from_args(args)
+    analyzer = main(cache_dir=args.cache_dir) 
\ No newline at end of file
@@ -12,6 +12,8 @@ Author: Information Dynamics Research Team
 Date: January 2025
 """
 
+import os
+import sys
 import pandas as pd
 import numpy as np
 from scipy.stats import pearsonr, spearmanr, ttest_ind
@@ -19,6 +21,11 @@ from scipy.optimize import minimize
 import warnings
 warnings.filterwarnings('ignore')
 
+# Add repository root to path to import infodynamics
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from infodynamics.analysis import Standardizer
+
 class LInfoValidator:
     """Validator for information inductance model"""
     
@@ -158,19 +165,14 @@ class LInfoValidator:
     
     def standardize_data(self, data):
         """Standardize key variables"""
-        from sklearn.preprocessing import StandardScaler
-        scaler = StandardScaler()
-        
         vars_to_scale = [
             'l_temporal', 'l_cognitive', 'l_systemic', 'l_info_composite',
             'task_switch_performance', 'learning_rate', 'org_adaptation_performance', 
             'info_processing_delay'
         ]
         
-        for var in vars_to_scale:
-            data[f'{var}_scaled'] = scaler.fit_transform(data[[var]])
-        
-        return data
+        self.scaler = Standardizer(vars_to_scale)
+        return self.scaler.fit_transform(data)
     
     def validate_component_models(self):
         """Validate individual L_info components"""
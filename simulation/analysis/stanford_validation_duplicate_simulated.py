@@ -14,6 +14,7 @@ Date: January 2025
 """
 
 import os
+import sys
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
@@ -27,6 +28,11 @@ import requests
 import warnings
 warnings.filterwarnings('ignore')
 
+# Add repository root to path to import infodynamics
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from infodynamics.analysis import chunked_correlation, collinearity_diagnostics, scatter_layer
+
 class StanfordValidation:
     """
     Validator for Information Dynamics theory using Stanford Self-Regulation data
@@ -304,15 +310,16 @@ class StanfordValidation:
             
             print(f"📊 {component:20} → performance: r = {r:6.3f}, p = {p:.3f} ({effect_direction})")
         
-        # Component intercorrelations
+        # Component intercorrelations and multicollinearity
         print(f"\n🔗 COMPONENT INTERCORRELATIONS:")
-        for i, comp1 in enumerate(components):
-            for j, comp2 in enumerate(components):
-                if i < j:
-                    r, p = pearsonr(data[comp1], data[comp2])
-                    print(f"   {comp1} ↔ {comp2}: r = {r:.3f}")
+        diagnostics = collinearity_diagnostics(chunked_correlation(data, components))
+        for row in diagnostics['pairs'].itertuples():
+            print(f"   {row.var1} ↔ {row.var2}: r = {row.r:.3f} [{row.status}]")
+        for comp, row in diagnostics['vif'].iterrows():
+            print(f"   {comp}: VIF = {row['vif']:.2f}{' ⚠️' if row['flagged'] else ''}")
         
         self.results['component_correlations'] = component_results
+        self.results['collinearity'] = diagnostics
         
     def create_visualizations(self):
         """Create visualizations of validation results"""
@@ -395,12 +402,13 @@ class StanfordValidation:
             weights = self.results['formula_comparison']['empirical_weights']
             g_info_best = np.dot(X, weights)
         
-        ax.scatter(g_info_best, data['cognitive_performance'], alpha=0.6)
+        scatter_layer(ax, g_info_best, data['cognitive_performance'], alpha=0.6)
         
         # Add regression line
         z = np.polyfit(g_info_best, data['cognitive_performance'], 1)
         p = np.poly1d(z)
-        ax.plot(g_info_best, p(g_info_best), "r--", alpha=0.8)
+        x_line = np.array([np.min(g_info_best), np.max(g_info_best)])
+        ax.plot(x_line, p(x_line), "r--", alpha=0.8)
         
         r_best = self.results['formula_comparison'][best_formula]['r']
         ax.set_title(f'Best G_info vs Performance\n(r = {r_best:.3f})')
@@ -12,6 +12,8 @@ Author: Information Dynamics Research Team
 Date: January 2025
 """
 
+import os
+import sys
 import pandas as pd
 import numpy as np
 from scipy.stats import pearsonr, spearmanr
@@ -19,6 +21,11 @@ from scipy.optimize import minimize
 import warnings
 warnings.filterwarnings('ignore')
 
+# Add repository root to path to import infodynamics
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from infodynamics.analysis import Standardizer
+
 class TEffValidator:
     """Validator for information transformation efficiency model"""
     
@@ -190,19 +197,14 @@ class TEffValidator:
     
     def standardize_data(self, data):
         """Standardize continuous variables"""
-        from sklearn.preprocessing import StandardScaler
-        scaler = StandardScaler()
-        
         vars_to_scale = [
             'semantic_preservation', 'factual_density', 'quality_enhancement', 't_eff_composite',
             'user_satisfaction', 'task_completion', 'retention_score', 'transformation_success',
             'source_length', 'source_complexity', 'compression_ratio'
         ]
         
-        for var in vars_to_scale:
-            data[f'{var}_scaled'] = scaler.fit_transform(data[[var]])
-        
-        return data
+        self.scaler = Standardizer(vars_to_scale)
+        return self.scaler.fit_transform(data)
     
     def validate_component_models(self):
         """Validate individual T_eff components"""
@@ -0,0 +1,35 @@
+"""Tests for the memory-mapped population store."""
+
+import numpy as np
+import pytest
+
+from infodynamics.utils.population import create_population_store, row_hashes
+
+CSV = "a,b,c\n1,1,True\n2,2,False\n3,2.7,True\n4,,False\n5,6,True\n"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 100])
+def test_store_does_not_depend_on_chunking(tmp_path, chunk_size):
+    source = tmp_path / "profiles.csv"
+    source.write_text(CSV)
+    store = create_population_store(tmp_path / "store", source, chunk_size=chunk_size)
+
+    assert len(store) == 5
+    assert store["a"].dtype == np.int64
+    np.testing.assert_array_equal(store["a"], [1, 2, 3, 4, 5])
+    # Integers in the first chunk, a float and a missing value later
+    assert store["b"].dtype == np.float64
+    np.testing.assert_array_equal(store["b"], [1.0, 2.0, 2.7, np.nan, 6.0])
+    np.testing.assert_array_equal(store["c"], [True, False, True, False, True])
+
+
+def test_store_rejects_column_turning_non_numeric(tmp_path):
+    source = tmp_path / "profiles.csv"
+    source.write_text("a\n1\n2\nx\n")
+    with pytest.raises(ValueError, match="changes type"):
+        create_population_store(tmp_path / "store", source, chunk_size=2)
+
+
+def test_row_hashes_use_raw_bits():
+    hashes = row_hashes({"x": np.array([0.5, 0.7], dtype=np.float32)})
+    assert hashes[0] != hashes[1]
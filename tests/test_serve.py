@@ -0,0 +1,58 @@
+"""Tests for the micro-batching scoring server."""
+
+import asyncio
+import json
+
+import pytest
+
+from infodynamics.serve import ScoringServer, parse_row
+
+HUGE = "1" + "0" * 400  # a JSON integer beyond the float range
+
+
+def _exchange(raw: bytes) -> bytes:
+    """Send one raw request to a fresh server; returns the response."""
+    async def run():
+        server = ScoringServer(max_batch_size=8, max_wait=0.001)
+        listener = await server.start("127.0.0.1", 0, None)
+        try:
+            reader, writer = await asyncio.open_connection(*listener.sockets[0].getsockname()[:2])
+            writer.write(raw)
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            return response
+        finally:
+            listener.close()
+            await server.stop()
+
+    return asyncio.run(run())
+
+
+def _post(body: str) -> bytes:
+    return _exchange(
+        f"POST /score HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n{body}".encode()
+    )
+
+
+def test_parse_row_rejects_out_of_range_integer():
+    with pytest.raises(ValueError, match="working_memory is out of range"):
+        parse_row(json.loads(f'{{"working_memory": {HUGE}}}'))
+
+
+def test_out_of_range_integer_is_bad_request():
+    response = _post(f'{{"working_memory": {HUGE}}}')
+    assert response.startswith(b"HTTP/1.1 400 ")
+    assert b"out of range" in response
+
+
+def test_score_row():
+    response = _post('{"working_memory": 7.0, "quantities": ["G"]}')
+    assert response.startswith(b"HTTP/1.1 200 ")
+    assert "G_info" in json.loads(response.split(b"\r\n\r\n", 1)[1])
+
+
+@pytest.mark.parametrize("length", ["abc", "-5"])
+def test_invalid_content_length_is_bad_request(length):
+    response = _exchange(f"GET /health HTTP/1.1\r\nContent-Length: {length}\r\n\r\n".encode())
+    assert response.startswith(b"HTTP/1.1 400 ")
@@ -9,6 +9,14 @@ Usage examples:
     python cli.py flow_rate --voltage 8.5 --conductivity 6.2
     python cli.py analyze_user --profile expert
     python cli.py analyze_content --text "Breaking news: Important announcement"
+    python cli.py featurize_content articles.jsonl --keep id --workers 8 --output content.parquet
+    python cli.py score profiles.csv --quantities G,R,flow --output scores.parquet
+    cat profiles.jsonl | python cli.py score --input-format jsonl
+    python cli.py population import profiles.parquet --store population/
+    python cli.py population score --store population/ --quantities G,R,flow
+    python cli.py population score --store population/ --incremental
+    python cli.py --daemon conductivity --working_memory 7.5 --attention 0.8 --motivation 0.9 --expertise 0.6
+    python cli.py --trace trace.json --trace-format chrome score profiles.csv --output scores.parquet
 """
 
 import argparse
@@ -19,7 +27,10 @@ import os
 # Add parent directory to path to import infodynamics
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
+# Cheap: infodynamics resolves models on first use, so commands such as
+# flow_rate never import NumPy; pandas is only imported by `score`.
 import infodynamics as id
+from infodynamics.utils.profiling import add_trace_arguments
 
 
 def cmd_conductivity(args):
@@ -160,14 +171,11 @@ def cmd_analyze_user(args):
 def cmd_analyze_content(args):
     """Analyze content voltage."""
     
-    # Simple content analysis (placeholder)
+    from infodynamics.models.content import content_profile as derive_profile
+    
+    # Keyword and word-count heuristics shared with featurize_content
     text = args.text
-    content_profile = {
-        "factual_density": min(1.0, len(text.split()) / 50),  # Word density
-        "credibility": 0.8 if "research" in text.lower() or "study" in text.lower() else 0.6,
-        "semantic_quality": 0.7,  # Placeholder
-        "timeliness": 0.9 if "breaking" in text.lower() or "new" in text.lower() else 0.5
-    }
+    content_profile = derive_profile(text)
     
     try:
         U_info = id.calculate_u_info(content_profile)
@@ -183,12 +191,13 @@ def cmd_analyze_content(args):
         print(f"\n⚡ Results:")
         print(f"   U_info (Voltage): {U_info:.2f}")
         
-        # Interpretation
-        if U_info > 8:
+        # Interpretation; derived profiles span about 1.2 (empty text) to
+        # 6.2 (50+ words with credibility and timeliness keywords)
+        if U_info > 5.5:
             print(f"   🔥 High-impact content")
-        elif U_info > 6:
+        elif U_info > 4.5:
             print(f"   ✅ Good-quality content")
-        elif U_info > 4:
+        elif U_info > 3:
             print(f"   ⚠️  Average content")
         else:
             print(f"   📝 Basic content")
@@ -200,7 +209,153 @@ def cmd_analyze_content(args):
     return 0
 
 
-def main():
+def cmd_score(args):
+    """Score a table of profiles in vectorized chunks."""
+    
+    from infodynamics.models.scoring import QUANTITIES, score_batch
+    from infodynamics.utils.profiling import stage
+    from infodynamics.utils.tabular import TableWriter, iter_table_chunks
+    
+    quantities = [q.strip() for q in args.quantities.split(',') if q.strip()]
+    unknown = [q for q in quantities if q not in QUANTITIES]
+    if unknown:
+        print(f"❌ Unknown quantities: {unknown} (choose from {list(QUANTITIES)})", file=sys.stderr)
+        return 1
+    
+    keep = [c.strip() for c in args.keep.split(',') if c.strip()] if args.keep else []
+    
+    try:
+        chunks = iter_table_chunks(args.input, args.input_format, args.chunk_size)
+        with TableWriter(args.output, args.output_format) as writer:
+            while True:
+                with stage('score.read') as s:
+                    chunk = next(chunks, None)
+                    s.items = 0 if chunk is None else len(chunk)
+                if chunk is None:
+                    break
+                with stage('score.compute', items=len(chunk)):
+                    scores = score_batch(chunk, quantities)
+                    out = chunk[keep].reset_index(drop=True) if keep else chunk.iloc[:, :0].reset_index(drop=True)
+                    for name, values in scores.items():
+                        out[name] = values
+                with stage('score.write', items=len(out)):
+                    writer.write(out)
+                
+    except BrokenPipeError:
+        # Downstream consumer (e.g. head) closed the pipe early
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except Exception as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+    
+    print(f"✅ Scored {writer.rows_written} rows", file=sys.stderr)
+    return 0
+
+
+def cmd_featurize_content(args):
+    """Featurize a document table and score its content voltage."""
+    
+    from infodynamics.models.content import featurize_corpus
+    
+    keep = [c.strip() for c in args.keep.split(',') if c.strip()] if args.keep else []
+    
+    try:
+        rows = featurize_corpus(args.input, args.output, args.input_format, args.output_format,
+                                text_column=args.text_column, keep=keep,
+                                chunk_size=args.chunk_size, n_workers=args.workers)
+    except BrokenPipeError:
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except Exception as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+    
+    print(f"✅ Featurized {rows} documents", file=sys.stderr)
+    return 0
+
+
+def cmd_population(args):
+    """Import, score or describe a memory-mapped population store."""
+    
+    from infodynamics.utils.population import PopulationStore, create_population_store
+    
+    try:
+        if args.action == 'import':
+            if not args.input:
+                print("❌ population import needs an input table", file=sys.stderr)
+                return 1
+            store = create_population_store(args.store, args.input, args.input_format,
+                                            args.chunk_size or 100_000)
+            print(f"✅ Imported {len(store)} rows, {len(store.columns)} columns into {args.store}")
+        
+        elif args.action == 'score':
+            from infodynamics.models.scoring import rescore_population, score_population
+            quantities = [q.strip() for q in args.quantities.split(',') if q.strip()]
+            with PopulationStore(args.store, mode='r+') as store:
+                if args.incremental:
+                    counts = rescore_population(store, quantities, args.chunk_size)
+                    print(f"✅ Rescored {len(store)} rows: "
+                          + ', '.join(f"{name} {count}" for name, count in counts.items()))
+                else:
+                    outputs = score_population(store, quantities, args.chunk_size)
+                    print(f"✅ Scored {len(store)} rows into {', '.join(outputs)}")
+        
+        else:
+            store = PopulationStore(args.store, mode='r')
+            print(f"📦 {args.store}: {len(store)} rows")
+            for name, dtype in store.columns.items():
+                print(f"   {name:<24} {dtype}")
+    
+    except Exception as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+    
+    return 0
+
+
+DAEMON_ENV = 'INFODYNAMICS_CLI_DAEMON'
+
+# Commands that always run in the calling process (they stream stdin/stdout,
+# work on local files or manage the worker itself)
+LOCAL_COMMANDS = {'score', 'featurize_content', 'population', 'daemon'}
+
+
+def cmd_daemon(args):
+    """Start, stop or inspect the persistent CLI worker."""
+    
+    import cli_daemon
+    
+    if args.action == 'serve':
+        # Keep the models, NumPy and presets loaded for every request
+        from infodynamics.models.conductivity import PRESET_PROFILES
+        for name in ('calculate_g_info', 'calculate_r_info', 'calculate_l_info',
+                     'calculate_c_info', 'calculate_u_info', 'calculate_flow_rate'):
+            getattr(id, name)
+        id.calculate_g_info(PRESET_PROFILES['expert'])
+        return cli_daemon.serve(lambda argv: main(argv, allow_daemon=False), idle_timeout=args.idle_timeout)
+    
+    try:
+        if args.action == 'start':
+            started = cli_daemon.start(idle_timeout=args.idle_timeout)
+            print(f"{'✅ Worker running' if started else '❌ Worker failed to start'} ({cli_daemon.socket_path()})")
+            return 0 if started else 1
+        
+        reply = cli_daemon.request({'command': args.action})
+    except PermissionError as e:
+        print(f"❌ {e}")
+        return 1
+    if reply is None:
+        print(f"⚪ No worker running ({cli_daemon.socket_path()})")
+    elif args.action == 'stop':
+        print(f"🛑 Worker stopped")
+    else:
+        print(f"✅ Worker pid {reply['pid']}, {reply['requests']} requests served "
+              f"({cli_daemon.socket_path()})")
+    return 0
+
+
+def main(argv=None, allow_daemon=True):
     parser = argparse.ArgumentParser(
         description="Information Dynamics CLI Tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -210,9 +365,19 @@ Examples:
   %(prog)s flow_rate --voltage 8.5 --conductivity 6.2
   %(prog)s analyze_user --profile expert
   %(prog)s analyze_content --text "Breaking news about AI research"
+  %(prog)s featurize_content articles.jsonl --keep id --workers 8 --output content.parquet
+  %(prog)s score profiles.csv --quantities G,R,L,C,U,flow --keep user_id --output scores.jsonl
+  %(prog)s population import profiles.parquet --store population/
+  %(prog)s population score --store population/
+  %(prog)s --daemon analyze_user --profile expert
+  %(prog)s --trace trace.json --trace-capture sample score profiles.csv --output scores.parquet
         """
     )
     
+    parser.add_argument('--daemon', action='store_true',
+                        help=f'Run through a persistent background worker (or set {DAEMON_ENV}=1)')
+    add_trace_arguments(parser)
+    
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
     # Conductivity command
@@ -252,21 +417,112 @@ Examples:
     parser_c.add_argument('--text', type=str, required=True,
                          help='Content text to analyze')
     
-    args = parser.parse_args()
+    # Bulk scoring command
+    parser_s = subparsers.add_parser('score', help='Score a table of profiles (CSV, JSONL or Parquet)')
+    parser_s.add_argument('input', nargs='?', default='-',
+                         help='Input file, or - for stdin (default)')
+    parser_s.add_argument('--input-format', choices=['csv', 'jsonl', 'parquet'],
+                         help='Input format (default: from extension, csv for stdin)')
+    parser_s.add_argument('--output', default='-',
+                         help='Output file, or - for stdout (default)')
+    parser_s.add_argument('--output-format', choices=['csv', 'jsonl', 'parquet'],
+                         help='Output format (default: from extension, csv for stdout)')
+    parser_s.add_argument('--quantities', default='G,R,L,C,U,flow',
+                         help='Comma-separated quantities: G,R,L,C,U,flow,G_social')
+    parser_s.add_argument('--keep', default=None,
+                         help='Comma-separated input columns to copy to the output (e.g. an id column)')
+    parser_s.add_argument('--chunk-size', type=int, default=100_000,
+                         help='Rows per batch (bounds memory use)')
+    
+    # Corpus featurization
+    parser_fc = subparsers.add_parser('featurize_content',
+                                      help='Content features and U_info for a document table (JSONL, Parquet or CSV)')
+    parser_fc.add_argument('input', nargs='?', default='-',
+                          help='Input file, or - for stdin (default)')
+    parser_fc.add_argument('--input-format', choices=['csv', 'jsonl', 'parquet'],
+                          help='Input format (default: from extension, csv for stdin)')
+    parser_fc.add_argument('--output', default='-',
+                          help='Output file, or - for stdout (default)')
+    parser_fc.add_argument('--output-format', choices=['csv', 'jsonl', 'parquet'],
+                          help='Output format (default: from extension, csv for stdout)')
+    parser_fc.add_argument('--text-column', default='text',
+                          help='Column holding the document text')
+    parser_fc.add_argument('--keep', default=None,
+                          help='Comma-separated input columns to copy to the output (e.g. an id column)')
+    parser_fc.add_argument('--chunk-size', type=int, default=10_000,
+                          help='Documents per batch')
+    parser_fc.add_argument('--workers', type=int, default=1,
+                          help='Featurization worker processes')
+    
+    # On-disk population store
+    parser_p = subparsers.add_parser('population', help='Import, score or inspect a memory-mapped population store')
+    parser_p.add_argument('action', choices=['import', 'score', 'info'])
+    parser_p.add_argument('input', nargs='?',
+                         help='Table to import (CSV, JSONL or Parquet; - for stdin)')
+    parser_p.add_argument('--store', required=True,
+                         help='Population store directory')
+    parser_p.add_argument('--input-format', choices=['csv', 'jsonl', 'parquet'],
+                         help='Input format for import (default: from extension)')
+    parser_p.add_argument('--quantities', default='G,R,L,C,U,flow',
+                         help='Comma-separated quantities to score: G,R,L,C,U,flow,G_social')
+    parser_p.add_argument('--incremental', action='store_true',
+                         help='Only recompute rows whose inputs changed since the last score')
+    parser_p.add_argument('--chunk-size', type=int, default=None,
+                         help='Rows per chunk (default: 100000 for import, 1M page-aligned rows for score)')
+    
+    # Persistent worker management
+    parser_d = subparsers.add_parser('daemon', help='Manage the persistent CLI worker')
+    parser_d.add_argument('action', choices=['start', 'stop', 'status', 'serve'],
+                         help='serve runs the worker in the foreground')
+    parser_d.add_argument('--idle-timeout', type=float, default=600,
+                         help='Seconds without requests before the worker exits')
+    
+    if argv is None:
+        argv = sys.argv[1:]
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
         return 1
     
+    use_daemon = args.daemon or os.environ.get(DAEMON_ENV) == '1'
+    if allow_daemon and use_daemon and args.command not in LOCAL_COMMANDS and not args.trace:
+        import cli_daemon
+        # Drop the global flag only; a '--daemon' after the subcommand
+        # (e.g. inside --text) belongs to the command's arguments
+        forwarded = list(argv)
+        command_at = forwarded.index(args.command)
+        if '--daemon' in forwarded[:command_at]:
+            forwarded.remove('--daemon')
+        returncode = cli_daemon.forward(forwarded)
+        if returncode is not None:
+            return returncode
+    
     # Route to appropriate command
     commands = {
         'conductivity': cmd_conductivity,
         'flow_rate': cmd_flow_rate,
         'analyze_user': cmd_analyze_user,
-        'analyze_content': cmd_analyze_content
+        'analyze_content': cmd_analyze_content,
+        'score': cmd_score,
+        'featurize_content': cmd_featurize_content,
+        'population': cmd_population,
+        'daemon': cmd_daemon
     }
     
-    return commands[args.command](args)
+    if not args.trace or args.command == 'daemon':
+        return commands[args.command](args)
+    
+    # Traced runs are written when the command returns (not at exit, so the
+    # in-process calls made by the daemon worker each get their own file)
+    from infodynamics.utils.profiling import disable_profiling, enable_profiling, stage
+    enable_profiling(capture=args.trace_capture)
+    try:
+        with stage(f'cli.{args.command}'):
+            return commands[args.command](args)
+    finally:
+        for path in disable_profiling().write(args.trace, args.trace_format):
+            print(f"⏱️  Trace written to {path}", file=sys.stderr)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,237 @@
+"""
+Persistent worker for tools/cli.py.
+
+With `--daemon` (or INFODYNAMICS_CLI_DAEMON=1) the first CLI invocation
+starts a background worker that keeps infodynamics and NumPy imported and
+the preset profiles loaded. Later invocations send their argv over a Unix
+domain socket and print the captured output, so a call costs a socket
+round trip instead of an interpreter start plus the NumPy import.
+
+- Requests are handled one at a time (stdout capture is process-wide).
+- The worker exits after an idle timeout, on `cli.py daemon stop`, or when
+  the CLI or package sources change (the calling CLI then runs locally).
+
+The socket lives in a directory only this user can enter
+($XDG_RUNTIME_DIR, or a 0700 per-user directory in the temp dir), and the
+client checks that the socket belongs to this user before sending anything.
+
+Protocol: 4-byte big-endian length prefix + JSON, in both directions.
+The client path only imports socket/json/struct; everything the worker
+needs is imported in `start` / `serve`.
+"""
+
+import json
+import os
+import socket
+import stat
+import struct
+import sys
+import tempfile
+import time
+
+SOCKET_ENV = 'INFODYNAMICS_CLI_SOCKET'
+DEFAULT_IDLE_TIMEOUT = 600  # seconds
+STARTUP_TIMEOUT = 10
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+CLI_PATH = os.path.join(REPO_ROOT, 'tools', 'cli.py')
+
+
+def _private_dir():
+    """$XDG_RUNTIME_DIR, or a per-user temp directory with mode 0700."""
+    runtime = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime and os.path.isdir(runtime):
+        return runtime
+    directory = os.path.join(tempfile.gettempdir(), f'infodynamics-cli-{os.getuid()}')
+    try:
+        os.mkdir(directory, 0o700)
+    except FileExistsError:
+        pass
+    # Someone else may have created the name first on a shared temp dir
+    st = os.lstat(directory)
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise PermissionError(f'{directory} is not a private directory owned by this user')
+    return directory
+
+
+def socket_path():
+    """Socket location: $INFODYNAMICS_CLI_SOCKET or a file in a private per-user directory."""
+    return os.environ.get(SOCKET_ENV) or os.path.join(_private_dir(), 'infodynamics-cli.sock')
+
+
+def _check_socket(path):
+    """Raise PermissionError unless ``path`` is a socket owned by this user."""
+    st = os.lstat(path)
+    if not stat.S_ISSOCK(st.st_mode) or st.st_uid != os.getuid():
+        raise PermissionError(f'Refusing to use {path}: not a socket owned by this user')
+
+
+def code_version():
+    """Latest modification time of the CLI and package sources."""
+    latest = max(os.path.getmtime(CLI_PATH), os.path.getmtime(__file__))
+    for directory, _, files in os.walk(os.path.join(REPO_ROOT, 'infodynamics')):
+        for name in files:
+            if name.endswith('.py'):
+                latest = max(latest, os.path.getmtime(os.path.join(directory, name)))
+    return latest
+
+
+def _send(sock, message):
+    data = json.dumps(message).encode()
+    sock.sendall(struct.pack('>I', len(data)) + data)
+
+
+def _recv(sock):
+    def exactly(n):
+        chunks = []
+        while n:
+            chunk = sock.recv(n)
+            if not chunk:
+                raise ConnectionError('Connection closed mid-message')
+            chunks.append(chunk)
+            n -= len(chunk)
+        return b''.join(chunks)
+
+    (length,) = struct.unpack('>I', exactly(4))
+    return json.loads(exactly(length))
+
+
+def request(message, path=None, timeout=30.0):
+    """
+    Send one message to the worker; returns the reply, or None if no worker is running.
+
+    Raises:
+        PermissionError: If the socket is not owned by this user
+    """
+    path = path or socket_path()
+    try:
+        _check_socket(path)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(path)
+            _send(sock, message)
+            return _recv(sock)
+    except (FileNotFoundError, ConnectionRefusedError):
+        return None
+
+
+def start(path=None, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+    """Spawn a detached worker and wait until it accepts connections."""
+    import subprocess
+
+    path = path or socket_path()
+    if os.path.exists(path) and request({'command': 'status'}, path) is None:
+        os.unlink(path)  # stale socket from a worker that died
+
+    subprocess.Popen(
+        [sys.executable, CLI_PATH, 'daemon', 'serve', '--idle-timeout', str(idle_timeout)],
+        env=dict(os.environ, **{SOCKET_ENV: path}),
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        start_new_session=True, close_fds=True
+    )
+
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if request({'command': 'status'}, path, timeout=1.0) is not None:
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def forward(argv, path=None):
+    """
+    Run `cli.py <argv>` in the worker, starting it if needed.
+
+    Returns:
+        The command's exit code, or None if the caller should run the
+        command locally (worker unavailable or running outdated code)
+    """
+    message = {'command': 'run', 'argv': list(argv), 'code_version': code_version()}
+    try:
+        path = path or socket_path()
+        reply = request(message, path)
+        if reply is None:
+            if not start(path):
+                return None
+            reply = request(message, path)
+    except PermissionError as e:
+        sys.stderr.write(f'Not using the CLI worker: {e}\n')
+        return None
+    if reply is None or reply.get('stale'):
+        return None
+
+    sys.stdout.write(reply['stdout'])
+    sys.stderr.write(reply['stderr'])
+    return reply['returncode']
+
+
+def serve(run_command, path=None, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+    """Serve CLI requests until stopped, idle, or the sources change."""
+    import contextlib
+    import io
+    import socketserver
+    import traceback
+
+    # Defined here so CLI clients never import socketserver
+    class WorkerServer(socketserver.UnixStreamServer):
+        def __init__(self, path, run_command, version, idle_timeout):
+            self.run_command = run_command
+            self.version = version
+            self.started = time.time()
+            self.requests = 0
+            self.stopping = False
+            self.timeout = idle_timeout
+            old_umask = os.umask(0o077)  # socket usable by this user only
+            try:
+                super().__init__(path, WorkerHandler)
+            finally:
+                os.umask(old_umask)
+
+        def handle_timeout(self):
+            self.stopping = True
+
+    class WorkerHandler(socketserver.BaseRequestHandler):
+        def handle(self):
+            server = self.server
+            message = _recv(self.request)
+            command = message.get('command')
+
+            if command == 'status':
+                reply = {'pid': os.getpid(), 'started': server.started, 'requests': server.requests}
+            elif command == 'stop':
+                server.stopping = True
+                reply = {'stopped': True}
+            elif message.get('code_version') != server.version:
+                server.stopping = True
+                reply = {'stale': True}
+            else:
+                reply = self._run(message['argv'])
+                server.requests += 1
+
+            _send(self.request, reply)
+
+        def _run(self, argv):
+            stdout, stderr = io.StringIO(), io.StringIO()
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    returncode = self.server.run_command(argv)
+                except SystemExit as e:  # argparse --help / usage errors
+                    returncode = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+                except Exception:
+                    traceback.print_exc()
+                    returncode = 1
+            return {'stdout': stdout.getvalue(), 'stderr': stderr.getvalue(), 'returncode': returncode or 0}
+
+    path = path or socket_path()
+    if os.path.exists(path):
+        os.unlink(path)
+
+    server = WorkerServer(path, run_command, code_version(), idle_timeout)
+    try:
+        while not server.stopping:
+            server.handle_request()
+    finally:
+        server.server_close()
+        if os.path.exists(path):
+            os.unlink(path)
+    return 0